@@ -0,0 +1,67 @@
+"""
+Benchmark: memory needed to hold many books in the application.
+
+Compares generated book rows held as tuples (the layout of pyodbc Rows),
+as Book models (__slots__) and in a BookColumns container. Measured with
+tracemalloc; no database is needed.
+
+Run from the project root:
+
+    python -m bench.book_memory_benchmark --rows 1000000
+"""
+import argparse
+import datetime
+import random
+import time
+import tracemalloc
+
+from src.models.book import Book
+from src.models.book_columns import BookColumns
+
+WORDS = ["Python", "Data", "Advanced", "History", "Garden", "Modern", "Ocean", "Stars", "Winter", "Code"]
+BINDINGS = ["hardcover", "paperback", "ebook"]
+
+
+def generate_books(count, seed=1):
+    rnd = random.Random(seed)
+    start = datetime.date(1950, 1, 1)
+    for i in range(count):
+        yield (
+            i + 1,
+            f"{rnd.choice(WORDS)} {rnd.choice(WORDS)} {i}",
+            rnd.randrange(1, 500),
+            start + datetime.timedelta(days=rnd.randrange(27000)),
+            round(rnd.uniform(0, 5), 2) if rnd.random() > 0.1 else None,
+            rnd.choice(BINDINGS),
+        )
+
+
+def measure(build):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000000, help="number of generated books")
+    args = parser.parse_args()
+
+    layouts = {
+        "tuples (pyodbc rows)": lambda: list(generate_books(args.rows)),
+        "Book models": lambda: [Book.from_row(row) for row in generate_books(args.rows)],
+        "BookColumns": lambda: BookColumns.from_rows(generate_books(args.rows)),
+    }
+    print(f"{'layout':<22} {'MB':>10} {'bytes/row':>10} {'build s':>9}")
+    for name, build in layouts.items():
+        size, elapsed = measure(build)
+        print(f"{name:<22} {size / 1e6:>10.1f} {size / args.rows:>10.1f} {elapsed:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
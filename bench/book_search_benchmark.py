@@ -0,0 +1,94 @@
+"""
+Benchmark: BookRepository.search latency as the book table grows.
+
+Inserts generated books in steps (inside one transaction that is rolled
+back at the end, so the database is left unchanged) and after each step
+measures typical Books tab searches: first page by name, a deep keyset
+page, a name prefix filter, publisher + rating filters and a date range
+sorted by rating. With the indexes from db/migrations (0001-0002, applied
+with `python -m src migrate`) the latencies should stay roughly flat while
+the table grows.
+
+Requires a configured database (config.ini) with at least one publisher.
+Run from the project root:
+
+    python -m bench.book_search_benchmark --steps 10000 50000 100000 200000
+"""
+import argparse
+import datetime
+import random
+import statistics
+import time
+
+from src.db.bulk_loader import bulk_load
+from src.db.repositories.book_repository import BookRepository
+from src.db.unit_of_work import UnitOfWork
+
+BINDINGS = ["hardcover", "paperback", "ebook"]
+WORDS = ["Python", "Data", "Advanced", "History", "Garden", "Modern", "Ocean", "Stars", "Winter", "Code"]
+
+
+def generate_books(count, publisher_ids, seed):
+    rnd = random.Random(seed)
+    start = datetime.date(1950, 1, 1)
+    for i in range(count):
+        yield (
+            f"{rnd.choice(WORDS)} {rnd.choice(WORDS)} {seed}-{i}",
+            rnd.choice(publisher_ids),
+            start + datetime.timedelta(days=rnd.randrange(27000)),
+            round(rnd.uniform(0, 5), 2) if rnd.random() > 0.1 else None,
+            rnd.choice(BINDINGS),
+        )
+
+
+def measure(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--steps", type=int, nargs="+", default=[10000, 50000, 100000, 200000],
+                        help="table sizes (added books) at which to measure")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per query (median is reported)")
+    args = parser.parse_args()
+
+    with UnitOfWork() as uow:
+        repo = BookRepository(uow)
+        cur = uow.connection.cursor()
+        cur.execute("select id from publisher")
+        publisher_ids = [r[0] for r in cur.fetchall()]
+        if not publisher_ids:
+            raise SystemExit("The benchmark needs at least one publisher in the database.")
+
+        queries = {
+            "first page": lambda: repo.search(limit=200),
+            "deep page": lambda: repo.search(after=("Stars", 0), limit=200),
+            "name prefix": lambda: repo.search({"name": "Ocean Co"}, limit=200),
+            "publisher+rating": lambda: repo.search({"publisher_id": publisher_ids[0], "min_rating": 4}, limit=200),
+            "date range by rating": lambda: repo.search(
+                {"date_from": datetime.date(1990, 1, 1), "date_to": datetime.date(1991, 1, 1)},
+                sort="rating", descending=True, limit=200),
+        }
+        print(f"{'added books':>12} " + " ".join(f"{name:>21}" for name in queries))
+
+        loaded = 0
+        for step in sorted(args.steps):
+            bulk_load(uow.connection,
+                      "insert into book (name, publisher, publishment_date, rating, binding) values (?, ?, ?, ?, ?)",
+                      generate_books(step - loaded, publisher_ids, step), commit_chunks=False)
+            loaded = step
+            cur.execute("update statistics book")
+            results = [measure(q, args.repeat) for q in queries.values()]
+            print(f"{loaded:>12} " + " ".join(f"{ms:>18.1f} ms" for ms in results))
+
+        # Leave the database unchanged
+        uow.rollback()
+
+
+if __name__ == "__main__":
+    main()
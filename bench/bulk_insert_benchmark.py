@@ -0,0 +1,76 @@
+"""
+Benchmark: per-row INSERT loop vs. the shared bulk load path.
+
+Loads generated publisher rows into a temporary copy of the publisher
+table twice - once with one cursor.execute() per row (the previous
+bulk_insert implementation) and once with src.db.bulk_loader.bulk_load
+(fast_executemany, chunked commits) - and prints rows/sec for both.
+
+Requires a configured database (config.ini). Run from the project root:
+
+    python -m bench.bulk_insert_benchmark --rows 50000 --chunk-size 5000
+"""
+import argparse
+import time
+
+from src.db.bulk_loader import bulk_load
+from src.db.connection import pooled_connection
+
+CREATE_SQL = """
+    create table #bench_publisher (
+        id int primary key identity(1,1),
+        name varchar(50) not null,
+        address varchar(200),
+        phone_number varchar(30),
+        email varchar(200),
+        website varchar(200)
+    )
+"""
+INSERT_SQL = "insert into #bench_publisher (name, address, phone_number, email, website) values (?, ?, ?, ?, ?)"
+
+
+def generate_rows(count):
+    for i in range(count):
+        yield (f"Publisher {i}", f"{i} Main Street", f"555-{i:07d}", f"info{i}@example.com", f"https://p{i}.example.com")
+
+
+def run_per_row(con, count):
+    cur = con.cursor()
+    start = time.perf_counter()
+    for row in generate_rows(count):
+        cur.execute(INSERT_SQL, row)
+    con.commit()
+    return time.perf_counter() - start
+
+
+def run_bulk(con, count, chunk_size):
+    start = time.perf_counter()
+    bulk_load(con, INSERT_SQL, generate_rows(count), chunk_size=chunk_size, commit_chunks=True)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20000, help="number of rows per run")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="rows per chunk for bulk_load")
+    args = parser.parse_args()
+
+    with pooled_connection() as con:
+        cur = con.cursor()
+        results = {}
+        for label, runner in (("per-row execute", lambda: run_per_row(con, args.rows)),
+                              ("bulk_load", lambda: run_bulk(con, args.rows, args.chunk_size))):
+            cur.execute("drop table if exists #bench_publisher")
+            cur.execute(CREATE_SQL)
+            con.commit()
+            results[label] = runner()
+        cur.execute("drop table if exists #bench_publisher")
+        con.commit()
+
+    for label, elapsed in results.items():
+        print(f"{label:<16} {args.rows:>9} rows  {elapsed:8.2f} s  {args.rows / elapsed:12.0f} rows/s")
+    print(f"speedup: {results['per-row execute'] / results['bulk_load']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark: throughput of the batch validation schemas (src/validation/batch.py).
+
+Validates generated book, author and publisher records in batches of the
+import batch size, with a share of invalid records, and prints rows per
+second and per minute. No database is needed.
+
+Run from the project root:
+
+    python -m bench.validation_benchmark --rows 1000000
+"""
+import argparse
+import random
+import time
+
+from src.validation.batch import AUTHOR_SCHEMA, BOOK_SCHEMA, PUBLISHER_SCHEMA
+
+BINDINGS = ["hardcover", "paperback", "ebook"]
+
+
+def generate_books(count, rnd):
+    for i in range(count):
+        yield i + 1, {
+            "name": f"Book {i}" if rnd.random() > 0.01 else "",
+            "publisher": str(rnd.randrange(1, 100)),
+            "publishment_date": f"{rnd.randrange(1950, 2025)}-{rnd.randrange(1, 13):02d}-{rnd.randrange(1, 29):02d}",
+            "rating": f"{rnd.uniform(0, 5.2):.2f}",
+            "binding": rnd.choice(BINDINGS),
+        }
+
+
+def generate_authors(count, rnd):
+    for i in range(count):
+        yield i + 1, {
+            "surname": f"Surname{i}" if rnd.random() > 0.01 else "",
+            "name": f"Name{i}",
+            "email": f"author{i}@example.com",
+            "is_active": rnd.random() > 0.1,
+        }
+
+
+def generate_publishers(count, rnd):
+    for i in range(count):
+        yield i + 1, {
+            "name": f"Publisher {i}",
+            "address": f"Street {i}, City",
+            "phone_number": f"+420 {rnd.randrange(10 ** 8, 10 ** 9)}",
+            "email": f"info{i}@publisher.com",
+            "website": f"https://publisher{i}.com",
+        }
+
+
+def measure(schema, records, batch_size):
+    start = time.perf_counter()
+    valid = invalid = 0
+    for i in range(0, len(records), batch_size):
+        result = schema.validate(records[i:i + batch_size])
+        valid += len(result.valid)
+        invalid += len(result.by_row())
+    return time.perf_counter() - start, valid, invalid
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch validation throughput")
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    rnd = random.Random(1)
+    print(f"{'schema':<10} {'rows':>10} {'invalid':>8} {'seconds':>8} {'rows/s':>10} {'rows/min':>12}")
+    for schema, generate in ((BOOK_SCHEMA, generate_books), (AUTHOR_SCHEMA, generate_authors),
+                             (PUBLISHER_SCHEMA, generate_publishers)):
+        records = list(generate(args.rows, rnd))
+        elapsed, valid, invalid = measure(schema, records, args.batch_size)
+        rate = args.rows / elapsed
+        print(f"{schema.name:<10} {args.rows:>10} {invalid:>8} {elapsed:>8.2f} {rate:>10.0f} {rate * 60:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -49,6 +49,9 @@ id int primary key identity(1,1),
 name varchar(50) not null
 );
 
+-- Indexes are created by the migrations in db/migrations:
+--     python -m src.db.migrations
+
 insert into book (name, publisher, publishment_date, rating, binding)
 values
 ('Python Basics', 1, '2022-01-15', 4.5, 'hardcover'),
@@ -73,6 +76,7 @@ select
 from book b
 join publisher p on p.id = b.publisher;
 
+-- Replaced by migration 0003, which reads incrementally maintained indexed views
 create or alter view vw_publisher_report as
 select
     p.id as publisher_id,
@@ -0,0 +1,11 @@
+-- Indexes for book_author lookups
+-- fetch_active_authors, assign_authors and the publisher report look up
+-- assignments by book; transfers and deactivation look them up by author.
+
+if not exists (select 1 from sys.indexes where name = 'ix_book_author_book' and object_id = object_id('book_author'))
+    create index ix_book_author_book on book_author (book_id, author_id) include (is_active);
+
+-- Only active assignments are read by the application, so the filtered
+-- index stays small even when many assignments have been deactivated
+if not exists (select 1 from sys.indexes where name = 'ix_book_author_active_author' and object_id = object_id('book_author'))
+    create index ix_book_author_active_author on book_author (author_id, book_id) where is_active = 1;
@@ -0,0 +1,17 @@
+-- Indexes supporting book search (BookRepository.search): every sort column
+-- has an index covering the book list columns, so filtered and sorted pages
+-- are read with an index seek instead of a table scan.
+-- ix_book_publisher_name also serves the joins on book.publisher (publisher
+-- report, publisher delete checks), so no separate book(publisher) index is needed.
+
+if not exists (select 1 from sys.indexes where name = 'ix_book_name' and object_id = object_id('book'))
+    create index ix_book_name on book (name) include (publisher, publishment_date, rating, binding);
+
+if not exists (select 1 from sys.indexes where name = 'ix_book_publisher_name' and object_id = object_id('book'))
+    create index ix_book_publisher_name on book (publisher, name) include (publishment_date, rating, binding);
+
+if not exists (select 1 from sys.indexes where name = 'ix_book_rating' and object_id = object_id('book'))
+    create index ix_book_rating on book (rating) include (name, publisher, publishment_date, binding);
+
+if not exists (select 1 from sys.indexes where name = 'ix_book_publishment_date' and object_id = object_id('book'))
+    create index ix_book_publishment_date on book (publishment_date) include (name, publisher, rating, binding);
@@ -0,0 +1,60 @@
+-- Incrementally maintained publisher report
+-- Two indexed views hold the per-publisher aggregates; SQL Server updates
+-- them together with every insert, update and delete on book and
+-- book_author, so the report reads precomputed rows instead of joining
+-- publisher x book x book_author on every request.
+
+-- Books and rating sum/count per publisher (avg = rating_sum / rating_count;
+-- indexed views cannot contain AVG or SUM over nullable expressions)
+create or alter view vw_publisher_book_stats
+with schemabinding
+as
+select
+    b.publisher,
+    count_big(*) as books_count,
+    sum(isnull(b.rating, 0)) as rating_sum,
+    sum(case when b.rating is null then 0 else 1 end) as rating_count
+from dbo.book b
+group by b.publisher;
+go
+
+if not exists (select 1 from sys.indexes where name = 'ux_vw_publisher_book_stats' and object_id = object_id('vw_publisher_book_stats'))
+    create unique clustered index ux_vw_publisher_book_stats on vw_publisher_book_stats (publisher);
+go
+
+-- One row per publisher and active author (indexed views cannot use
+-- COUNT(DISTINCT)); the number of rows of a publisher is its number of
+-- active authors and `assignments` counts the books behind each row
+create or alter view vw_publisher_active_authors
+with schemabinding
+as
+select
+    b.publisher,
+    ba.author_id,
+    count_big(*) as assignments
+from dbo.book_author ba
+join dbo.book b on b.id = ba.book_id
+where ba.is_active = 1
+group by b.publisher, ba.author_id;
+go
+
+if not exists (select 1 from sys.indexes where name = 'ux_vw_publisher_active_authors' and object_id = object_id('vw_publisher_active_authors'))
+    create unique clustered index ux_vw_publisher_active_authors on vw_publisher_active_authors (publisher, author_id);
+go
+
+-- The report view reads the indexed views (noexpand makes every edition
+-- use their indexes instead of expanding the view definitions)
+create or alter view vw_publisher_report as
+select
+    p.id as publisher_id,
+    p.name as publisher_name,
+    isnull(s.books_count, 0) as books_count,
+    s.rating_sum / nullif(s.rating_count, 0) as avg_rating,
+    isnull(a.active_authors, 0) as active_authors
+from publisher p
+left join vw_publisher_book_stats s with (noexpand) on s.publisher = p.id
+left join (
+    select publisher, count(*) as active_authors
+    from vw_publisher_active_authors with (noexpand)
+    group by publisher
+) a on a.publisher = p.id;
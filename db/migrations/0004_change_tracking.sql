@@ -0,0 +1,26 @@
+-- migration: no-transaction
+-- Change tracking for delta refreshes (repository fetch_changes() methods):
+-- SQL Server records the primary keys of inserted, updated and deleted rows,
+-- so clients only download rows changed since their last version.
+-- ALTER DATABASE cannot run inside a transaction, hence the marker above;
+-- every statement is guarded, so the script can safely be run again.
+-- Requires ALTER permission on the database.
+
+if not exists (select 1 from sys.change_tracking_databases where database_id = db_id())
+    alter database current set change_tracking = on (change_retention = 2 days, auto_cleanup = on);
+go
+
+if not exists (select 1 from sys.change_tracking_tables where object_id = object_id('book'))
+    alter table book enable change_tracking;
+go
+
+if not exists (select 1 from sys.change_tracking_tables where object_id = object_id('author'))
+    alter table author enable change_tracking;
+go
+
+if not exists (select 1 from sys.change_tracking_tables where object_id = object_id('publisher'))
+    alter table publisher enable change_tracking;
+go
+
+if not exists (select 1 from sys.change_tracking_tables where object_id = object_id('book_author'))
+    alter table book_author enable change_tracking;
@@ -0,0 +1,10 @@
+-- Indexes on the columns upsert imports match rows by (staged_upsert.py):
+-- publishers and genres are matched by name, so the MERGE of an import
+-- seeks the existing rows instead of scanning the whole table.
+-- Authors are matched by email, which already has a unique index.
+
+if not exists (select 1 from sys.indexes where name = 'ix_publisher_name' and object_id = object_id('publisher'))
+    create index ix_publisher_name on publisher (name) include (address, phone_number, email, website);
+
+if not exists (select 1 from sys.indexes where name = 'ix_genre_name' and object_id = object_id('genre'))
+    create index ix_genre_name on genre (name);
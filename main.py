@@ -1,7 +1,12 @@
+import time
+
+# Taken before the application modules are imported, for the startup time measurement
+STARTED = time.perf_counter()
+
 from src.app import LibraryApp
 
 if __name__ == "__main__":
-    app = LibraryApp()
+    app = LibraryApp(started=STARTED)
     app.mainloop()
 
 
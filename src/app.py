@@ -1,3 +1,5 @@
+import logging
+import time
 import tkinter
 from tkinter import ttk
 
@@ -6,6 +8,10 @@ from .ui.author_tab import AuthorTab
 from .ui.import_tab import ImportTab
 from .ui.report_tab import ReportTab
 from .ui.settings_tab import SettingsTab
+from .ui.diagnostics_tab import DiagnosticsTab
+from .ui.background import executor
+from .db.connection import get_pool
+from .db.instrumentation import metrics
 
 class LibraryApp(tkinter.Tk):
     """
@@ -18,38 +24,89 @@ class LibraryApp(tkinter.Tk):
     - Import: Import data (publishers, authors, genres) from CSV/JSON/XML
     - Report: Generate reports (e.g., publisher report with book count and ratings)
     - Settings: Configure database connection settings
+    - Diagnostics: Query timings, slow operations, pool and cache statistics
+
+    Tabs are built lazily: the notebook starts with empty placeholder
+    frames and a tab is created (and its data loaded in the background)
+    the first time it is selected, so the window appears without waiting
+    for the database.
 
     Attributes:
-        book_tab (BookTab): The Books tab instance
-        author_tab (AuthorTab): The Authors tab instance
-        import_tab (ImportTab): The Import tab instance
-        report_tab (ReportTab): The Report tab instance
-        settings_tab (SettingsTab): The Settings tab instance
+        book_tab (BookTab): The Books tab instance (None until first shown)
+        author_tab (AuthorTab): The Authors tab instance (None until first shown)
+        import_tab (ImportTab): The Import tab instance (None until first shown)
+        report_tab (ReportTab): The Report tab instance (None until first shown)
+        settings_tab (SettingsTab): The Settings tab instance (None until first shown)
+        diagnostics_tab (DiagnosticsTab): The Diagnostics tab instance (None until first shown)
     """
-    def __init__(self):
+    # (attribute, title, tab class) in notebook order
+    TABS = [
+        ("book_tab", "Books", BookTab),
+        ("author_tab", "Authors", AuthorTab),
+        ("import_tab", "Import", ImportTab),
+        ("report_tab", "Report", ReportTab),
+        ("settings_tab", "Settings", SettingsTab),
+        ("diagnostics_tab", "Diagnostics", DiagnosticsTab),
+    ]
+
+    def __init__(self, started=None):
+        """
+        :param started: time.perf_counter() value taken at process start,
+                        used to measure the time until the window is shown
+        """
         super().__init__()
+        self.started = started if started is not None else time.perf_counter()
         self.title("Library Database")
         self.geometry("900x600")
 
         # Create a Notebook widget for tabbed interface
-        nb = ttk.Notebook(self)
-        nb.pack(fill="both", expand=True)
-
-        # Initialize each tab
-        self.book_tab = BookTab(nb)
-        self.author_tab = AuthorTab(nb)
-        self.import_tab = ImportTab(nb)
-        self.report_tab = ReportTab(nb)
-        self.settings_tab = SettingsTab(nb)
-
-        # Add tabs to the notebook with titles
-        nb.add(self.book_tab, text="Books")
-        nb.add(self.author_tab, text="Authors")
-        nb.add(self.import_tab, text="Import")
-        nb.add(self.report_tab, text="Report")
-        nb.add(self.settings_tab, text="Settings")
-
-        # Load initial data for books and authors
-        self.book_tab.refresh()
-        self.author_tab.refresh()
+        self.nb = ttk.Notebook(self)
+        self.nb.pack(fill="both", expand=True)
+
+        # Add an empty placeholder frame per tab; tabs are built on first selection
+        self._placeholders = []
+        for attr, title, _ in self.TABS:
+            setattr(self, attr, None)
+            placeholder = ttk.Frame(self.nb)
+            self.nb.add(placeholder, text=title)
+            self._placeholders.append(placeholder)
+        self.nb.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        # The first tab is selected before the binding exists; build it once the window is up
+        self.after_idle(lambda: self._build_tab(self.nb.index("current")))
+
+        self.bind("<Map>", self._on_first_map)
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+    def _on_tab_changed(self, event):
+        self._build_tab(self.nb.index("current"))
+
+    def _build_tab(self, index):
+        """
+        Creates the tab at a notebook index inside its placeholder unless
+        it already exists, and starts its initial (background) data load.
+        """
+        attr, _, tab_class = self.TABS[index]
+        if getattr(self, attr) is not None:
+            return
+        tab = tab_class(self._placeholders[index])
+        tab.pack(fill="both", expand=True)
+        setattr(self, attr, tab)
+        if hasattr(tab, "load"):
+            tab.load()
+
+    def _on_first_map(self, event):
+        # <Map> of the root window is also reported for its children
+        if event.widget is not self:
+            return
+        self.unbind("<Map>")
+        elapsed = time.perf_counter() - self.started
+        metrics.record("startup", "time_to_first_window", elapsed)
+        logging.info("Window shown %.0f ms after start", elapsed * 1000)
 
+    def on_close(self):
+        """
+        Stops background work and closes pooled connections before the window is destroyed.
+        """
+        executor.shutdown()
+        get_pool().close()
+        self.destroy()
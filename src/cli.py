@@ -0,0 +1,115 @@
+"""
+Command line interface for batch jobs (cron, scripts) without the GUI.
+
+    python -m src import publishers data.csv [--upsert] [--restart]
+    python -m src report publishers --format csv [--output report.csv.gz]
+    python -m src migrate [--status] [--target N]
+    python -m src ingest [--once]
+
+Only the modules a command needs are imported, when the command runs,
+so startup stays fast; nothing here imports tkinter.
+"""
+import argparse
+import logging
+import sys
+
+IMPORTS = {
+    # entity: (importer module, importer function)
+    "publishers": ("src.importers.publisher_importer", "import_publishers_csv"),
+    "authors": ("src.importers.author_importer", "import_authors_json"),
+    "genres": ("src.importers.genre_importer", "import_genres_xml"),
+}
+
+
+def _import(args):
+    import importlib
+
+    module, name = IMPORTS[args.entity]
+    import_fn = getattr(importlib.import_module(module), name)
+
+    def progress(result):
+        print(f"Read {result.processed} record(s), inserted {result.inserted}...", file=sys.stderr)
+
+    result = import_fn(args.path, resume=not args.restart, upsert=args.upsert,
+                       progress=progress if args.progress else None)
+    print(result.summary())
+    return 0
+
+
+def _report(args):
+    from src.exporters.report_export import REPORTS, write_rows
+
+    if args.output:
+        result = REPORTS[args.report](args.output, fmt=args.format, compress=args.gzip)
+        print(result.summary(), file=sys.stderr)
+        return 0
+
+    from src.db.repositories.report_repository import PUBLISHER_REPORT_COLUMNS, ReportRepository
+
+    # Without --output the rows are streamed to stdout
+    sources = {
+        "publishers": (PUBLISHER_REPORT_COLUMNS, lambda: ReportRepository().iter_publisher_report()),
+    }
+    columns, rows = sources[args.report]
+    sys.stdout.reconfigure(newline="")
+    write_rows(sys.stdout, columns, rows(), args.format or "csv")
+    return 0
+
+
+def _migrate(args):
+    from src.db import migrations
+
+    argv = ["--status"] if args.status else []
+    if args.target is not None:
+        argv += ["--target", str(args.target)]
+    return migrations.main(argv)
+
+
+def _ingest(args):
+    from src.importers import ingest
+
+    return ingest.main(args.extra)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m src", description="Library database batch commands.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    p = commands.add_parser("import", help="import a CSV (publishers), JSON (authors) or XML (genres) file")
+    p.add_argument("entity", choices=sorted(IMPORTS))
+    p.add_argument("path", help="file to import")
+    p.add_argument("--upsert", action="store_true", help="insert new and update changed rows")
+    p.add_argument("--restart", action="store_true", help="ignore the checkpoint of a failed import")
+    p.add_argument("--progress", action="store_true", help="print progress to stderr")
+    p.set_defaults(run=_import)
+
+    p = commands.add_parser("report", help="write a report as CSV or JSON Lines")
+    p.add_argument("report", choices=["publishers"])
+    p.add_argument("--format", choices=["csv", "jsonl"], help="output format (default: csv or the file extension)")
+    p.add_argument("--output", help="output file (.gz compresses); stdout if omitted")
+    p.add_argument("--gzip", action="store_true", default=None, help="compress the output file")
+    p.set_defaults(run=_report)
+
+    p = commands.add_parser("migrate", help="apply database schema migrations")
+    p.add_argument("--status", action="store_true", help="list applied and pending migrations")
+    p.add_argument("--target", type=int, help="apply migrations up to this version only")
+    p.set_defaults(run=_migrate)
+
+    # Options are passed on to python -m src.importers.ingest (see main())
+    p = commands.add_parser("ingest", help="import files dropped into [app] import_dir", add_help=False)
+    p.set_defaults(run=_ingest)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args, extra = parser.parse_known_args(argv)
+    if extra and args.command != "ingest":
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
+    args.extra = extra
+    try:
+        return args.run(args)
+    except Exception as e:
+        logging.error("%s failed", args.command, exc_info=True)
+        print(f"{args.command} failed: {e}", file=sys.stderr)
+        return 1
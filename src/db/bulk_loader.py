@@ -0,0 +1,83 @@
+import itertools
+import logging
+import time
+
+from src.config import config
+
+# Number of rows sent to the server per executemany() call
+DEFAULT_CHUNK_SIZE = config.getint("database", "bulk_chunk_size", fallback=5000)
+
+
+class BulkLoadProgress:
+    """
+    Progress information passed to bulk load callbacks after each chunk.
+
+    Attributes:
+        rows (int): Number of rows loaded so far
+        elapsed (float): Seconds since the load started
+        rows_per_sec (float): Average throughput so far
+    """
+    def __init__(self, rows, elapsed):
+        self.rows = rows
+        self.elapsed = elapsed
+        self.rows_per_sec = rows / elapsed if elapsed > 0 else 0.0
+
+    def __repr__(self):
+        return f"BulkLoadProgress(rows={self.rows}, elapsed={self.elapsed:.2f}s, rows_per_sec={self.rows_per_sec:.0f})"
+
+
+def chunked(iterable, size):
+    """
+    Splits an iterable into lists of at most `size` items without
+    materializing the whole input.
+
+    :param iterable: Any iterable
+    :param size: Maximum chunk length
+    :return: Generator of lists
+    """
+    it = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def bulk_load(con, sql, rows, chunk_size=None, commit_chunks=True, progress=None, input_sizes=None):
+    """
+    Executes a parameterized INSERT for many rows using pyodbc fast_executemany.
+
+    Rows are sent in chunks: with fast_executemany pyodbc transfers a whole
+    chunk as one parameter array instead of one round trip per row.
+
+    :param con: Open database connection
+    :param sql: Parameterized statement, e.g. "insert into genre (name) values (?)"
+    :param rows: Iterable of parameter tuples (may be a generator)
+    :param chunk_size: Rows per chunk (defaults to [database] bulk_chunk_size)
+    :param commit_chunks: Commit after every chunk; if False the caller commits
+    :param progress: Optional callable receiving a BulkLoadProgress after each chunk
+    :param input_sizes: Optional parameter type list for cursor.setinputsizes()
+    :return: Number of rows loaded
+    """
+    chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+    cur = con.cursor()
+    cur.fast_executemany = True
+    if input_sizes:
+        cur.setinputsizes(input_sizes)
+
+    total = 0
+    start = time.perf_counter()
+    try:
+        for chunk in chunked(rows, chunk_size):
+            cur.executemany(sql, chunk)
+            if commit_chunks:
+                con.commit()
+            total += len(chunk)
+            if progress:
+                progress(BulkLoadProgress(total, time.perf_counter() - start))
+    finally:
+        cur.close()
+
+    elapsed = time.perf_counter() - start
+    logging.debug("Bulk loaded %d row(s) in %.2f s", total, elapsed)
+    return total
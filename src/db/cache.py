@@ -0,0 +1,147 @@
+import functools
+import threading
+import time
+from collections import OrderedDict
+
+from src.config import config
+
+
+class QueryCache:
+    """
+    Thread-safe in-process cache for reference data read through repositories.
+
+    Entries expire after `ttl` seconds and the least recently used entries
+    are evicted once more than `max_entries` are stored. Every entry belongs
+    to a namespace (usually a table name); invalidating a namespace drops
+    all of its entries. A per-namespace generation counter prevents a read
+    that started before an invalidation from storing its (stale) result.
+    """
+    def __init__(self, max_entries=256, ttl=300.0):
+        """
+        :param max_entries: Maximum number of cached results
+        :param ttl: Seconds a cached result stays valid
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # key -> (namespace, value, expires_at), least recently used first
+        self._entries = OrderedDict()
+        self._generations = {}
+        self._stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    def get(self, key):
+        """
+        :return: Tuple (found, value)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[2] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self._stats["misses"] += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return True, entry[1]
+
+    def generation(self, namespace):
+        """
+        :return: Current generation of a namespace (changes on every invalidation)
+        """
+        with self._lock:
+            return self._generations.get(namespace, 0)
+
+    def set(self, key, value, namespace, generation):
+        """
+        Stores a value unless the namespace was invalidated since `generation` was read.
+        """
+        with self._lock:
+            if self._generations.get(namespace, 0) != generation:
+                return
+            self._entries[key] = (namespace, value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, namespace):
+        """
+        Drops all entries of a namespace.
+        """
+        with self._lock:
+            self._generations[namespace] = self._generations.get(namespace, 0) + 1
+            for key in [k for k, entry in self._entries.items() if entry[0] == namespace]:
+                del self._entries[key]
+            self._stats["invalidations"] += 1
+
+    def clear(self):
+        with self._lock:
+            for namespace in self._generations:
+                self._generations[namespace] += 1
+            self._entries.clear()
+
+    def stats(self):
+        """
+        :return: Dictionary with hit/miss/invalidation counters and the number of entries
+        """
+        with self._lock:
+            snapshot = dict(self._stats)
+            snapshot["entries"] = len(self._entries)
+            return snapshot
+
+
+# Shared cache for reference data (publishers, authors)
+reference_cache = QueryCache(
+    max_entries=config.getint("app", "cache_max_entries", fallback=256),
+    ttl=config.getfloat("app", "cache_ttl", fallback=300),
+)
+
+
+def cached(namespace):
+    """
+    Decorator making a repository read method read-through cached.
+
+    The cache key consists of the method name and its arguments.
+    Repositories bound to a UnitOfWork bypass the cache so they see
+    their own uncommitted changes. Cached results are shared between
+    callers and must not be modified.
+
+    :param namespace: Cache namespace invalidated by writes to the same data
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if self.uow is not None:
+                return method(self, *args, **kwargs)
+            key = (namespace, method.__name__, args, tuple(sorted(kwargs.items())))
+            found, value = reference_cache.get(key)
+            if found:
+                return value
+            generation = reference_cache.generation(namespace)
+            value = method(self, *args, **kwargs)
+            reference_cache.set(key, value, namespace, generation)
+            return value
+        return wrapper
+    return decorator
+
+
+def invalidates(namespace):
+    """
+    Decorator for repository write methods: drops cached results of the
+    namespace after the write, or after the surrounding UnitOfWork commits.
+    Failed writes invalidate too, since chunked bulk loads may have
+    committed part of their rows.
+
+    :param namespace: Cache namespace affected by the write
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                if self.uow is not None:
+                    self.uow.on_commit(lambda: reference_cache.invalidate(namespace))
+                else:
+                    reference_cache.invalidate(namespace)
+        return wrapper
+    return decorator
@@ -0,0 +1,98 @@
+class ChangeTrackingUnavailable(Exception):
+    """Raised when change tracking is not enabled for a table (migration 0004 not applied)."""
+    pass
+
+
+class Delta:
+    """
+    Rows changed since a client-held change tracking version.
+
+    Attributes:
+        version (int): New watermark; pass it to the next fetch_changes() call
+        changed (list): Current rows of inserted or updated records
+                        (same columns as the repository's list methods)
+        removed (list): IDs of deleted records, and of changed records that
+                        no longer match the caller's filter
+        reset (bool): True if the watermark is too old (changes have been
+                      cleaned up); the caller must reload everything
+    """
+    def __init__(self, version, changed=None, removed=None, reset=False):
+        self.version = version
+        self.changed = changed or []
+        self.removed = removed or []
+        self.reset = reset
+
+    def __bool__(self):
+        return bool(self.changed or self.removed or self.reset)
+
+    def __repr__(self):
+        return f"Delta(version={self.version}, changed={len(self.changed)}, removed={len(self.removed)}, reset={self.reset})"
+
+
+def current_version(con):
+    """
+    Returns the current change tracking version of the database.
+    Take it before a full load and use it as the first watermark.
+
+    :raises ChangeTrackingUnavailable: If change tracking is not enabled
+    """
+    cur = con.cursor()
+    cur.execute("select change_tracking_current_version()")
+    version = cur.fetchone()[0]
+    cur.close()
+    if version is None:
+        raise ChangeTrackingUnavailable("Change tracking is not enabled; run python -m src.db.migrations.")
+    return version
+
+
+def fetch_changes(con, table, columns, since, match=None, match_params=(), row_factory=tuple):
+    """
+    Reads the rows of a table changed after version `since` (CHANGETABLE).
+
+    Only the primary keys of changed rows are tracked; the current data is
+    joined from the table itself, so a row changed several times is
+    returned once, in its latest state.
+
+    :param con: Open database connection
+    :param table: Table name (must have change tracking enabled and an `id` primary key)
+    :param columns: Columns returned for changed rows (the first must be id)
+    :param since: Watermark from current_version() or a previous Delta
+    :param match: Optional SQL condition on the table's columns; changed
+                  rows not matching it are reported as removed
+    :param match_params: Parameters of the match condition
+    :param row_factory: Callable converting the column values of a changed row (e.g. Model.from_row)
+    :return: Delta
+    :raises ChangeTrackingUnavailable: If change tracking is not enabled for the table
+    """
+    # The new watermark is read first: changes committed meanwhile are
+    # returned now and again next time, which is harmless for upserts
+    version = current_version(con)
+
+    cur = con.cursor()
+    cur.execute("select change_tracking_min_valid_version(object_id(?))", (table,))
+    min_valid = cur.fetchone()[0]
+    if min_valid is None:
+        cur.close()
+        raise ChangeTrackingUnavailable(f"Change tracking is not enabled for table {table}.")
+    if since < min_valid:
+        cur.close()
+        return Delta(version, reset=True)
+
+    condition = f"t.id is not null and ({match})" if match else "t.id is not null"
+    select_list = ", ".join(f"t.{column}" for column in columns)
+    cur.execute(
+        f"""
+        select ct.id, case when {condition} then 1 else 0 end, {select_list}
+        from changetable(changes {table}, ?) as ct
+        left join {table} t on t.id = ct.id
+        """,
+        (*match_params, since),
+    )
+    changed, removed = [], []
+    for row in cur.fetchall():
+        if row[1]:
+            changed.append(row_factory(tuple(row[2:])))
+        else:
+            removed.append(row[0])
+    cur.close()
+    return Delta(version, changed, removed)
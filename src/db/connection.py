@@ -1,16 +1,41 @@
 import pyodbc
 import logging
+import threading
+import time
+from contextlib import contextmanager
 
 from src.config import config
+from src.db.instrumentation import instrumented, metrics
 
 class DatabaseConnectionError(Exception):
     """Custom exception for database connection failures."""
     pass
 
+# SQL Server errors that succeed when the transaction is simply run again:
+# 1205 = chosen as deadlock victim, 1222 = lock request time out
+TRANSIENT_ERRORS = (1205, 1222)
+
+
+def is_transient_error(error):
+    """
+    Tells whether a database error is worth retrying (deadlock or lock timeout).
+
+    :param error: Exception raised by pyodbc
+    """
+    if not isinstance(error, pyodbc.Error):
+        return False
+    if error.args and error.args[0] == "40001":
+        return True
+    message = str(error)
+    return any(f"({code})" in message for code in TRANSIENT_ERRORS)
+
 def get_connection():
     """
     Creates and returns a new database connection using SQL Authentication.
     Connection parameters are loaded from config.ini.
+
+    Repositories should not call this directly; they borrow connections
+    from the shared pool through pooled_connection().
     """
     try:
         db = config['database']
@@ -51,3 +76,273 @@ def get_connection():
         ) from e
 
 
+class ConnectionPool:
+    """
+    Thread-safe pool of reusable database connections.
+
+    Opening a connection to SQL Server (login, TLS handshake) is far more
+    expensive than running a typical repository query, so connections are
+    kept open and handed out again instead of being closed after each call.
+
+    - At most max_size connections exist at the same time; callers wait
+      (up to timeout seconds) when all of them are borrowed.
+    - Idle connections above min_size are closed after idle_timeout seconds.
+    - A connection that has been idle longer than ping_interval seconds
+      is checked with a cheap query before it is handed out.
+
+    Usage statistics (hits, misses, waits, ...) are available via stats().
+    """
+    def __init__(self, connect=get_connection, min_size=0, max_size=5,
+                 idle_timeout=300.0, timeout=30.0, ping_interval=30.0):
+        """
+        :param connect: Factory creating a new raw connection
+        :param min_size: Number of idle connections kept even when unused
+        :param max_size: Maximum number of open connections
+        :param idle_timeout: Seconds after which a surplus idle connection is closed
+        :param timeout: Seconds to wait for a free connection before failing
+        :param ping_interval: Idle seconds after which a connection is health-checked
+        """
+        if max_size < 1 or min_size < 0 or min_size > max_size:
+            raise ValueError("Invalid pool size: require 0 <= min_size <= max_size and max_size >= 1")
+        self._connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.ping_interval = ping_interval
+
+        self._lock = threading.Condition()
+        # Idle connections as (connection, returned_at) pairs, most recently used last
+        self._idle = []
+        self._size = 0
+        self._closed = False
+        self._stats = {
+            "hits": 0,          # checkout served by an idle connection
+            "misses": 0,        # checkout had to open a new connection
+            "waits": 0,         # checkout had to wait for a connection to be returned
+            "wait_time": 0.0,   # total seconds spent waiting
+            "timeouts": 0,      # checkouts that gave up waiting
+            "evicted": 0,       # idle connections closed after idle_timeout
+            "discarded": 0,     # broken connections dropped on checkout or release
+        }
+
+    def acquire(self):
+        """
+        Borrows a connection from the pool.
+
+        The time until a connection is available (waiting, opening or
+        health-checking it) is recorded as the "connection" metric.
+
+        :return: Open database connection
+        :raises DatabaseConnectionError: If no connection becomes available in time
+        """
+        start = time.perf_counter()
+        error = False
+        try:
+            return self._acquire()
+        except Exception:
+            error = True
+            raise
+        finally:
+            metrics.record("connection", "acquire", time.perf_counter() - start, error)
+
+    def _acquire(self):
+        waited = False
+        wait_start = None
+        with self._lock:
+            while True:
+                if self._closed:
+                    raise DatabaseConnectionError("The connection pool has been closed.")
+                self._evict_idle()
+                if self._idle:
+                    con, returned_at = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    # Reserve a slot and open the connection outside the lock
+                    self._size += 1
+                    con = None
+                    break
+                if not waited:
+                    waited = True
+                    wait_start = time.monotonic()
+                    self._stats["waits"] += 1
+                remaining = self.timeout - (time.monotonic() - wait_start)
+                if remaining <= 0:
+                    self._stats["timeouts"] += 1
+                    self._stats["wait_time"] += time.monotonic() - wait_start
+                    raise DatabaseConnectionError(
+                        f"No database connection available within {self.timeout:g} s (pool size {self.max_size})."
+                    )
+                self._lock.wait(remaining)
+            if waited:
+                self._stats["wait_time"] += time.monotonic() - wait_start
+
+        if con is None:
+            return self._open_new()
+
+        # Health-check connections that have been idle for a while
+        if time.monotonic() - returned_at >= self.ping_interval and not self._is_healthy(con):
+            self._discard(con)
+            return self._open_new()
+
+        with self._lock:
+            self._stats["hits"] += 1
+        return con
+
+    def release(self, con, broken=False):
+        """
+        Returns a borrowed connection to the pool.
+
+        Any open transaction is rolled back so the next borrower
+        starts from a clean state.
+
+        :param con: Connection previously returned by acquire()
+        :param broken: If True, the connection is closed instead of reused
+        """
+        if not broken:
+            try:
+                con.rollback()
+            except pyodbc.Error:
+                broken = True
+        if broken:
+            self._discard(con)
+            return
+        with self._lock:
+            if self._closed:
+                self._size -= 1
+                self._close_quietly(con)
+            else:
+                self._idle.append((con, time.monotonic()))
+            self._lock.notify()
+
+    @contextmanager
+    def connection(self):
+        """
+        Context manager borrowing a connection for the duration of a block.
+
+        The transaction is rolled back if the block raises; the connection
+        is returned to the pool in every case.
+        """
+        con = self.acquire()
+        broken = False
+        try:
+            yield con
+        except pyodbc.Error as e:
+            # Connection-level failures make the connection unusable
+            broken = isinstance(e, pyodbc.OperationalError)
+            raise
+        finally:
+            self.release(con, broken=broken)
+
+    def stats(self):
+        """
+        Returns a snapshot of the pool usage statistics.
+
+        :return: Dictionary with hit/miss/wait counters, current size and idle count
+        """
+        with self._lock:
+            snapshot = dict(self._stats)
+            snapshot["size"] = self._size
+            snapshot["idle"] = len(self._idle)
+            checkouts = snapshot["hits"] + snapshot["misses"]
+            snapshot["hit_ratio"] = snapshot["hits"] / checkouts if checkouts else 0.0
+            return snapshot
+
+    def close(self):
+        """
+        Closes all idle connections and refuses further checkouts.
+        Connections still borrowed are closed when they are released.
+        """
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._lock.notify_all()
+        for con, _ in idle:
+            self._close_quietly(con)
+
+    def _open_new(self):
+        try:
+            con = self._connect()
+        except Exception:
+            # Give the reserved slot back
+            with self._lock:
+                self._size -= 1
+                self._lock.notify()
+            raise
+        with self._lock:
+            self._stats["misses"] += 1
+        return con
+
+    def _evict_idle(self):
+        # Called with the lock held; the oldest idle connections are at the front
+        now = time.monotonic()
+        while len(self._idle) > self.min_size and now - self._idle[0][1] >= self.idle_timeout:
+            con, _ = self._idle.pop(0)
+            self._size -= 1
+            self._stats["evicted"] += 1
+            self._close_quietly(con)
+
+    def _discard(self, con):
+        self._close_quietly(con)
+        with self._lock:
+            self._size -= 1
+            self._stats["discarded"] += 1
+            self._lock.notify()
+
+    @staticmethod
+    def _is_healthy(con):
+        try:
+            cur = con.cursor()
+            cur.execute("select 1")
+            cur.fetchone()
+            cur.close()
+            return True
+        except pyodbc.Error:
+            logging.warning("Discarding broken pooled database connection", exc_info=True)
+            return False
+
+    @staticmethod
+    def _close_quietly(con):
+        try:
+            con.close()
+        except pyodbc.Error:
+            pass
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_pool():
+    """
+    Returns the application-wide connection pool, creating it on first use.
+
+    Pool settings are read from the [database] section of config.ini:
+    pool_min_size, pool_max_size, pool_idle_timeout, pool_timeout
+    and pool_ping_interval.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            db = config['database'] if config.has_section('database') else {}
+            _pool = ConnectionPool(
+                # Every statement executed on pooled connections is timed
+                connect=instrumented(get_connection),
+                min_size=int(db.get('pool_min_size', 0)),
+                max_size=int(db.get('pool_max_size', 5)),
+                idle_timeout=float(db.get('pool_idle_timeout', 300)),
+                timeout=float(db.get('pool_timeout', 30)),
+                ping_interval=float(db.get('pool_ping_interval', 30)),
+            )
+        return _pool
+
+def pooled_connection():
+    """
+    Context manager borrowing a connection from the application-wide pool.
+
+    Example:
+        with pooled_connection() as con:
+            cur = con.cursor()
+            ...
+    """
+    return get_pool().connection()
@@ -0,0 +1,314 @@
+import functools
+import inspect
+import json
+import logging
+import re
+import threading
+import time
+from collections import deque
+
+from src.config import config
+
+# Queries taking at least this long are logged with their SQL text and parameters
+SLOW_QUERY_MS = config.getfloat("app", "slow_query_ms", fallback=500)
+
+# Number of most recent latencies kept per operation for the percentiles
+SAMPLE_SIZE = 2048
+
+# Longest parameter representation written to the slow query log
+MAX_LOGGED_PARAMS = 500
+
+
+class OperationStats:
+    """
+    Counters and recent latencies of one instrumented operation
+    (a repository method, a SQL statement or the connection checkout).
+    """
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.rows = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        # Latencies (seconds) of the most recent calls
+        self.samples = deque(maxlen=SAMPLE_SIZE)
+
+    def add(self, elapsed, error=False, rows=0):
+        self.calls += 1
+        self.rows += rows
+        self.total_time += elapsed
+        self.max_time = max(self.max_time, elapsed)
+        self.samples.append(elapsed)
+        if error:
+            self.errors += 1
+
+    def to_dict(self):
+        """
+        :return: Dictionary with counters and p50/p95/p99 latencies in milliseconds
+        """
+        ordered = sorted(self.samples)
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "rows": self.rows,
+            "avg_ms": self.total_time / self.calls * 1000 if self.calls else 0.0,
+            "p50_ms": _percentile(ordered, 50) * 1000,
+            "p95_ms": _percentile(ordered, 95) * 1000,
+            "p99_ms": _percentile(ordered, 99) * 1000,
+            "max_ms": self.max_time * 1000,
+        }
+
+
+def _percentile(ordered, percent):
+    # Nearest-rank percentile of a sorted list
+    if not ordered:
+        return 0.0
+    rank = max(0, -(-len(ordered) * percent // 100) - 1)
+    return ordered[int(rank)]
+
+
+class Metrics:
+    """
+    Thread-safe registry of operation statistics.
+
+    Operations are grouped by kind:
+    - "repository": repository method calls (BaseRepository subclasses)
+    - "query": SQL statements executed through pooled connections
+    - "connection": time to check a connection out of the pool
+    - "startup": application startup phases (e.g. time to first window)
+    """
+    KINDS = ("repository", "query", "connection", "startup")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._operations = {}
+        self.started = time.time()
+
+    def record(self, kind, name, elapsed, error=False, rows=0):
+        """
+        Records one call of an operation.
+
+        :param kind: Operation kind (see KINDS)
+        :param name: Operation name (method name or normalized SQL)
+        :param elapsed: Duration in seconds
+        :param error: True if the call raised
+        :param rows: Number of rows returned by the call
+        """
+        with self._lock:
+            stats = self._operations.get((kind, name))
+            if stats is None:
+                stats = self._operations[(kind, name)] = OperationStats()
+            stats.add(elapsed, error, rows)
+
+    def add_rows(self, kind, name, rows):
+        """
+        Adds fetched or affected rows to an operation.
+        """
+        with self._lock:
+            stats = self._operations.get((kind, name))
+            if stats is not None:
+                stats.rows += rows
+
+    def snapshot(self):
+        """
+        :return: List of dictionaries (kind, name and the OperationStats values),
+                 slowest total time first
+        """
+        with self._lock:
+            items = [(kind, name, stats.total_time, stats.to_dict())
+                     for (kind, name), stats in self._operations.items()]
+        items.sort(key=lambda item: item[2], reverse=True)
+        return [dict(kind=kind, name=name, **values) for kind, name, _, values in items]
+
+    def reset(self):
+        with self._lock:
+            self._operations.clear()
+            self.started = time.time()
+
+    def export_json(self, path, extra=None):
+        """
+        Writes the current statistics to a JSON file.
+
+        :param path: Output file
+        :param extra: Optional dictionary of additional sections (e.g. pool statistics)
+        """
+        data = {
+            "since": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started)),
+            "exported": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "slow_query_ms": SLOW_QUERY_MS,
+            "operations": self.snapshot(),
+        }
+        data.update(extra or {})
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+
+
+# Shared metrics of the application
+metrics = Metrics()
+
+
+def normalize_sql(sql):
+    """
+    Collapses whitespace and comments of a statement so that all executions
+    of the same statement are counted together.
+    """
+    sql = re.sub(r"--[^\n]*", " ", sql)
+    return re.sub(r"\s+", " ", sql).strip()
+
+
+class InstrumentedCursor:
+    """
+    Cursor wrapper timing execute()/executemany() and counting fetched rows.
+    All other attributes are passed through to the pyodbc cursor.
+    """
+    def __init__(self, cursor):
+        object.__setattr__(self, "_cursor", cursor)
+        object.__setattr__(self, "_statement", None)
+
+    def execute(self, sql, *params):
+        self._run(sql, params, self._cursor.execute, sql, *params)
+        return self
+
+    def executemany(self, sql, seq_of_params):
+        seq_of_params = list(seq_of_params)
+        self._run(sql, seq_of_params, self._cursor.executemany, sql, seq_of_params)
+        metrics.add_rows("query", self._statement, len(seq_of_params))
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        if row is not None:
+            self._count(1)
+        return row
+
+    def fetchmany(self, size=None):
+        rows = self._cursor.fetchmany(size) if size is not None else self._cursor.fetchmany()
+        self._count(len(rows))
+        return rows
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        self._count(len(rows))
+        return rows
+
+    def __iter__(self):
+        for row in self._cursor:
+            self._count(1)
+            yield row
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __setattr__(self, name, value):
+        # e.g. fast_executemany must be set on the real cursor
+        setattr(self._cursor, name, value)
+
+    def _run(self, sql, params, fn, *args):
+        statement = normalize_sql(sql)
+        object.__setattr__(self, "_statement", statement)
+        start = time.perf_counter()
+        error = False
+        try:
+            fn(*args)
+        except Exception:
+            error = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            metrics.record("query", statement, elapsed, error)
+            if elapsed * 1000 >= SLOW_QUERY_MS:
+                shown = repr(params)
+                if len(shown) > MAX_LOGGED_PARAMS:
+                    shown = shown[:MAX_LOGGED_PARAMS] + "..."
+                logging.warning("Slow query (%.0f ms): %s -- params: %s", elapsed * 1000, statement, shown)
+
+    def _count(self, rows):
+        if self._statement is not None:
+            metrics.add_rows("query", self._statement, rows)
+
+
+class InstrumentedConnection:
+    """
+    Connection wrapper handing out InstrumentedCursors.
+    All other attributes are passed through to the pyodbc connection.
+    """
+    def __init__(self, con):
+        object.__setattr__(self, "_con", con)
+
+    def cursor(self):
+        return InstrumentedCursor(self._con.cursor())
+
+    def __getattr__(self, name):
+        return getattr(self._con, name)
+
+    def __setattr__(self, name, value):
+        # e.g. autocommit must be set on the real connection
+        setattr(self._con, name, value)
+
+
+def instrumented(connect):
+    """
+    Wraps a connection factory so that its connections are instrumented.
+    """
+    @functools.wraps(connect)
+    def wrapper():
+        return InstrumentedConnection(connect())
+    return wrapper
+
+
+def timed(kind, name):
+    """
+    Decorator recording the duration of every call of a function.
+    Generator functions are timed until the generator is exhausted or closed.
+    Returned lists and yielded items are counted as rows.
+
+    :param kind: Operation kind (see Metrics.KINDS)
+    :param name: Operation name
+    """
+    def decorator(fn):
+        if inspect.isgeneratorfunction(fn):
+            @functools.wraps(fn)
+            def gen_wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                error = False
+                rows = 0
+                try:
+                    for item in fn(*args, **kwargs):
+                        rows += 1
+                        yield item
+                except GeneratorExit:
+                    raise
+                except Exception:
+                    error = True
+                    raise
+                finally:
+                    metrics.record(kind, name, time.perf_counter() - start, error, rows)
+            return gen_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            result = None
+            error = False
+            try:
+                result = fn(*args, **kwargs)
+                return result
+            except Exception:
+                error = True
+                raise
+            finally:
+                rows = len(result) if isinstance(result, list) else 0
+                metrics.record(kind, name, time.perf_counter() - start, error, rows)
+        return wrapper
+    return decorator
+
+
+def instrument_class(cls):
+    """
+    Wraps all public methods defined in a class with timed("repository", ...).
+    Static and class methods are left alone.
+    """
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith("_") or not inspect.isfunction(value):
+            continue
+        setattr(cls, attr, timed("repository", f"{cls.__name__}.{attr}")(value))
+    return cls
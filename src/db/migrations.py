@@ -0,0 +1,237 @@
+"""
+Versioned schema migrations.
+
+Migration scripts live in db/migrations and are named
+NNNN_description.sql; they are applied in version order and every
+applied version is recorded in the schema_version table, so running the
+migrations again only applies new scripts. Scripts may contain several
+batches separated by lines with a single "go" (as in SSMS).
+
+Scripts run in a transaction unless their first line is
+"-- migration: no-transaction" (needed for statements such as
+ALTER DATABASE); such scripts must be safe to run again.
+
+Usage (from the project root):
+
+    python -m src.db.migrations            apply all pending migrations
+    python -m src.db.migrations --status   list applied and pending migrations
+    python -m src.db.migrations --target 2 apply migrations up to version 2
+"""
+import argparse
+import hashlib
+import logging
+import os
+import re
+import sys
+
+from src.config.config import BASE_DIR
+from src.db.connection import DatabaseConnectionError, get_connection
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(BASE_DIR), "db", "migrations")
+
+_FILE_PATTERN = re.compile(r"^(\d+)_(\w+)\.sql$")
+_BATCH_SEPARATOR = re.compile(r"^\s*go\s*;?\s*$", re.IGNORECASE | re.MULTILINE)
+_NO_TRANSACTION_MARKER = "-- migration: no-transaction"
+
+_CREATE_VERSION_TABLE = """
+    if object_id('schema_version', 'U') is null
+        create table schema_version (
+            version int primary key,
+            name varchar(200) not null,
+            checksum char(64) not null,
+            applied_at datetime2 not null default sysutcdatetime()
+        )
+"""
+
+
+class MigrationError(Exception):
+    """Raised when a migration script is invalid or fails to apply."""
+    pass
+
+
+class Migration:
+    """
+    One migration script.
+
+    Attributes:
+        version (int): Version number taken from the file name
+        name (str): Description part of the file name
+        path (str): Path of the .sql file
+    """
+    def __init__(self, version, name, path):
+        self.version = version
+        self.name = name
+        self.path = path
+
+    def read(self):
+        with open(self.path, encoding="utf-8") as f:
+            return f.read()
+
+    @property
+    def checksum(self):
+        """
+        SHA-256 of the script with normalized line endings.
+        """
+        return hashlib.sha256(self.read().replace("\r\n", "\n").encode("utf-8")).hexdigest()
+
+    @property
+    def transactional(self):
+        """
+        False if the script is marked to run without a transaction.
+        """
+        first_line = self.read().lstrip().split("\n", 1)[0]
+        return first_line.strip().lower() != _NO_TRANSACTION_MARKER
+
+    def batches(self):
+        """
+        :return: List of non-empty SQL batches of the script
+        """
+        return [batch.strip() for batch in _BATCH_SEPARATOR.split(self.read()) if batch.strip()]
+
+    def __repr__(self):
+        return f"Migration({self.version}, {self.name!r})"
+
+
+def discover(directory=MIGRATIONS_DIR):
+    """
+    Finds migration scripts in a directory.
+
+    :param directory: Directory with NNNN_description.sql files
+    :return: List of Migrations ordered by version
+    :raises MigrationError: If two scripts share a version number
+    """
+    migrations = {}
+    for filename in sorted(os.listdir(directory)):
+        match = _FILE_PATTERN.match(filename)
+        if not match:
+            continue
+        version = int(match.group(1))
+        if version in migrations:
+            raise MigrationError(f"Duplicate migration version {version}: {filename}")
+        migrations[version] = Migration(version, match.group(2), os.path.join(directory, filename))
+    return [migrations[v] for v in sorted(migrations)]
+
+
+class MigrationRunner:
+    """
+    Applies pending migrations to an existing database.
+
+    Each migration runs in its own transaction together with the insert of
+    its schema_version row, so a failing script leaves the database at the
+    previous version (scripts marked no-transaction run in autocommit mode
+    and are recorded after their last batch). The database never has to be
+    recreated.
+    """
+    def __init__(self, connect=get_connection, directory=MIGRATIONS_DIR):
+        """
+        :param connect: Callable returning a new database connection
+        :param directory: Directory with the migration scripts
+        """
+        self.connect = connect
+        self.directory = directory
+
+    def applied(self, con):
+        """
+        :return: Dictionary version -> checksum of the applied migrations
+        """
+        cur = con.cursor()
+        cur.execute(_CREATE_VERSION_TABLE)
+        con.commit()
+        cur.execute("select version, checksum from schema_version")
+        return {row[0]: row[1] for row in cur.fetchall()}
+
+    def status(self):
+        """
+        :return: List of tuples (Migration, state) where state is
+                 "applied", "pending" or "changed" (applied, but the script
+                 was modified afterwards)
+        """
+        con = self.connect()
+        try:
+            applied = self.applied(con)
+        finally:
+            con.close()
+        result = []
+        for migration in discover(self.directory):
+            if migration.version not in applied:
+                state = "pending"
+            elif applied[migration.version] != migration.checksum:
+                state = "changed"
+            else:
+                state = "applied"
+            result.append((migration, state))
+        return result
+
+    def migrate(self, target=None):
+        """
+        Applies all pending migrations up to `target` in version order.
+
+        :param target: Highest version to apply (defaults to all)
+        :return: List of applied Migrations
+        :raises MigrationError: If a migration fails (it is rolled back)
+        """
+        con = self.connect()
+        done = []
+        try:
+            applied = self.applied(con)
+            for migration in discover(self.directory):
+                if target is not None and migration.version > target:
+                    break
+                if migration.version in applied:
+                    if applied[migration.version] != migration.checksum:
+                        logging.warning("Migration %s was modified after it had been applied", migration.path)
+                    continue
+                self._apply(con, migration)
+                done.append(migration)
+        finally:
+            con.close()
+        return done
+
+    def _apply(self, con, migration):
+        logging.info("Applying migration %04d %s", migration.version, migration.name)
+        transactional = migration.transactional
+        if not transactional:
+            con.autocommit = True
+        cur = con.cursor()
+        try:
+            for batch in migration.batches():
+                cur.execute(batch)
+            cur.execute(
+                "insert into schema_version (version, name, checksum) values (?, ?, ?)",
+                (migration.version, migration.name, migration.checksum),
+            )
+            con.commit()
+        except Exception as e:
+            con.rollback()
+            logging.error("Migration %04d %s failed", migration.version, migration.name, exc_info=True)
+            raise MigrationError(f"Migration {migration.version:04d} {migration.name} failed: {e}") from e
+        finally:
+            if not transactional:
+                con.autocommit = False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m src.db.migrations", description="Apply database schema migrations.")
+    parser.add_argument("--status", action="store_true", help="list applied and pending migrations and exit")
+    parser.add_argument("--target", type=int, help="apply migrations up to this version only")
+    args = parser.parse_args(argv)
+
+    runner = MigrationRunner()
+    try:
+        if args.status:
+            for migration, state in runner.status():
+                print(f"{migration.version:04d}  {state:<8} {migration.name}")
+            return 0
+        applied = runner.migrate(target=args.target)
+    except (MigrationError, DatabaseConnectionError) as e:
+        print(e, file=sys.stderr)
+        return 1
+    if applied:
+        print(f"Applied {len(applied)} migration(s): " + ", ".join(f"{m.version:04d}" for m in applied))
+    else:
+        print("Database is up to date.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,37 @@
-from src.db.connection import get_connection
+from src.db.cache import cached, invalidates
+from src.db.repositories.base_repository import BaseRepository
+from src.db.staged_upsert import UpsertTarget
+from src.models.author import Author
 
-class AuthorRepository:
+# Upserted authors are matched by their (unique) email; like the unique constraint,
+# this treats a missing email as one value, so at most one author has none
+AUTHOR_UPSERT = UpsertTarget(
+    "author",
+    [("surname", "nvarchar(4000)"), ("name", "nvarchar(4000)"), ("email", "nvarchar(4000)"), ("is_active", "bit")],
+    keys=("email",),
+    checks=[
+        ("surname is null or surname = ''", "missing 'surname'"),
+        ("name is null or name = ''", "missing 'name'"),
+        ("len(surname) > 50", "surname longer than 50 characters"),
+        ("len(name) > 50", "name longer than 50 characters"),
+        ("len(email) > 200", "email longer than 200 characters"),
+        ("is_active is null", "invalid 'is_active'"),
+    ],
+)
+
+
+def _author_values(author):
+    """
+    Column values of an author dictionary in AUTHOR_UPSERT column order.
+    A missing or empty is_active (e.g. JSON null) means active.
+    """
+    is_active = author.get("is_active")
+    if is_active is None or is_active == "":
+        is_active = True
+    return author.get("surname"), author.get("name"), author.get("email"), int(is_active)
+
+
+class AuthorRepository(BaseRepository):
     """
     Repository class responsible for all database operations
     related to the 'author' table.
@@ -8,16 +39,15 @@ class AuthorRepository:
     This class encapsulates SQL queries and provides a clean
     interface for working with author data.
     """
+    @cached("author")
     def get_all(self, active_only=False):
         """
         Returns a list of authors from the database.
 
         :param active_only: If True, only authors marked as active
                             (is_active = 1) are returned.
-        :return: List of database rows (id, surname, name, email, is_active)
+        :return: List of Authors (id, surname, name, email, is_active)
         """
-        con = get_connection()
-        cur = con.cursor()
         # Base SQL query
         sql = "select id, surname, name, email, is_active from author"
         # Optional filtering of active authors only
@@ -25,42 +55,72 @@ class AuthorRepository:
             sql += " where is_active=1"
         # Sorting authors alphabetically
         sql += " order by surname, name"
-        cur.execute(sql)
-        rows = cur.fetchall()
-        con.close()
-        return rows
+        with self._connection() as con:
+            cur = con.cursor()
+            cur.execute(sql)
+            return [Author.from_row(row) for row in cur.fetchall()]
 
-    def bulk_insert(self, authors):
+    @invalidates("author")
+    def bulk_insert(self, authors, chunk_size=None, atomic=False, progress=None):
         """
-        Inserts multiple authors into the database in a single operation.
+        Inserts multiple authors into the database using the bulk load path.
 
         This method is typically used for importing data
         (e.g. from JSON files).
 
-        :param authors: List of dictionaries with author data.
+        :param authors: Iterable of dictionaries with author data.
                         Expected keys:
                         - surname
                         - name
                         - email
-                        - is_active (optional, defaults to True)
+                        - is_active (optional, missing or null means True)
+        :param chunk_size: Rows sent and committed per chunk
+        :param atomic: If True, all rows are inserted in one transaction
+        :param progress: Optional callable receiving BulkLoadProgress after each chunk
+        :return: Number of inserted authors
+        """
+        rows = (_author_values(a) for a in authors)
+        return self._bulk_insert(
+            "insert into author (surname, name, email, is_active) values (?, ?, ?, ?)",
+            rows, chunk_size=chunk_size, atomic=atomic, progress=progress
+        )
+
+    @invalidates("author")
+    def upsert(self, authors, chunk_size=None, progress=None):
         """
-        con = get_connection()
-        cur = con.cursor()
-        try:
-            # Insert each author separately within one transaction
-            for a in authors:
-                cur.execute(
-                    "insert into author (surname, name, email, is_active) values (?, ?, ?, ?)",
-                    (a.get("surname"), a.get("name"), a.get("email"), int(a.get("is_active", True)))
-                )
-            # Commit transaction if all inserts succeed
-            con.commit()
-        except Exception as e:
-            # Rollback transaction on any error
-            con.rollback()
-            raise e
-        finally:
-            # Always close the database connection
-            con.close()
+        Inserts new authors and updates changed ones, matched by email.
 
+        All rows are staged, validated and deduplicated on the server and
+        merged in one transaction (see staged_upsert.staged_upsert()).
+        Rows with the same email as an earlier row replace it. An author
+        without an email is accepted as in bulk_insert() and matches the
+        existing author without an email, if there is one.
 
+        :param authors: Iterable of (row number, author dictionary) pairs
+                        (keys as in bulk_insert())
+        :param chunk_size: Rows per bulk load chunk
+        :param progress: Optional callable receiving BulkLoadProgress while staging
+        :return: UpsertResult with inserted/updated/skipped/rejected counts
+        """
+        rows = ((row_no, _author_values(a)) for row_no, a in authors)
+        return self._upsert(AUTHOR_UPSERT, rows, chunk_size=chunk_size, progress=progress)
+
+    @invalidates("author")
+    def deactivate(self, author_id):
+        """
+        Marks an author as inactive (e.g. after merging a duplicate author).
+
+        :param author_id: ID of the author
+        """
+        with self._transaction() as con:
+            cur = con.cursor()
+            cur.execute("update author set is_active=0 where id=?", (author_id,))
+
+    def fetch_changes(self, since):
+        """
+        Returns authors inserted, updated or deleted since a change tracking version.
+
+        :param since: Watermark from current_version() or a previous Delta
+        :return: Delta with Authors
+        """
+        return self._fetch_changes("author", Author, since)
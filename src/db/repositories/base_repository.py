@@ -0,0 +1,117 @@
+from contextlib import contextmanager
+
+from src.db import change_tracking
+from src.db.bulk_loader import bulk_load
+from src.db.connection import pooled_connection
+from src.db.instrumentation import instrument_class
+from src.db.staged_upsert import staged_upsert
+
+class BaseRepository:
+    """
+    Common base class for all repositories.
+
+    A repository either works on its own, borrowing a pooled connection
+    and committing per method call, or it is bound to a UnitOfWork,
+    in which case it uses the shared connection and leaves the commit
+    to the unit of work.
+
+    Public methods of all subclasses are timed automatically
+    (see src/db/instrumentation.py).
+    """
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        instrument_class(cls)
+
+    def __init__(self, uow=None):
+        """
+        :param uow: Optional UnitOfWork shared with other repositories
+        """
+        self.uow = uow
+
+    @contextmanager
+    def _connection(self):
+        """
+        Context manager yielding a connection for read-only work.
+        """
+        if self.uow is not None:
+            yield self.uow.connection
+            return
+        with pooled_connection() as con:
+            yield con
+
+    @contextmanager
+    def _transaction(self):
+        """
+        Context manager yielding a connection for write operations.
+
+        Without a unit of work the changes are committed when the block
+        ends and rolled back if it raises. With a unit of work, committing
+        is left to the unit of work.
+        """
+        if self.uow is not None:
+            yield self.uow.connection
+            return
+        with pooled_connection() as con:
+            yield con
+            con.commit()
+
+    def _bulk_insert(self, sql, rows, chunk_size=None, atomic=False, progress=None):
+        """
+        Loads many rows through the shared bulk load path.
+
+        By default every chunk is committed on its own, so a large import
+        does not hold locks and log space until the very end. With
+        atomic=True (or inside a unit of work) all rows are committed
+        together or not at all.
+
+        :param sql: Parameterized INSERT statement
+        :param rows: Iterable of parameter tuples
+        :param chunk_size: Rows per chunk (defaults to [database] bulk_chunk_size)
+        :param atomic: Load all rows in one transaction
+        :param progress: Optional callable receiving BulkLoadProgress
+        :return: Number of rows loaded
+        """
+        if atomic or self.uow is not None:
+            with self._transaction() as con:
+                return bulk_load(con, sql, rows, chunk_size, commit_chunks=False, progress=progress)
+        with pooled_connection() as con:
+            return bulk_load(con, sql, rows, chunk_size, commit_chunks=True, progress=progress)
+
+    def _upsert(self, target, rows, chunk_size=None, progress=None):
+        """
+        Inserts or updates many rows through a staging table in one
+        transaction (see staged_upsert.staged_upsert()).
+
+        :param target: UpsertTarget describing the table
+        :param rows: Iterable of (row number, value tuple)
+        :param chunk_size: Rows per bulk load chunk
+        :param progress: Optional callable receiving BulkLoadProgress while staging
+        :return: UpsertResult
+        """
+        with self._transaction() as con:
+            return staged_upsert(con, target, rows, chunk_size, progress)
+
+    def current_version(self):
+        """
+        Returns the current change tracking version, the first watermark
+        for fetch_changes(). Read it before loading the data it belongs to.
+
+        :raises ChangeTrackingUnavailable: If change tracking is not enabled
+        """
+        with self._connection() as con:
+            return change_tracking.current_version(con)
+
+    def _fetch_changes(self, table, model, since, match=None, match_params=()):
+        """
+        Returns the rows of a table changed since a watermark
+        (see change_tracking.fetch_changes()).
+
+        :param model: Model class (its FIELDS are the selected columns) or a tuple of column names
+        :return: Delta with changed rows as model instances (or tuples)
+        """
+        if isinstance(model, tuple):
+            columns, row_factory = model, tuple
+        else:
+            columns, row_factory = model.FIELDS, model.from_row
+        with self._connection() as con:
+            return change_tracking.fetch_changes(con, table, columns, since, match, match_params, row_factory)
@@ -1,6 +1,44 @@
-from src.db.connection import get_connection
+import json
 
-class BookRepository:
+from src.db.bulk_loader import DEFAULT_CHUNK_SIZE, chunked
+from src.db.repositories.base_repository import BaseRepository
+from src.models.book import Book
+from src.models.book_columns import BookColumns
+
+# Sortable columns of BookRepository.search and their position in a book row
+SORT_COLUMNS = {"id": 0, "name": 1, "publishment_date": 3, "rating": 4}
+CRITERIA_KEYS = {"name", "name_match", "publisher_id", "binding", "min_rating", "max_rating", "date_from", "date_to"}
+
+
+def _keyset_clause(column, key, descending, inclusive):
+    """
+    Builds the WHERE condition selecting rows that follow `key` in the order
+    (column, id), both ascending or both descending.
+
+    SQL Server sorts NULL before any value in ascending order and after
+    any value in descending order; nullable sort columns are handled
+    accordingly.
+
+    :return: Tuple (SQL condition, parameters)
+    """
+    value, row_id = key
+    cmp = "<" if descending else ">"
+    id_cmp = cmp + "=" if inclusive else cmp
+    if column == "id":
+        return f"id {id_cmp} ?", [row_id]
+    if value is None:
+        if descending:
+            # NULLs come last: only further NULL rows follow
+            return f"({column} is null and id {id_cmp} ?)", [row_id]
+        # NULLs come first: further NULL rows and all non-NULL rows follow
+        return f"(({column} is null and id {id_cmp} ?) or {column} is not null)", [row_id]
+    condition = f"{column} {cmp} ? or ({column} = ? and id {id_cmp} ?)"
+    if descending:
+        condition += f" or {column} is null"
+    return f"({condition})", [value, value, row_id]
+
+
+class BookRepository(BaseRepository):
     """
     Repository class responsible for all database operations
     related to the 'book' table.
@@ -12,37 +50,175 @@ class BookRepository:
         """
         Returns all books stored in the database.
 
-        :return: List of database rows:
-                 (id, name, publisher, publishment_date, rating, binding)
-        """
-        con = get_connection()
-        cur = con.cursor()
-        cur.execute("""
-            select id, name, publisher, publishment_date, rating, binding
-            from book
-            order by name
-        """)
-        rows = cur.fetchall()
-        con.close()
+        :return: List of Books
+        """
+        with self._connection() as con:
+            cur = con.cursor()
+            cur.execute("""
+                select id, name, publisher, publishment_date, rating, binding
+                from book
+                order by name
+            """)
+            return [Book.from_row(row) for row in cur.fetchall()]
+
+    def fetch_page(self, after=None, before=None, limit=200, inclusive=False):
+        """
+        Returns one page of books ordered by name using keyset (seek) pagination.
+
+        Instead of OFFSET, the page continues from the sort key of a row
+        the caller already has, so the cost of a page does not depend on
+        how deep into the table it is.
+
+        :param after: (name, id) of the last row of the previous page;
+                      rows sorting after it are returned
+        :param before: (name, id) of the first row of the next page;
+                       rows sorting before it are returned (still in ascending order)
+        :param limit: Maximum number of rows in the page
+        :param inclusive: Also return the row with exactly the `after`/`before` key
+        :return: List of Books (id, name, publisher, publishment_date, rating, binding)
+        """
+        return self.search(after=after, before=before, limit=limit, inclusive=inclusive)
+
+    def search(self, criteria=None, sort="name", descending=False, after=None, before=None,
+               limit=200, inclusive=False):
+        """
+        Searches books with filtering, sorting and keyset pagination done by SQL Server.
+
+        Supported criteria keys (all optional):
+        - name: Text the book name starts with (or contains, see name_match)
+        - name_match: "prefix" (default, can use the name index) or "contains"
+        - publisher_id: Publisher ID
+        - binding: Binding type
+        - min_rating / max_rating: Inclusive rating range
+        - date_from / date_to: Inclusive publishment date range
+
+        Pages are continued from the sort key of a known row, see sort_key().
+
+        :param criteria: Dictionary with filter values
+        :param sort: Sort column: name, publishment_date, rating or id
+        :param descending: Sort in descending order
+        :param after: Sort key of the last row of the previous page
+        :param before: Sort key of the first row of the next page
+                       (rows are still returned in sort order)
+        :param limit: Maximum number of rows in the page
+        :param inclusive: Also return the row with exactly the `after`/`before` key
+        :return: List of Books (id, name, publisher, publishment_date, rating, binding)
+        :raises ValueError: For unknown criteria or sort columns
+        """
+        if sort not in SORT_COLUMNS:
+            raise ValueError(f"Unknown sort column: {sort}")
+        where, params = self._filter_clause(criteria or {})
+
+        key = after if after is not None else before
+        # Reading backwards from `before` means walking the sort order in reverse
+        backwards = before is not None and after is None
+        order_desc = descending != backwards
+        if key is not None:
+            clause, key_params = _keyset_clause(sort, key, order_desc, inclusive)
+            where.append(clause)
+            params += key_params
+
+        direction = "desc" if order_desc else "asc"
+        order_by = f"id {direction}" if sort == "id" else f"{sort} {direction}, id {direction}"
+        sql = "select top (?) id, name, publisher, publishment_date, rating, binding from book"
+        if where:
+            sql += " where " + " and ".join(where)
+        sql += " order by " + order_by
+
+        with self._connection() as con:
+            cur = con.cursor()
+            cur.execute(sql, [limit] + params)
+            rows = [Book.from_row(row) for row in cur.fetchall()]
+        if backwards:
+            rows.reverse()
         return rows
 
+    def fetch_columns(self, criteria=None, sort="name", descending=False, batch_size=5000):
+        """
+        Loads all books matching the criteria into a column-oriented
+        BookColumns container (for large result sets, e.g. reports or exports).
+
+        Rows are streamed from the cursor in batches and packed into the
+        columns directly, so no list of row objects is held at any time.
+
+        :param criteria: Dictionary with filter values (see search())
+        :param sort: Sort column: name, publishment_date, rating or id
+        :param descending: Sort in descending order
+        :param batch_size: Number of rows fetched per round trip
+        :return: BookColumns
+        :raises ValueError: For unknown criteria or sort columns
+        """
+        if sort not in SORT_COLUMNS:
+            raise ValueError(f"Unknown sort column: {sort}")
+        where, params = self._filter_clause(criteria or {})
+        direction = "desc" if descending else "asc"
+        order_by = f"id {direction}" if sort == "id" else f"{sort} {direction}, id {direction}"
+        sql = "select id, name, publisher, publishment_date, rating, binding from book"
+        if where:
+            sql += " where " + " and ".join(where)
+        sql += " order by " + order_by
+
+        columns = BookColumns()
+        with self._connection() as con:
+            cur = con.cursor()
+            cur.execute(sql, params)
+            while True:
+                rows = cur.fetchmany(batch_size)
+                if not rows:
+                    break
+                columns.extend(rows)
+        return columns
+
+    @staticmethod
+    def sort_key(row, sort="name"):
+        """
+        Returns the keyset pagination key of a book row for a sort column.
+
+        :param row: Book row as returned by search()
+        :param sort: Sort column used for the search
+        :return: Tuple (sort value, id)
+        """
+        return row[SORT_COLUMNS[sort]], row[0]
+
+    @staticmethod
+    def _filter_clause(criteria):
+        unknown = set(criteria) - CRITERIA_KEYS
+        if unknown:
+            raise ValueError(f"Unknown search criteria: {', '.join(sorted(unknown))}")
+        where, params = [], []
+        name = criteria.get("name")
+        if name:
+            # Escape LIKE wildcards so the text is matched literally
+            pattern = name.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_").replace("[", "\\[")
+            if criteria.get("name_match", "prefix") == "contains":
+                pattern = "%" + pattern
+            where.append("name like ? escape '\\'")
+            params.append(pattern + "%")
+        for key, condition in (("publisher_id", "publisher = ?"), ("binding", "binding = ?"),
+                               ("min_rating", "rating >= ?"), ("max_rating", "rating <= ?"),
+                               ("date_from", "publishment_date >= ?"), ("date_to", "publishment_date <= ?")):
+            value = criteria.get(key)
+            if value is not None and value != "":
+                where.append(condition)
+                params.append(value)
+        return where, params
+
     def fetch_by_id(self, book_id):
         """
         Fetches a single book by its ID.
 
         :param book_id: ID of the book to fetch
-        :return: One database row or None if not found
-        """
-        con = get_connection()
-        cur = con.cursor()
-        cur.execute("""
-            select id, name, publisher, publishment_date, rating, binding
-            from book
-            where id=?
-        """, (book_id,))
-        row = cur.fetchone()
-        con.close()
-        return row
+        :return: Book or None if not found
+        """
+        with self._connection() as con:
+            cur = con.cursor()
+            cur.execute("""
+                select id, name, publisher, publishment_date, rating, binding
+                from book
+                where id=?
+            """, (book_id,))
+            row = cur.fetchone()
+            return Book.from_row(row) if row else None
 
     def insert(self, name, publisher_id, publishment_date, rating, binding):
         """
@@ -57,17 +233,15 @@ class BookRepository:
         :param binding: Type of binding (hardcover, paperback, ebook)
         :return: ID of the newly created book
         """
-        con = get_connection()
-        cur = con.cursor()
-        cur.execute("""
-            insert into book (name, publisher, publishment_date, rating, binding)
-            output inserted.id
-            values (?, ?, ?, ?, ?)
-        """, (name, publisher_id, publishment_date, rating, binding))
-        book_id = cur.fetchone()[0]
-        con.commit()
-        con.close()
-        return book_id
+        with self._transaction() as con:
+            cur = con.cursor()
+            cur.execute("""
+                insert into book (name, publisher, publishment_date, rating, binding)
+                output inserted.id
+                values (?, ?, ?, ?, ?)
+            """, (name, publisher_id, publishment_date, rating, binding))
+            book_id = cur.fetchone()[0]
+            return book_id
 
     def update(self, book_id, name, publisher_id, publishment_date, rating, binding):
         """
@@ -80,15 +254,13 @@ class BookRepository:
         :param rating: Updated rating
         :param binding: Updated binding type
         """
-        con = get_connection()
-        cur = con.cursor()
-        cur.execute("""
-            update book
-            set name=?, publisher=?, publishment_date=?, rating=?, binding=?
-            where id=?
-        """, (name, publisher_id, publishment_date, rating, binding, book_id))
-        con.commit()
-        con.close()
+        with self._transaction() as con:
+            cur = con.cursor()
+            cur.execute("""
+                update book
+                set name=?, publisher=?, publishment_date=?, rating=?, binding=?
+                where id=?
+            """, (name, publisher_id, publishment_date, rating, binding, book_id))
 
     def delete(self, book_id):
         """
@@ -99,11 +271,61 @@ class BookRepository:
 
         :param book_id: ID of the book to delete
         """
-        con = get_connection()
-        cur = con.cursor()
-        # Remove relations between book and authors
-        cur.execute("delete from book_author where book_id=?", (book_id,))
-        # Remove the book itself
-        cur.execute("delete from book where id=?", (book_id,))
-        con.commit()
-        con.close()
+        with self._transaction() as con:
+            cur = con.cursor()
+            # Remove relations between book and authors
+            cur.execute("delete from book_author where book_id=?", (book_id,))
+            # Remove the book itself
+            cur.execute("delete from book where id=?", (book_id,))
+
+    def delete_many(self, book_ids, chunk_size=None):
+        """
+        Deletes many books and their author relationships in one transaction.
+
+        The IDs are sent in chunks as JSON parameters and collected on the
+        server in a temporary table (OPENJSON), then the book_author rows
+        and the books are removed with one set-based DELETE each, so the
+        number of statements does not grow with the number of books.
+
+        :param book_ids: Iterable of book IDs
+        :param chunk_size: IDs sent per round trip (defaults to [database] bulk_chunk_size)
+        :return: Number of deleted books
+        """
+        book_ids = {int(book_id) for book_id in book_ids}
+        if not book_ids:
+            return 0
+        with self._transaction() as con:
+            cur = con.cursor()
+            # Temporary tables live as long as the (pooled) connection; the table is
+            # created inside the transaction, so a rollback removes it as well
+            cur.execute("drop table if exists #delete_book_ids")
+            cur.execute("create table #delete_book_ids (id int primary key)")
+            for chunk in chunked(sorted(book_ids), chunk_size or DEFAULT_CHUNK_SIZE):
+                cur.execute(
+                    "insert into #delete_book_ids (id) select cast(value as int) from openjson(?)",
+                    (json.dumps(chunk),),
+                )
+            # Remove relations between the books and their authors
+            cur.execute("delete ba from book_author ba join #delete_book_ids d on d.id = ba.book_id")
+            # Remove the books themselves
+            cur.execute("delete b from book b join #delete_book_ids d on d.id = b.id")
+            deleted = cur.rowcount
+            cur.execute("drop table #delete_book_ids")
+            return deleted
+
+    def fetch_changes(self, since, criteria=None):
+        """
+        Returns books inserted, updated or deleted since a change tracking version.
+
+        Changed books that do not match the search criteria (anymore) are
+        reported as removed, so the result can be applied to a filtered list.
+
+        :param since: Watermark from current_version() or a previous Delta
+        :param criteria: Search criteria as for search()
+        :return: Delta with Books
+        """
+        where, params = self._filter_clause(criteria or {})
+        return self._fetch_changes(
+            "book", Book, since,
+            match=" and ".join(f"t.{condition}" for condition in where) or None, match_params=params,
+        )
@@ -1,6 +1,8 @@
-from src.db.connection import get_connection
+import json
 
-class BookAuthorRepository:
+from src.db.repositories.base_repository import BaseRepository
+
+class BookAuthorRepository(BaseRepository):
     """
     Repository class handling the many-to-many relationship
     between books and authors (table: book_author).
@@ -15,14 +17,11 @@ class BookAuthorRepository:
         :param book_id: ID of the book
         :return: List of author IDs
         """
-        con = get_connection()
-        try:
+        with self._connection() as con:
             cur = con.cursor()
             cur.execute("select author_id from book_author where book_id=? and is_active=1", (book_id,))
             rows = cur.fetchall()
             return [r[0] for r in rows]
-        finally:
-            con.close()
 
     def assign_authors(self, book_id, author_ids, overwrite=True):
         """
@@ -36,28 +35,58 @@ class BookAuthorRepository:
         :param author_ids: List of author IDs to assign
         :param overwrite: Whether to replace existing assignments
         """
-        con = get_connection()
-        try:
+        self.assign_authors_batch({book_id: author_ids}, overwrite=overwrite)
+
+    def assign_authors_batch(self, assignments, overwrite=True):
+        """
+        Assigns authors to many books with a single MERGE statement.
+
+        The book/author pairs are sent as one JSON parameter and expanded
+        on the server with OPENJSON, so the number of round trips does not
+        depend on the number of books or authors. In one statement the MERGE:
+        - reactivates existing inactive relationships,
+        - inserts missing relationships,
+        - deactivates other active authors of the listed books (if overwrite is True).
+
+        :param assignments: Mapping of book ID -> list of author IDs
+        :param overwrite: Whether to replace existing assignments of the listed books
+        """
+        if not assignments:
+            return
+        book_ids = [int(b) for b in assignments]
+        pairs = [[int(b), int(a)] for b, author_ids in assignments.items() for a in author_ids]
+
+        # Only relationships of the listed books are considered by the MERGE
+        sql = """
+            with target as (
+                select book_id, author_id, is_active
+                from book_author
+                where book_id in (select cast(value as int) from openjson(?))
+            )
+            merge target as t
+            using (
+                select distinct book_id, author_id
+                from openjson(?) with (book_id int '$[0]', author_id int '$[1]')
+            ) as s
+            on t.book_id = s.book_id and t.author_id = s.author_id
+            -- Reactivate existing relationship
+            when matched and isnull(t.is_active, 0) = 0 then
+                update set is_active = 1
+            -- Create new relationship
+            when not matched by target then
+                insert (book_id, author_id, is_active) values (s.book_id, s.author_id, 1)
+        """
+        if overwrite:
+            # Deactivate current authors that are not in the new list
+            sql += """
+            when not matched by source and t.is_active = 1 then
+                update set is_active = 0
+            """
+        sql += ";"
+
+        with self._transaction() as con:
             cur = con.cursor()
-            # Deactivate all current authors if overwrite is enabled
-            if overwrite:
-                cur.execute("update book_author set is_active=0 where book_id=?", (book_id,))
-            for aid in author_ids:
-                # Check if relationship already exists
-                cur.execute("select id from book_author where book_id=? and author_id=?", (book_id, aid))
-                row = cur.fetchone()
-                if row:
-                    # Reactivate existing relationship
-                    cur.execute("update book_author set is_active=1 where id=?", (row[0],))
-                else:
-                    # Create new relationship
-                    cur.execute("insert into book_author (book_id, author_id, is_active) values (?,?,1)", (book_id, aid))
-            con.commit()
-        except Exception as e:
-            con.rollback()
-            raise e
-        finally:
-            con.close()
+            cur.execute(sql, (json.dumps(book_ids), json.dumps(pairs)))
 
     def deactivate_authors(self, book_id):
         """
@@ -65,16 +94,9 @@ class BookAuthorRepository:
 
         :param book_id: ID of the book
         """
-        con = get_connection()
-        try:
+        with self._transaction() as con:
             cur = con.cursor()
             cur.execute("update book_author set is_active=0 where book_id=?", (book_id,))
-            con.commit()
-        except Exception as e:
-            con.rollback()
-            raise e
-        finally:
-            con.close()
 
     def deactivate_authors_for_author(self, book_id, author_id):
         """
@@ -85,13 +107,75 @@ class BookAuthorRepository:
         :param book_id: ID of the book
         :param author_id: ID of the author to deactivate
         """
-        con = get_connection()
-        cur = con.cursor()
-        try:
+        with self._transaction() as con:
+            cur = con.cursor()
             cur.execute(
                 "update book_author set is_active=0 where book_id=? and author_id=? and is_active=1",
                 (book_id, author_id)
             )
-            con.commit()
-        finally:
-            con.close()
\ No newline at end of file
+
+    def transfer_all(self, from_author_id, to_author_id):
+        """
+        Transfers all books of one author to another author with a single
+        MERGE statement (e.g. when merging duplicate authors).
+
+        For every book the source author is actively assigned to:
+        - the target author is assigned, or reactivated if a deactivated
+          relationship exists; books the target author already has are left as they are,
+        - the source author's relationship is deactivated.
+
+        :param from_author_id: ID of the author whose books are transferred
+        :param to_author_id: ID of the author receiving the books
+        :return: Dictionary with the number of "transferred" books and of
+                 books where the target was "already_author"
+        :raises ValueError: If both IDs are the same
+        """
+        from_author_id, to_author_id = int(from_author_id), int(to_author_id)
+        if from_author_id == to_author_id:
+            raise ValueError("Cannot transfer books of an author to the same author.")
+
+        # The target holds the source and target relationships of the source author's books
+        sql = """
+            with source_books as (
+                select distinct book_id
+                from book_author
+                where author_id = ? and is_active = 1
+            ),
+            target as (
+                select book_id, author_id, is_active
+                from book_author
+                where author_id in (?, ?) and book_id in (select book_id from source_books)
+            )
+            merge target as t
+            using source_books as s
+            on t.book_id = s.book_id and t.author_id = ?
+            -- Reactivate the target author's earlier relationship
+            when matched and isnull(t.is_active, 0) = 0 then
+                update set is_active = 1
+            -- Assign the target author
+            when not matched by target then
+                insert (book_id, author_id, is_active) values (s.book_id, ?, 1)
+            -- Deactivate the source author (never matched, its author_id differs)
+            when not matched by source and t.author_id = ? and t.is_active = 1 then
+                update set is_active = 0
+            output inserted.book_id, inserted.author_id;
+        """
+        with self._transaction() as con:
+            cur = con.cursor()
+            cur.execute(sql, (from_author_id, from_author_id, to_author_id, to_author_id, to_author_id, from_author_id))
+            changes = cur.fetchall()
+
+        # Counted in distinct books: an author may have several link rows for one book
+        transferred = {book_id for book_id, author_id in changes if author_id == from_author_id}
+        assigned = {book_id for book_id, author_id in changes if author_id == to_author_id}
+        return {"transferred": len(transferred), "already_author": len(transferred - assigned)}
+
+    def fetch_changes(self, since):
+        """
+        Returns book/author relationships inserted, updated or deleted
+        since a change tracking version.
+
+        :param since: Watermark from current_version() or a previous Delta
+        :return: Delta with rows (id, book_id, author_id, is_active)
+        """
+        return self._fetch_changes("book_author", ("id", "book_id", "author_id", "is_active"), since)
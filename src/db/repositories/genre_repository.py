@@ -1,31 +1,54 @@
-from src.db.connection import get_connection
+from src.db.repositories.base_repository import BaseRepository
+from src.db.staged_upsert import UpsertTarget
 
-class GenreRepository:
+# Genres only have a name: known names are skipped, new ones inserted
+GENRE_UPSERT = UpsertTarget(
+    "genre",
+    [("name", "nvarchar(4000)")],
+    keys=("name",),
+    checks=[
+        ("name is null or name = ''", "missing 'name'"),
+        ("len(name) > 50", "name longer than 50 characters"),
+    ],
+)
+
+class GenreRepository(BaseRepository):
     """
     Repository class responsible for database operations
     related to book genres (table: genre).
     """
 
-    def bulk_insert(self, genres):
+    def bulk_insert(self, genres, chunk_size=None, atomic=False, progress=None):
         """
-        Inserts multiple genres into the database in a single transaction.
+        Inserts multiple genres into the database using the bulk load path.
 
         This method is typically used for bulk imports
         (e.g. from CSV or external data sources).
 
         :param genres: Iterable of dictionaries containing genre data.
                        Expected key: "name"
+        :param chunk_size: Rows sent and committed per chunk
+        :param atomic: If True, all rows are inserted in one transaction
+        :param progress: Optional callable receiving BulkLoadProgress after each chunk
+        :return: Number of inserted genres
+        """
+        rows = ((g["name"],) for g in genres)
+        return self._bulk_insert(
+            "insert into genre (name) values (?)",
+            rows, chunk_size=chunk_size, atomic=atomic, progress=progress
+        )
+
+    def upsert(self, genres, chunk_size=None, progress=None):
+        """
+        Inserts genres whose name does not exist yet.
+
+        All rows are staged, validated and deduplicated on the server and
+        merged in one transaction (see staged_upsert.staged_upsert()).
+
+        :param genres: Iterable of (row number, genre dictionary) pairs
+        :param chunk_size: Rows per bulk load chunk
+        :param progress: Optional callable receiving BulkLoadProgress while staging
+        :return: UpsertResult with inserted/skipped/rejected counts
         """
-        con = get_connection()
-        try:
-            cur = con.cursor()
-            for g in genres:
-                cur.execute("insert into genre (name) values (?)", (g["name"],))
-            con.commit()
-        except Exception as e:
-            # Roll back all inserts if any error occurs
-            con.rollback()
-            raise
-        finally:
-            # Roll back all inserts if any error occurs
-            con.close()
\ No newline at end of file
+        rows = ((row_no, (g.get("name"),)) for row_no, g in genres)
+        return self._upsert(GENRE_UPSERT, rows, chunk_size=chunk_size, progress=progress)
@@ -1,46 +1,60 @@
-from src.db.connection import get_connection
+from src.db.cache import cached, invalidates
+from src.db.repositories.base_repository import BaseRepository
+from src.db.staged_upsert import UpsertTarget
+from src.models.publisher import Publisher
 
-class PublisherRepository:
+# Upserted publishers are matched by name
+PUBLISHER_UPSERT = UpsertTarget(
+    "publisher",
+    [("name", "nvarchar(4000)"), ("address", "nvarchar(4000)"), ("phone_number", "nvarchar(4000)"),
+     ("email", "nvarchar(4000)"), ("website", "nvarchar(4000)")],
+    keys=("name",),
+    checks=[
+        ("name is null or name = ''", "missing 'name'"),
+        ("len(name) > 50", "name longer than 50 characters"),
+        ("len(address) > 200", "address longer than 200 characters"),
+        ("len(phone_number) > 30", "phone_number longer than 30 characters"),
+        ("len(email) > 200", "email longer than 200 characters"),
+        ("len(website) > 200", "website longer than 200 characters"),
+    ],
+)
+
+class PublisherRepository(BaseRepository):
     """
     Repository class responsible for all database operations
     related to publishers (table: publisher).
     """
+    @cached("publisher")
     def fetch_all(self):
         """
         Fetches all publishers from the database.
 
-        :return: List of database rows containing publisher data.
+        :return: List of Publishers
         """
-        con = get_connection()
-        try:
+        # The borrowed connection is always returned to the pool
+        with self._connection() as con:
             cur = con.cursor()
-            cur.execute("select id, name, address, phone_number, email, website from publisher order_by name")
-            rows = cur.fetchall()
+            cur.execute("select id, name, address, phone_number, email, website from publisher order by name")
+            rows = [Publisher.from_row(row) for row in cur.fetchall()]
             cur.close()
-            con.commit()
             return rows
-        finally:
-            # Ensure the database connection is always closed
-            con.close()
 
+    @cached("publisher")
     def fetch_by_id(self, publisher_id: int):
         """
         Fetches a single publisher by its ID.
 
         :param publisher_id: ID of the publisher
-        :return: Database row with publisher data or None if not found
+        :return: Publisher or None if not found
         """
-        con = get_connection()
-        try:
+        with self._connection() as con:
             cur = con.cursor()
             cur.execute("select id, name, address, phone_number, email, website from publisher where id=?", (publisher_id,))
             row = cur.fetchone()
             cur.close()
-            con.commit()
-            return row
-        finally:
-            con.close()
+            return Publisher.from_row(row) if row else None
 
+    @invalidates("publisher")
     def insert(self, name: str, address: str = None, phone: str = None, email: str = None, website: str = None):
         """
         Inserts a new publisher into the database.
@@ -52,21 +66,18 @@ class PublisherRepository:
         :param website: Website URL (optional)
         :return: ID of the newly created publisher
         """
-        con = get_connection()
-        try:
+        with self._transaction() as con:
             cur = con.cursor()
             cur.execute(
                 "insert into publisher (name, address, phone_number, email, website) values (?, ?, ?, ?, ?)",
                 (name, address, phone, email, website)
             )
-            con.commit()
             # Retrieve ID of the inserted record
             cur.execute("select @@identity")
             publisher_id = cur.fetchone()[0]
             return publisher_id
-        finally:
-            con.close()
 
+    @invalidates("publisher")
     def update(self, publisher_id: int, name: str, address: str = None, phone: str = None, email: str = None, website: str = None):
         """
         Updates an existing publisher.
@@ -78,51 +89,70 @@ class PublisherRepository:
         :param email: New email address (optional)
         :param website: New website URL (optional)
         """
-        con = get_connection()
-        try:
+        with self._transaction() as con:
             cur = con.cursor()
             cur.execute(
                 "update publisher set name=?, address=?, phone_number=?, email=?, website=? where id=?",
                 (name, address, phone, email, website, publisher_id)
             )
-            con.commit()
-        finally:
-            con.close()
 
+    @invalidates("publisher")
     def delete(self, publisher_id: int):
         """
         Deletes a publisher from the database.
 
         :param publisher_id: ID of the publisher to delete
         """
-        con = get_connection()
-        try:
+        with self._transaction() as con:
             cur = con.cursor()
             cur.execute("delete from publisher where id=?", (publisher_id,))
-            con.commit()
-        finally:
-            con.close()
 
-    def bulk_insert(self, publishers):
+    @invalidates("publisher")
+    def bulk_insert(self, publishers, chunk_size=None, atomic=False, progress=None):
         """
-        Inserts multiple publishers in a single transaction.
+        Inserts multiple publishers using the bulk load path.
 
         Used mainly for bulk imports (e.g. CSV files).
 
         :param publishers: Iterable of dictionaries with publisher data.
+        :param chunk_size: Rows sent and committed per chunk
+        :param atomic: If True, all rows are inserted in one transaction
+        :param progress: Optional callable receiving BulkLoadProgress after each chunk
+        :return: Number of inserted publishers
+        """
+        rows = (
+            (p.get("name"), p.get("address"), p.get("phone_number"), p.get("email"), p.get("website"))
+            for p in publishers
+        )
+        return self._bulk_insert(
+            "insert into publisher (name, address, phone_number, email, website) values (?, ?, ?, ?, ?)",
+            rows, chunk_size=chunk_size, atomic=atomic, progress=progress
+        )
+
+    @invalidates("publisher")
+    def upsert(self, publishers, chunk_size=None, progress=None):
+        """
+        Inserts new publishers and updates changed ones, matched by name.
+
+        All rows are staged, validated and deduplicated on the server and
+        merged in one transaction (see staged_upsert.staged_upsert()).
+
+        :param publishers: Iterable of (row number, publisher dictionary) pairs
+        :param chunk_size: Rows per bulk load chunk
+        :param progress: Optional callable receiving BulkLoadProgress while staging
+        :return: UpsertResult with inserted/updated/skipped/rejected counts
+        """
+        rows = (
+            (row_no, (p.get("name"), p.get("address"), p.get("phone_number"), p.get("email"), p.get("website")))
+            for row_no, p in publishers
+        )
+        return self._upsert(PUBLISHER_UPSERT, rows, chunk_size=chunk_size, progress=progress)
+
+    def fetch_changes(self, since):
+        """
+        Returns publishers inserted, updated or deleted since a change tracking version.
+
+        :param since: Watermark from current_version() or a previous Delta
+        :return: Delta with Publishers
         """
-        con = get_connection()
-        cur = con.cursor()
-        try:
-            for p in publishers:
-                cur.execute(
-                    "insert into publisher (name, address, phone_number, email, website) values (?, ?, ?, ?, ?)",
-                    (p.get("name"), p.get("address"), p.get("phone_number"), p.get("email"), p.get("website"))
-                )
-            con.commit()
-        except Exception as e:
-            # Roll back all inserts if any error occurs
-            con.rollback()
-            raise e
-        finally:
-            con.close()
\ No newline at end of file
+        return self._fetch_changes("publisher", Publisher, since)
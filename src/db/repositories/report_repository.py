@@ -1,6 +1,31 @@
-from src.db.connection import get_connection
+from src.db.repositories.base_repository import BaseRepository
 
-class ReportRepository:
+# Rows fetched per round trip when streaming a report
+STREAM_BATCH_SIZE = 1000
+
+# Column names of the publisher report, in select order
+PUBLISHER_REPORT_COLUMNS = ("publisher_name", "books_count", "avg_rating", "active_authors")
+
+# Aggregates come from indexed views maintained by SQL Server (migration 0003)
+PUBLISHER_REPORT_SQL = """
+    select p.name as publisher_name,
+           isnull(s.books_count, 0) as books_count,
+           s.rating_sum / nullif(s.rating_count, 0) as avg_rating,
+           isnull(a.active_authors, 0) as active_authors
+    from publisher p
+    -- Precomputed book count and rating sum/count per publisher
+    left join vw_publisher_book_stats s with (noexpand) on s.publisher = p.id
+    -- One precomputed row per publisher and active author
+    left join (
+        select publisher, count(*) as active_authors
+        from vw_publisher_active_authors with (noexpand)
+        group by publisher
+    ) a on a.publisher = p.id
+    order by p.name
+"""
+
+
+class ReportRepository(BaseRepository):
     """
     Repository class responsible for generating read-only reports
     based on aggregated database data.
@@ -16,41 +41,39 @@ class ReportRepository:
         - Average book rating
         - Number of active authors associated with the publisher
 
-        Data is calculated using Common Table Expressions (CTEs)
-        for clarity and performance.
+        The aggregates are read from the indexed views
+        vw_publisher_book_stats and vw_publisher_active_authors (migration
+        0003), which SQL Server keeps current on every write to book and
+        book_author, so the report does not scan the book tables.
 
         :return: List of database rows with report data
         """
-        sql = """
-            -- Count books and average rating per publisher
-            with publisher_books as (
-                select p.id as publisher_id, p.name as publisher_name, 
-                       count(b.id) as books_count, avg(b.rating) as avg_rating
-                from publisher p
-                left join book b on b.publisher = p.id
-                group by p.id, p.name
-            ),
-            -- Count distinct active authors per publisher
-            publisher_authors as (
-                select p.id as publisher_id, count(distinct a.id) as active_authors
-                from publisher p
-                left join book b on b.publisher = p.id
-                left join book_author ba on ba.book_id = b.id and ba.is_active=1
-                left join author a on a.id = ba.author_id
-                group by p.id
-            )
-            -- Final report combining both aggregations
-            select pb.publisher_name, pb.books_count, pb.avg_rating, pa.active_authors
-            from publisher_books pb
-            left join publisher_authors pa on pa.publisher_id = pb.publisher_id
-            order by pb.publisher_name
-        """
-        con = get_connection()
-        try:
+        # The borrowed connection is always returned to the pool
+        with self._connection() as con:
             cur = con.cursor()
-            cur.execute(sql)
+            cur.execute(PUBLISHER_REPORT_SQL)
             rows = cur.fetchall()
             return rows
-        finally:
-            # Ensure the database connection is always closed
-            con.close()
\ No newline at end of file
+
+    def iter_publisher_report(self, batch_size=STREAM_BATCH_SIZE):
+        """
+        Streams the publisher report row by row.
+
+        Rows are fetched from the server in batches with fetchmany(), so
+        memory use does not depend on the size of the report. The borrowed
+        connection is held until the generator is exhausted or closed.
+
+        :param batch_size: Rows fetched per round trip
+        :return: Generator of database rows (see PUBLISHER_REPORT_COLUMNS)
+        """
+        with self._connection() as con:
+            cur = con.cursor()
+            try:
+                cur.execute(PUBLISHER_REPORT_SQL)
+                while True:
+                    rows = cur.fetchmany(batch_size)
+                    if not rows:
+                        return
+                    yield from rows
+            finally:
+                cur.close()
@@ -0,0 +1,215 @@
+import logging
+import time
+
+from src.db.bulk_loader import bulk_load
+
+# Number of rejected row numbers kept per reason for reporting (counts are always exact)
+MAX_REPORTED_REJECTS = 50
+
+
+class UpsertTarget:
+    """
+    Describes how rows are upserted into one table (see staged_upsert()).
+
+    Attributes:
+        table (str): Target table
+        columns (list): (column name, staging type) pairs in row order;
+                        staging types are wider than the target columns so
+                        too long values are rejected instead of failing the load
+        keys (tuple): Columns identifying an existing row; NULL keys match
+                      each other, as in a unique constraint
+        checks (list): (SQL condition on the staging row, reason) pairs;
+                       rows matching a condition are rejected
+    """
+    def __init__(self, table, columns, keys, checks=()):
+        self.table = table
+        self.columns = list(columns)
+        self.keys = tuple(keys)
+        self.checks = list(checks)
+
+    @property
+    def names(self):
+        return [name for name, _ in self.columns]
+
+    @property
+    def staging_table(self):
+        return f"#upsert_{self.table}"
+
+
+class UpsertResult:
+    """
+    Outcome of a staged upsert.
+
+    Attributes:
+        staged (int): Number of rows loaded into the staging table
+        inserted (int): Number of new rows
+        updated (int): Number of existing rows whose values changed
+        unchanged (int): Number of rows identical to the existing row
+        duplicates (int): Number of rows superseded by a later row with the same key
+        rejected (int): Number of rows failing validation
+        rejected_rows (list): (row number, reason) of the first rejected rows
+        elapsed (float): Seconds the upsert took
+    """
+    def __init__(self):
+        self.staged = 0
+        self.inserted = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.duplicates = 0
+        self.rejected = 0
+        self.rejected_rows = []
+        self.elapsed = 0.0
+
+    @property
+    def skipped(self):
+        """
+        Rows that did not change the target table (unchanged or duplicate).
+        """
+        return self.unchanged + self.duplicates
+
+    def __repr__(self):
+        return (f"UpsertResult(inserted={self.inserted}, updated={self.updated}, "
+                f"skipped={self.skipped}, rejected={self.rejected})")
+
+
+def staged_upsert(con, target, rows, chunk_size=None, progress=None):
+    """
+    Inserts new and updates changed rows of a table in a few set-based statements.
+
+    1. The rows are bulk loaded into a session temp table (fast_executemany).
+    2. Invalid rows are rejected with one DELETE per check.
+    3. Rows with the same key are deduplicated; the last one in the source wins.
+    4. Rows whose key matches more than one existing row are rejected
+       (the key columns need not be unique in the target table).
+    5. One MERGE inserts rows with unknown keys and updates rows whose
+       values differ from the existing row; identical rows are not written.
+
+    The work of step 5 is proportional to the number of changed rows, so
+    re-importing an unchanged feed writes nothing to the target table.
+    The caller owns the transaction; nothing is committed here.
+
+    :param con: Open database connection
+    :param target: UpsertTarget
+    :param rows: Iterable of (row number, value tuple in target.columns order)
+    :param chunk_size: Rows per bulk load chunk
+    :param progress: Optional callable receiving BulkLoadProgress while staging
+    :return: UpsertResult
+    """
+    result = UpsertResult()
+    start = time.perf_counter()
+    staging = target.staging_table
+    names = target.names
+    cur = con.cursor()
+    # Temp tables use the tempdb collation; database_default keeps comparisons with the target consistent
+    column_defs = ", ".join(
+        f"{name} {sql_type} collate database_default null" if "char" in sql_type else f"{name} {sql_type} null"
+        for name, sql_type in target.columns
+    )
+    cur.execute(f"drop table if exists {staging}")
+    cur.execute(f"create table {staging} (row_no int not null primary key, {column_defs})")
+    try:
+        placeholders = ", ".join("?" * (len(names) + 1))
+        result.staged = bulk_load(
+            con,
+            f"insert into {staging} (row_no, {', '.join(names)}) values ({placeholders})",
+            ((row_no, *values) for row_no, values in rows),
+            chunk_size, commit_chunks=False, progress=progress,
+        )
+
+        # Set-based validation: each check removes and reports the rows it rejects
+        for condition, reason in target.checks:
+            _reject(cur, result, f"delete from {staging} output deleted.row_no where {condition}", reason)
+
+        # Keep only the last row of every key
+        keys = ", ".join(target.keys)
+        cur.execute(f"""
+            with ranked as (
+                select row_number() over (partition by {keys} order by row_no desc) as occurrence
+                from {staging}
+            )
+            delete from ranked where occurrence > 1
+        """)
+        result.duplicates = cur.rowcount
+
+        # A MERGE would update every target row with the key; such rows are ambiguous
+        _reject(cur, result, f"""
+            delete s output deleted.row_no
+            from {staging} as s
+            where (select count(*) from {target.table} as t where {_key_match(target)}) > 1
+        """, f"{', '.join(target.keys)} matches more than one existing row")
+
+        result.inserted, result.updated = _merge(cur, target)
+        result.unchanged = result.staged - result.rejected - result.duplicates - result.inserted - result.updated
+    finally:
+        try:
+            cur.execute(f"drop table if exists {staging}")
+        except Exception:
+            # In a doomed transaction (deadlock victim, error 3930) this fails too; the
+            # original error matters and the rollback or session reset drops the table
+            logging.warning("Could not drop %s", staging, exc_info=True)
+        cur.close()
+
+    result.elapsed = time.perf_counter() - start
+    logging.debug("Upserted %s into %s in %.2f s", result, target.table, result.elapsed)
+    return result
+
+
+def _reject(cur, result, delete_sql, reason):
+    """
+    Runs a DELETE outputting the row numbers it removes from the staging
+    table and counts them as rejected.
+    """
+    cur.execute(delete_sql)
+    rejected = [row_no for (row_no,) in cur.fetchall()]
+    result.rejected += len(rejected)
+    room = MAX_REPORTED_REJECTS - len(result.rejected_rows)
+    result.rejected_rows.extend((row_no, reason) for row_no in sorted(rejected)[:max(room, 0)])
+
+
+def _key_match(target):
+    """
+    Join condition of staging rows (alias s) and target rows (alias t).
+    INTERSECT matches NULL keys too (a plain = never does).
+    """
+    return " and ".join(f"exists (select s.{key} intersect select t.{key})" for key in target.keys)
+
+
+def _merge(cur, target):
+    """
+    Merges the deduplicated staging rows into the target table.
+
+    :return: Tuple (inserted, updated), counted in staging rows
+    """
+    staging = target.staging_table
+    names = target.names
+    values = [name for name in names if name not in target.keys]
+    on = _key_match(target)
+    # NOCOUNT makes the action counts the first result set; it is switched
+    # off again because the pooled connection keeps session settings
+    sql = f"""
+        set nocount on;
+        declare @actions table (action nvarchar(10), row_no int);
+        merge {target.table} with (holdlock) as t
+        using {staging} as s
+        on {on}
+    """
+    if values:
+        # EXCEPT compares NULLs as equal, so only rows with a real difference are updated
+        sql += f"""
+        when matched and exists (
+            select {', '.join(f's.{v}' for v in values)}
+            except
+            select {', '.join(f't.{v}' for v in values)}
+        ) then
+            update set {', '.join(f'{v} = s.{v}' for v in values)}
+        """
+    sql += f"""
+        when not matched by target then
+            insert ({', '.join(names)}) values ({', '.join(f's.{n}' for n in names)})
+        output $action, s.row_no into @actions;
+        select action, count(distinct row_no) from @actions group by action;
+        set nocount off;
+    """
+    cur.execute(sql)
+    counts = {action: count for action, count in cur.fetchall()}
+    return counts.get("INSERT", 0), counts.get("UPDATE", 0)
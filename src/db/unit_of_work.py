@@ -0,0 +1,74 @@
+from src.db.connection import get_pool
+
+class UnitOfWork:
+    """
+    Groups several repository operations into one database transaction.
+
+    All repositories created with the same unit of work share its
+    connection and do not commit on their own. The transaction is
+    committed once when the `with` block ends, or rolled back if the
+    block raises, so a multi-step edit is applied completely or not at all.
+
+    Example:
+        with UnitOfWork() as uow:
+            book_id = BookRepository(uow).insert(...)
+            BookAuthorRepository(uow).assign_authors(book_id, author_ids)
+    """
+    def __init__(self, pool=None):
+        """
+        :param pool: ConnectionPool to borrow from (defaults to the application-wide pool)
+        """
+        self._pool = pool or get_pool()
+        self._con = None
+        self._on_commit = []
+
+    @property
+    def connection(self):
+        """
+        The connection shared by all repositories in this unit of work.
+
+        :raises RuntimeError: If used outside of a `with` block
+        """
+        if self._con is None:
+            raise RuntimeError("UnitOfWork is not active; use it in a 'with' block.")
+        return self._con
+
+    def __enter__(self):
+        self._con = self._pool.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        con = self._con
+        try:
+            if exc_type is None:
+                self.commit()
+            else:
+                self.rollback()
+        finally:
+            self._con = None
+            self._pool.release(con)
+        return False
+
+    def commit(self):
+        """
+        Commits the work done so far and runs callbacks registered with on_commit().
+        """
+        self.connection.commit()
+        callbacks, self._on_commit = self._on_commit, []
+        for callback in callbacks:
+            callback()
+
+    def rollback(self):
+        """
+        Rolls back the work done so far and drops pending on_commit() callbacks.
+        """
+        self.connection.rollback()
+        self._on_commit = []
+
+    def on_commit(self, callback):
+        """
+        Registers a callable to run after the transaction is committed.
+
+        :param callback: Callable without arguments
+        """
+        self._on_commit.append(callback)
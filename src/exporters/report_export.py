@@ -0,0 +1,210 @@
+"""
+Streaming export of reports to CSV or JSON Lines files.
+
+Rows are written as they are fetched from the database, so exports of
+any size run in constant memory and never pass through the UI. Output
+can be gzip-compressed. Usable headless from the project root:
+
+    python -m src.exporters.report_export publishers report.csv
+    python -m src.exporters.report_export publishers report.jsonl.gz
+"""
+import argparse
+import csv
+import datetime
+import decimal
+import gzip
+import json
+import logging
+import os
+import sys
+import time
+
+from src.db.repositories.report_repository import PUBLISHER_REPORT_COLUMNS, ReportRepository
+
+FORMATS = ("csv", "jsonl")
+
+# Rows written between two progress callbacks
+PROGRESS_INTERVAL = 10000
+
+# gzip level: 6 is considerably faster than the maximum at nearly the same size
+GZIP_LEVEL = 6
+
+
+class ExportResult:
+    """
+    Summary of a report export.
+
+    Attributes:
+        path (str): Written file
+        rows (int): Number of rows written so far
+        elapsed (float): Seconds since the export started
+    """
+    def __init__(self, path):
+        self.path = path
+        self.rows = 0
+        self.elapsed = 0.0
+
+    @property
+    def rows_per_sec(self):
+        return self.rows / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self):
+        """
+        Returns a human readable summary of the export.
+        """
+        return f"Exported {self.rows} row(s) to {self.path} in {self.elapsed:.1f} s."
+
+
+def detect_format(path):
+    """
+    Derives format and compression from a file name,
+    e.g. "report.csv" -> ("csv", False), "report.jsonl.gz" -> ("jsonl", True).
+
+    :return: Tuple (format or None if unknown, compressed)
+    """
+    name = path.lower()
+    compressed = name.endswith(".gz")
+    if compressed:
+        name = name[:-3]
+    for fmt, suffixes in (("csv", (".csv",)), ("jsonl", (".jsonl", ".ndjson", ".json"))):
+        if name.endswith(suffixes):
+            return fmt, compressed
+    return None, compressed
+
+
+def _json_default(value):
+    # Types returned by pyodbc that json cannot serialize itself
+    if isinstance(value, (datetime.date, datetime.datetime, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+    raise TypeError(f"Cannot export value of type {type(value).__name__}")
+
+
+def _write_csv(f, columns, rows, tick):
+    writer = csv.writer(f)
+    writer.writerow(columns)
+    for row in rows:
+        writer.writerow(row)
+        tick()
+
+
+def _write_jsonl(f, columns, rows, tick):
+    for row in rows:
+        f.write(json.dumps(dict(zip(columns, row)), default=_json_default, ensure_ascii=False))
+        f.write("\n")
+        tick()
+
+
+def write_rows(f, columns, rows, fmt="csv", tick=None):
+    """
+    Writes rows to an open text file (e.g. sys.stdout) in CSV or JSON Lines format.
+
+    :param f: Text file opened with newline=""
+    :param columns: Column names (CSV header, JSON keys)
+    :param rows: Iterable of row tuples
+    :param fmt: "csv" or "jsonl"
+    :param tick: Optional callable invoked after every row
+    :raises ValueError: If the format is unknown
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format {fmt}; use one of: {', '.join(FORMATS)}")
+    (_write_csv if fmt == "csv" else _write_jsonl)(f, columns, rows, tick or (lambda: None))
+
+
+def export_rows(rows, columns, path, fmt=None, compress=None, progress=None):
+    """
+    Writes rows to a CSV or JSON Lines file while they are being read.
+
+    The file is written under a temporary name and renamed when complete,
+    so a failed or cancelled export never leaves a truncated file behind.
+
+    :param rows: Iterable of row tuples (e.g. a repository generator);
+                 closed when the export ends
+    :param columns: Column names (CSV header, JSON keys)
+    :param path: Output file
+    :param fmt: "csv" or "jsonl" (defaults to the file extension)
+    :param compress: gzip the output (defaults to True for a .gz extension)
+    :param progress: Optional callable receiving the ExportResult every
+                     PROGRESS_INTERVAL rows; may raise to abort the export
+    :return: ExportResult
+    :raises ValueError: If the format is unknown
+    """
+    detected, detected_compress = detect_format(path)
+    fmt = fmt or detected
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format for {path}; use one of: {', '.join(FORMATS)}")
+    if compress is None:
+        compress = detected_compress
+
+    result = ExportResult(path)
+    start = time.perf_counter()
+
+    def tick():
+        result.rows += 1
+        if progress and result.rows % PROGRESS_INTERVAL == 0:
+            result.elapsed = time.perf_counter() - start
+            progress(result)
+
+    tmp_path = path + ".part"
+    try:
+        if compress:
+            f = gzip.open(tmp_path, "wt", encoding="utf-8", newline="", compresslevel=GZIP_LEVEL)
+        else:
+            f = open(tmp_path, "w", encoding="utf-8", newline="")
+        with f:
+            write_rows(f, columns, rows, fmt, tick)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    finally:
+        # Releases the database connection of a partially read generator
+        close = getattr(rows, "close", None)
+        if close is not None:
+            close()
+
+    result.elapsed = time.perf_counter() - start
+    logging.info("Exported %d row(s) to %s in %.2f s", result.rows, path, result.elapsed)
+    return result
+
+
+def export_publisher_report(path, fmt=None, compress=None, repo=None, progress=None):
+    """
+    Streams the publisher report into a file (see export_rows()).
+
+    :param repo: ReportRepository to read from (defaults to a new one)
+    :return: ExportResult
+    """
+    repo = repo or ReportRepository()
+    return export_rows(repo.iter_publisher_report(), PUBLISHER_REPORT_COLUMNS, path,
+                       fmt=fmt, compress=compress, progress=progress)
+
+
+# Exportable reports by name
+REPORTS = {
+    "publishers": export_publisher_report,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m src.exporters.report_export",
+                                     description="Export a report to a CSV or JSON Lines file.")
+    parser.add_argument("report", choices=sorted(REPORTS))
+    parser.add_argument("path", help="output file (.csv, .jsonl, optionally with .gz)")
+    parser.add_argument("--format", choices=FORMATS, help="output format (defaults to the file extension)")
+    parser.add_argument("--gzip", action="store_true", default=None, help="compress the output")
+    args = parser.parse_args(argv)
+    try:
+        result = REPORTS[args.report](args.path, fmt=args.format, compress=args.gzip)
+    except Exception as e:
+        logging.error("Export failed", exc_info=True)
+        print(f"Export failed: {e}", file=sys.stderr)
+        return 1
+    print(result.summary())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
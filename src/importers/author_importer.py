@@ -0,0 +1,51 @@
+from src.db.repositories.author_repository import AuthorRepository
+from src.importers.json_stream import is_json_lines, iter_json_array, iter_json_lines
+from src.importers.pipeline import ImportCheckpoint, run_import, run_upsert
+from src.validation.batch import AUTHOR_SCHEMA
+
+
+def iter_author_json(path):
+    """
+    Lazily reads authors from a JSON array file or a JSON Lines file.
+
+    :param path: Path to the JSON/JSON Lines file
+    :return: Generator of (record number, author dictionary) pairs
+             (line numbers for JSON Lines)
+    """
+    with open(path, encoding="utf-8") as f:
+        if is_json_lines(path, f):
+            yield from iter_json_lines(f)
+        else:
+            yield from enumerate(iter_json_array(f), start=1)
+
+
+def import_authors_json(path, repo=None, batch_size=None, resume=True, progress=None, upsert=False):
+    """
+    Imports authors from a JSON array or JSON Lines file with bounded memory.
+
+    Records are parsed one at a time and inserted in committed batches;
+    the import can be resumed after the last committed record.
+
+    :param path: Path to the JSON or JSON Lines file
+    :param repo: AuthorRepository to use (a new one by default)
+    :param batch_size: Records per committed batch
+    :param resume: Continue after the last committed record of a previous failed run
+    :param progress: Optional callable receiving ImportResult after each batch
+    :param upsert: Insert new and update changed rows in one transaction instead
+                   of inserting every record (authors are matched by email); resume is ignored
+    :return: ImportResult
+    """
+    repo = repo or AuthorRepository()
+    if upsert:
+        return run_upsert(iter_author_json(path), AUTHOR_SCHEMA, repo.upsert, progress=progress)
+    checkpoint = ImportCheckpoint.for_source(path)
+    if not resume:
+        checkpoint.clear()
+    return run_import(
+        iter_author_json(path),
+        AUTHOR_SCHEMA,
+        lambda batch: repo.bulk_insert(batch, atomic=True),
+        batch_size=batch_size,
+        checkpoint=checkpoint,
+        progress=progress,
+    )
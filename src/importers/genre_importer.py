@@ -0,0 +1,62 @@
+import xml.etree.ElementTree as ET
+
+from src.db.repositories.genre_repository import GenreRepository
+from src.importers.pipeline import ImportCheckpoint, run_import, run_upsert
+from src.validation.batch import GENRE_SCHEMA
+
+
+def iter_genre_xml(path):
+    """
+    Streams <genre> elements from an XML file using iterparse.
+
+    The genre name is taken from the 'name' attribute or the element text.
+    Processed elements are cleared immediately, so memory use does not
+    grow with the size of the document.
+
+    :param path: Path to the XML file
+    :return: Generator of (element number, genre dictionary) pairs
+    """
+    context = ET.iterparse(path, events=("start", "end"))
+    # The first event is the start of the root element
+    _, root = next(context)
+    count = 0
+    for event, elem in context:
+        if event != "end" or elem.tag != "genre":
+            continue
+        count += 1
+        yield count, {"name": elem.get("name") or (elem.text or "").strip()}
+        # Free the element and detach already processed siblings from the root
+        elem.clear()
+        root.clear()
+
+
+def import_genres_xml(path, repo=None, batch_size=None, resume=True, progress=None, upsert=False):
+    """
+    Imports genres from an XML file in constant memory.
+
+    Genres are inserted in committed batches while the document is still
+    being parsed; the import can be resumed after the last committed genre.
+
+    :param path: Path to the XML file
+    :param repo: GenreRepository to use (a new one by default)
+    :param batch_size: Genres per committed batch
+    :param resume: Continue after the last committed genre of a previous failed run
+    :param progress: Optional callable receiving ImportResult after each batch
+    :param upsert: Insert new and update changed rows in one transaction instead
+                   of inserting every genre (existing genre names are skipped); resume is ignored
+    :return: ImportResult
+    """
+    repo = repo or GenreRepository()
+    if upsert:
+        return run_upsert(iter_genre_xml(path), GENRE_SCHEMA, repo.upsert, progress=progress)
+    checkpoint = ImportCheckpoint.for_source(path)
+    if not resume:
+        checkpoint.clear()
+    return run_import(
+        iter_genre_xml(path),
+        GENRE_SCHEMA,
+        lambda batch: repo.bulk_insert(batch, atomic=True),
+        batch_size=batch_size,
+        checkpoint=checkpoint,
+        progress=progress,
+    )
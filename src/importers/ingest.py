@@ -0,0 +1,361 @@
+"""
+Headless ingest service: watches the import directory ([app] import_dir)
+and imports every new CSV, JSON or XML file dropped into it.
+
+Run from the project root:
+
+    python -m src.importers.ingest            (watch until Ctrl+C)
+    python -m src.importers.ingest --once     (import pending files and exit)
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from src.config import config
+from src.config.config import CONFIG_PATH
+from src.db.connection import DatabaseConnectionError, is_transient_error
+from src.db.repositories.author_repository import AuthorRepository
+from src.db.repositories.genre_repository import GenreRepository
+from src.db.repositories.publisher_repository import PublisherRepository
+from src.importers.author_importer import iter_author_json
+from src.importers.genre_importer import iter_genre_xml
+from src.importers.pipeline import ImportCheckpoint, run_import, run_upsert
+from src.importers.publisher_importer import iter_publisher_csv
+from src.validation.batch import AUTHOR_SCHEMA, GENRE_SCHEMA, PUBLISHER_SCHEMA
+
+# Relative paths in config.ini are relative to the project root (the directory of config.ini)
+IMPORT_DIR = os.path.join(os.path.dirname(CONFIG_PATH), config.get("app", "import_dir", fallback="./imports"))
+# Seconds between directory scans
+POLL_INTERVAL = config.getfloat("app", "ingest_poll_interval", fallback=5)
+# Worker processes, each importing one file at a time on its own connection (0 = one per CPU)
+INGEST_WORKERS = config.getint("app", "ingest_workers", fallback=0) or os.cpu_count() or 1
+# Insert new and update changed rows instead of plain inserts (see staged_upsert.py)
+UPSERT = config.getboolean("app", "ingest_upsert", fallback=True)
+# A file is picked up only after it has not been modified for this many seconds,
+# so files that are still being copied into the directory are not read half-written
+SETTLE_SECONDS = 2.0
+MANIFEST_NAME = ".ingest-manifest.json"
+# Attempts per file on deadlocks and lock timeouts, and the first retry delay in
+# seconds (doubled after every attempt)
+MAX_ATTEMPTS = 4
+RETRY_DELAY = 1.0
+
+
+class IngestKind:
+    """
+    How files of one type are imported.
+
+    Attributes:
+        name (str): Entity name used in logs and the manifest
+        parse (callable): Generator function(path) yielding (offset, record) pairs
+        schema (Schema): Batch validation schema (src/validation/batch.py)
+        repository (type): Repository class with bulk_insert() and upsert()
+    """
+    def __init__(self, name, parse, schema, repository):
+        self.name = name
+        self.parse = parse
+        self.schema = schema
+        self.repository = repository
+
+
+KINDS = {
+    ".csv": IngestKind("publishers", iter_publisher_csv, PUBLISHER_SCHEMA, PublisherRepository),
+    ".json": IngestKind("authors", iter_author_json, AUTHOR_SCHEMA, AuthorRepository),
+    ".jsonl": IngestKind("authors", iter_author_json, AUTHOR_SCHEMA, AuthorRepository),
+    ".ndjson": IngestKind("authors", iter_author_json, AUTHOR_SCHEMA, AuthorRepository),
+    ".xml": IngestKind("genres", iter_genre_xml, GENRE_SCHEMA, GenreRepository),
+}
+
+
+def kind_of(path):
+    """
+    :return: IngestKind for the file extension, or None for unsupported files
+    """
+    return KINDS.get(os.path.splitext(path)[1].lower())
+
+
+def _timed(records, timer):
+    """
+    Passes records through while adding the time spent producing them
+    (reading and parsing the file) to timer[0].
+    """
+    it = iter(records)
+    while True:
+        start = time.perf_counter()
+        try:
+            pair = next(it)
+        except StopIteration:
+            timer[0] += time.perf_counter() - start
+            return
+        timer[0] += time.perf_counter() - start
+        yield pair
+
+
+def _import(path, upsert):
+    """
+    Streams one file through its importer pipeline (see run_import()/run_upsert()).
+
+    :return: Tuple (ImportResult, seconds spent reading and parsing)
+    """
+    kind = kind_of(path)
+    repo = kind.repository()
+    parse_time = [0.0]
+    records = _timed(kind.parse(path), parse_time)
+    if upsert:
+        result = run_upsert(records, kind.schema, repo.upsert)
+    else:
+        # A retried insert continues after the last committed batch
+        result = run_import(records, kind.schema, lambda batch: repo.bulk_insert(batch, atomic=True),
+                            checkpoint=ImportCheckpoint.for_source(path))
+    return result, parse_time[0]
+
+
+def ingest_file(path, upsert):
+    """
+    Imports one file (runs in a worker process).
+
+    The file is parsed, validated and loaded batch by batch on the worker's
+    own pooled connection, so memory use does not depend on the file size
+    and no records are sent between processes. Deadlocks and lock timeouts
+    (likely when several files load into the same table) are retried with
+    backoff; an upsert is rolled back as a whole and an insert continues
+    from its checkpoint.
+
+    :return: Dictionary with the outcome; "error" is set if the import
+             failed, and "retry" if it failed for a reason that may pass
+             (connection or locking problems)
+    """
+    start = time.perf_counter()
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        try:
+            result, parse_seconds = _import(path, upsert)
+            break
+        except DatabaseConnectionError as e:
+            return {"error": str(e), "retry": True}
+        except Exception as e:
+            if not is_transient_error(e):
+                logging.error("Ingest of %s failed", path, exc_info=True)
+                return {"error": str(e), "retry": False}
+            if attempt == MAX_ATTEMPTS:
+                return {"error": str(e), "retry": True}
+            delay = RETRY_DELAY * 2 ** (attempt - 1)
+            logging.warning("Ingest of %s hit a transient error (attempt %d), retrying in %.0f s: %s",
+                            path, attempt, delay, e)
+            time.sleep(delay)
+    seconds = time.perf_counter() - start
+    return {
+        "rows": result.processed, "inserted": result.inserted, "updated": result.updated,
+        "unchanged": result.unchanged, "skipped": result.skipped, "attempts": attempt,
+        "seconds": seconds, "parse_seconds": parse_seconds,
+    }
+
+
+class IngestManifest:
+    """
+    Records the files already imported from the directory, so they are not
+    imported again. A file is identified by its name, size and modification
+    time; a file replaced by a new version is imported again.
+    """
+    def __init__(self, path):
+        """
+        :param path: Path of the manifest JSON file
+        """
+        self.path = path
+        self.entries = self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            logging.warning("Ignoring unreadable ingest manifest %s", self.path)
+            return {}
+
+    @staticmethod
+    def fingerprint(path):
+        st = os.stat(path)
+        return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+    def is_processed(self, name, fingerprint):
+        entry = self.entries.get(name)
+        return entry is not None and all(entry.get(k) == v for k, v in fingerprint.items())
+
+    def record(self, name, fingerprint, **details):
+        """
+        Stores the outcome of a file and saves the manifest.
+        """
+        self.entries[name] = {**fingerprint, "processed_at": time.strftime("%Y-%m-%dT%H:%M:%S"), **details}
+        # Write to a temporary file first so a crash never leaves a truncated manifest
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.path)
+
+
+class IngestStats:
+    """
+    Throughput totals of the ingest service since it started.
+    """
+    def __init__(self):
+        self.files = 0
+        self.failed = 0
+        self.rows = 0
+        self.parse_seconds = 0.0
+        self.load_seconds = 0.0
+        self.started = time.perf_counter()
+
+    def add(self, rows, parse_seconds, load_seconds):
+        self.files += 1
+        self.rows += rows
+        self.parse_seconds += parse_seconds
+        self.load_seconds += load_seconds
+
+    def add_failure(self):
+        self.failed += 1
+
+    def summary(self):
+        elapsed = time.perf_counter() - self.started
+        rate = self.rows / elapsed if elapsed > 0 else 0.0
+        return (f"{self.files} file(s), {self.rows} row(s) in {elapsed:.1f} s ({rate:.0f} rows/s); "
+                f"parse {self.parse_seconds:.1f} s, load {self.load_seconds:.1f} s; {self.failed} failed")
+
+
+class IngestService:
+    """
+    Imports files dropped into a directory.
+
+    Files are dispatched by extension: CSV to the publisher importer,
+    JSON/JSON Lines to the author importer and XML to the genre importer.
+    Files are imported in parallel by a process pool: each worker process
+    streams one file at a time through parsing, validation and loading
+    over its own pooled connection (see ingest_file()).
+    Imported (and failed) files are recorded in a manifest in the directory.
+    """
+    def __init__(self, directory=IMPORT_DIR, workers=INGEST_WORKERS, upsert=UPSERT):
+        """
+        :param directory: Directory to watch
+        :param workers: Number of worker processes
+        :param upsert: Use the staged upsert instead of plain inserts
+        """
+        self.directory = os.path.abspath(directory)
+        self.workers = workers
+        self.upsert = upsert
+        self.manifest = IngestManifest(os.path.join(self.directory, MANIFEST_NAME))
+        self.stats = IngestStats()
+
+    def pending(self):
+        """
+        :return: Paths of supported, settled files not yet in the manifest
+        """
+        paths = []
+        now = time.time()
+        for entry in os.scandir(self.directory):
+            if not entry.is_file() or entry.name.startswith(".") or kind_of(entry.name) is None:
+                continue
+            fingerprint = IngestManifest.fingerprint(entry.path)
+            if now - fingerprint["mtime_ns"] / 1e9 < SETTLE_SECONDS:
+                continue
+            if not self.manifest.is_processed(entry.name, fingerprint):
+                paths.append(entry.path)
+        return sorted(paths)
+
+    def run_once(self, workers):
+        """
+        Imports all pending files and waits until they are done.
+
+        :param workers: ProcessPoolExecutor running ingest_file()
+        :return: Number of files processed
+        """
+        paths = self.pending()
+        if not paths:
+            return 0
+        logging.info("Ingesting %d file(s) from %s", len(paths), self.directory)
+        futures = {
+            workers.submit(ingest_file, path, self.upsert): (path, IngestManifest.fingerprint(path))
+            for path in paths
+        }
+        for future in as_completed(futures):
+            path, fingerprint = futures[future]
+            try:
+                outcome = future.result()
+            except Exception as e:
+                # The worker process itself failed (e.g. it was killed)
+                outcome = {"error": str(e), "retry": True}
+            self._finished(path, fingerprint, outcome)
+        logging.info("Ingest totals: %s", self.stats.summary())
+        return len(paths)
+
+    def run(self, interval=POLL_INTERVAL, once=False):
+        """
+        Watches the directory until interrupted (or one pass with once=True).
+
+        :return: Process exit code
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        logging.info("Watching %s (%d worker process(es), %s)", self.directory,
+                     self.workers, "upsert" if self.upsert else "insert")
+        with ProcessPoolExecutor(max_workers=self.workers) as workers:
+            try:
+                while True:
+                    self.run_once(workers)
+                    if once:
+                        break
+                    time.sleep(interval)
+            except KeyboardInterrupt:
+                logging.info("Ingest stopped")
+        logging.info("Ingest totals: %s", self.stats.summary())
+        return 1 if self.stats.failed else 0
+
+    def _finished(self, path, fingerprint, outcome):
+        """
+        Logs the outcome of a file and records it in the manifest.
+        """
+        name = os.path.basename(path)
+        kind = kind_of(path)
+        if "error" in outcome:
+            self.stats.add_failure()
+            if outcome["retry"]:
+                # Not recorded in the manifest: the file is retried on the next scan
+                logging.error("Ingest of %s failed, will retry: %s", name, outcome["error"])
+            else:
+                # Recorded with the error; the file is imported again once it is replaced
+                logging.error("Ingest of %s failed: %s", name, outcome["error"])
+                self.manifest.record(name, fingerprint, kind=kind.name, error=outcome["error"])
+            return
+
+        seconds = outcome.pop("seconds")
+        parse_seconds = outcome.pop("parse_seconds")
+        rows = outcome["rows"]
+        self.stats.add(rows, parse_seconds, seconds - parse_seconds)
+        rate = rows / seconds if seconds > 0 else 0.0
+        logging.info("Imported %s (%s): %d row(s) in %.2f s (%.0f rows/s; parse %.2f s, load %.2f s)",
+                     name, kind.name, rows, seconds, rate, parse_seconds, seconds - parse_seconds)
+        self.manifest.record(name, fingerprint, kind=kind.name, seconds=round(seconds, 3),
+                             rows_per_sec=round(rate), **outcome)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m src.importers.ingest",
+                                     description="Import files dropped into the import directory.")
+    parser.add_argument("--dir", default=IMPORT_DIR, help="directory to watch (default: [app] import_dir)")
+    parser.add_argument("--once", action="store_true", help="import pending files and exit")
+    parser.add_argument("--workers", type=int, default=INGEST_WORKERS, help="worker processes")
+    parser.add_argument("--interval", type=float, default=POLL_INTERVAL, help="seconds between scans")
+    parser.add_argument("--insert", action="store_true", help="plain inserts instead of upserts")
+    args = parser.parse_args(argv)
+    service = IngestService(args.dir, workers=args.workers, upsert=UPSERT and not args.insert)
+    try:
+        return service.run(interval=args.interval, once=args.once)
+    except DatabaseConnectionError as e:
+        print(f"Ingest failed: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
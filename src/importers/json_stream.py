@@ -0,0 +1,115 @@
+import json
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\r\n"
+# Characters that can continue a number
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+# Characters read from the file per refill of the parse buffer
+READ_SIZE = 1 << 16
+# Largest single array element accepted before the input is considered malformed
+MAX_ELEMENT_SIZE = 64 << 20
+
+
+def iter_json_array(f, read_size=READ_SIZE):
+    """
+    Incrementally parses a top-level JSON array, yielding one element at a time.
+
+    Only the current element and a small read buffer are held in memory,
+    so arbitrarily large files can be processed.
+
+    :param f: Text file object positioned at the start of the document
+    :param read_size: Characters read per refill
+    :return: Generator of parsed elements
+    :raises ValueError: If the document is not a well-formed JSON array
+    """
+    buf = ""
+    pos = 0
+    eof = False
+
+    def fill():
+        nonlocal buf, pos, eof
+        data = f.read(read_size)
+        if not data:
+            eof = True
+            return False
+        # Drop the consumed part of the buffer before appending
+        buf = buf[pos:] + data
+        pos = 0
+        return True
+
+    def next_char():
+        # Skips whitespace and returns the next significant character ("" at EOF)
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buf):
+                return buf[pos]
+            if not fill():
+                return ""
+
+    if next_char() != "[":
+        raise ValueError("Expected a JSON array")
+    pos += 1
+    if next_char() == "]":
+        return
+
+    while True:
+        if not next_char():
+            raise ValueError("Unexpected end of JSON array")
+        try:
+            value, end = _decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            # The element may continue beyond the buffer
+            if len(buf) - pos < MAX_ELEMENT_SIZE and fill():
+                continue
+            raise
+        # A number cut off by the buffer end decodes as a shorter number ("1" of "1.5",
+        # "1.5" of "1.5e3"): it may continue only if nothing but number characters
+        # follow it up to the buffer end. Anything else (a separator, whitespace or
+        # a syntax error) is decided from the buffer, without reading further.
+        if (isinstance(value, (int, float)) and not isinstance(value, bool)
+                and all(c in _NUMBER_CHARS for c in buf[end:])
+                and len(buf) - pos < MAX_ELEMENT_SIZE and fill()):
+            continue
+        pos = end
+        yield value
+
+        sep = next_char()
+        if sep == ",":
+            pos += 1
+        elif sep == "]":
+            return
+        else:
+            raise ValueError(f"Expected ',' or ']' in JSON array, got {sep!r}")
+
+
+def iter_json_lines(f):
+    """
+    Parses JSON Lines input (one JSON value per line); blank lines are ignored.
+
+    :param f: Text file object
+    :return: Generator of (line number, parsed value) pairs
+    """
+    for i, line in enumerate(f, start=1):
+        line = line.strip()
+        if line:
+            yield i, json.loads(line)
+
+
+def is_json_lines(path, f):
+    """
+    Decides whether a file is JSON Lines or a single JSON array.
+
+    Files ending in .jsonl/.ndjson are JSON Lines; otherwise a document
+    that does not start with '[' is treated as JSON Lines.
+
+    :param path: File path (used for the extension)
+    :param f: Text file object; its position is restored
+    """
+    if path.lower().endswith((".jsonl", ".ndjson")):
+        return True
+    start = f.tell()
+    head = f.read(1024).lstrip()
+    f.seek(start)
+    return not head.startswith("[")
@@ -0,0 +1,189 @@
+import json
+import logging
+import os
+
+from src.db.bulk_loader import DEFAULT_CHUNK_SIZE, chunked
+
+# Number of skipped row numbers kept for reporting (the count is always exact)
+MAX_REPORTED_SKIPS = 50
+
+
+class ImportResult:
+    """
+    Summary of a streaming import.
+
+    Attributes:
+        processed (int): Number of records read from the source so far
+        inserted (int): Number of inserted records
+        updated (int): Number of existing records changed (upsert mode)
+        unchanged (int): Number of records identical to the stored ones or
+                         repeated later in the source (upsert mode)
+        skipped (int): Number of records rejected by validation
+        skipped_rows (list): (offset, reason) of the first skipped records
+        last_offset (int): Offset of the last record committed to the database
+        resumed_from (int): Offset the import was resumed after (0 = from the start)
+    """
+    def __init__(self, resumed_from=0, upsert=False):
+        self.processed = 0
+        self.inserted = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.upsert = upsert
+        self.skipped = 0
+        self.skipped_rows = []
+        self.last_offset = resumed_from
+        self.resumed_from = resumed_from
+
+    def skip(self, offset, reason):
+        self.skipped += 1
+        if len(self.skipped_rows) < MAX_REPORTED_SKIPS:
+            self.skipped_rows.append((offset, reason))
+
+    def summary(self):
+        """
+        Returns a human readable summary of the import.
+        """
+        msg = f"Inserted {self.inserted} row(s)."
+        if self.upsert:
+            msg += f"\nUpdated {self.updated} row(s), {self.unchanged} unchanged or duplicate."
+        if self.resumed_from:
+            msg += f"\nResumed after row {self.resumed_from}."
+        if self.skipped:
+            shown = ", ".join(f"{offset} ({reason})" for offset, reason in self.skipped_rows)
+            msg += f"\nSkipped {self.skipped} row(s): {shown}"
+            if self.skipped > len(self.skipped_rows):
+                msg += ", ..."
+        return msg
+
+
+class ImportCheckpoint:
+    """
+    Remembers the offset of the last committed record of an import
+    in a small side file, so a failed import can be resumed.
+    """
+    SUFFIX = ".import-checkpoint"
+
+    def __init__(self, path):
+        """
+        :param path: Path of the checkpoint file
+        """
+        self.path = path
+
+    @classmethod
+    def for_source(cls, source_path):
+        """
+        Returns the checkpoint belonging to an import source file.
+        """
+        return cls(source_path + cls.SUFFIX)
+
+    def load(self):
+        """
+        :return: Last committed offset, or 0 if there is no checkpoint
+        """
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return int(json.load(f)["offset"])
+        except FileNotFoundError:
+            return 0
+        except (ValueError, KeyError, TypeError):
+            logging.warning("Ignoring unreadable import checkpoint %s", self.path)
+            return 0
+
+    def save(self, offset):
+        # Write to a temporary file first so a crash never leaves a truncated checkpoint
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"offset": offset}, f)
+        os.replace(tmp, self.path)
+
+    def clear(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def validated(records, schema, result, after=0):
+    """
+    Validates records in batches with a batch validation schema
+    (src/validation/batch.py) and yields the valid ones.
+
+    Invalid records are reported to `result` as skipped.
+
+    :param records: Iterable of (offset, record) pairs
+    :param schema: validation.batch.Schema
+    :param result: ImportResult counting processed and skipped records
+    :param after: Records up to and including this offset are ignored
+    :return: Generator of valid (offset, record) pairs
+    """
+    pending = (pair for pair in records if pair[0] > after)
+    for rows in chunked(pending, DEFAULT_CHUNK_SIZE):
+        result.processed += len(rows)
+        checked = schema.validate(rows)
+        for offset, reason in checked.reasons():
+            result.skip(offset, reason)
+        yield from checked.valid
+
+
+def run_import(records, schema, insert_batch, batch_size=None, checkpoint=None, progress=None):
+    """
+    Streams records through validation into the database in fixed-size batches.
+
+    Records are pulled lazily from `records`, so memory use depends only on
+    the batch size, and batches are written while the source is still being
+    parsed. Each batch is committed on its own; after a commit its last
+    offset is stored in the checkpoint. When the checkpoint already holds an
+    offset, records up to and including it are skipped, which resumes a
+    previously failed import. The checkpoint is removed after a complete run.
+
+    :param records: Iterable of (offset, record) pairs with increasing offsets
+    :param schema: Batch validation schema (src/validation/batch.py)
+    :param insert_batch: Callable(list of records) inserting and committing one batch
+    :param batch_size: Records per batch (defaults to [database] bulk_chunk_size)
+    :param checkpoint: Optional ImportCheckpoint for resuming
+    :param progress: Optional callable receiving the ImportResult after each batch
+    :return: ImportResult
+    """
+    start_offset = checkpoint.load() if checkpoint else 0
+    result = ImportResult(resumed_from=start_offset)
+
+    for batch in chunked(validated(records, schema, result, start_offset), batch_size or DEFAULT_CHUNK_SIZE):
+        insert_batch([record for _, record in batch])
+        result.inserted += len(batch)
+        result.last_offset = batch[-1][0]
+        if checkpoint:
+            checkpoint.save(result.last_offset)
+        if progress:
+            progress(result)
+
+    if checkpoint:
+        checkpoint.clear()
+    return result
+
+
+def run_upsert(records, schema, upsert, progress=None):
+    """
+    Streams records through validation into a repository upsert
+    (staging table + MERGE, see staged_upsert.staged_upsert()).
+
+    Unlike run_import(), the whole source is applied in one transaction:
+    a failed upsert leaves the table unchanged and is simply run again,
+    so no checkpoint is needed. Records rejected here or by the
+    set-based checks on the server are reported as skipped.
+
+    :param records: Iterable of (offset, record) pairs
+    :param schema: Batch validation schema (src/validation/batch.py)
+    :param upsert: Callable(iterable of (offset, record), progress=) returning an UpsertResult
+    :param progress: Optional callable receiving the ImportResult while records are staged
+    :return: ImportResult
+    """
+    result = ImportResult(upsert=True)
+    upserted = upsert(validated(records, schema, result), progress=(lambda _: progress(result)) if progress else None)
+    result.inserted = upserted.inserted
+    result.updated = upserted.updated
+    result.unchanged = upserted.skipped
+    for offset, reason in upserted.rejected_rows:
+        result.skip(offset, reason)
+    # Rejected rows beyond the reported ones still count
+    result.skipped += upserted.rejected - len(upserted.rejected_rows)
+    return result
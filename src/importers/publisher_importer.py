@@ -0,0 +1,53 @@
+import csv
+
+from src.db.repositories.publisher_repository import PublisherRepository
+from src.importers.pipeline import ImportCheckpoint, run_import, run_upsert
+from src.validation.batch import PUBLISHER_SCHEMA
+
+
+def iter_publisher_csv(path):
+    """
+    Lazily reads publishers from a CSV file.
+
+    Whitespace is stripped from all fields and empty fields become None.
+
+    :param path: Path to the CSV file (header: name, address, phone_number, email, website)
+    :return: Generator of (row number, row dictionary) pairs
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        for i, row in enumerate(reader, start=1):
+            yield i, {k: (v.strip() if v else None) for k, v in row.items()}
+
+
+def import_publishers_csv(path, repo=None, batch_size=None, resume=True, progress=None, upsert=False):
+    """
+    Imports publishers from a CSV file with bounded memory.
+
+    Rows are parsed, validated and inserted batch by batch; each batch
+    is committed separately and the import can be resumed after the
+    last committed row if it fails.
+
+    :param path: Path to the CSV file
+    :param repo: PublisherRepository to use (a new one by default)
+    :param batch_size: Rows per committed batch
+    :param resume: Continue after the last committed row of a previous failed run
+    :param progress: Optional callable receiving ImportResult after each batch
+    :param upsert: Insert new and update changed rows in one transaction instead
+                   of inserting every row (publishers are matched by name); resume is ignored
+    :return: ImportResult
+    """
+    repo = repo or PublisherRepository()
+    if upsert:
+        return run_upsert(iter_publisher_csv(path), PUBLISHER_SCHEMA, repo.upsert, progress=progress)
+    checkpoint = ImportCheckpoint.for_source(path)
+    if not resume:
+        checkpoint.clear()
+    return run_import(
+        iter_publisher_csv(path),
+        PUBLISHER_SCHEMA,
+        lambda batch: repo.bulk_insert(batch, atomic=True),
+        batch_size=batch_size,
+        checkpoint=checkpoint,
+        progress=progress,
+    )
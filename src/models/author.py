@@ -0,0 +1,26 @@
+from src.models.base import Model, text
+
+
+class Author(Model):
+    """
+    Author row: (id, surname, name, email, is_active).
+    Display strings are computed on first use and memoized.
+    """
+    FIELDS = ("id", "surname", "name", "email", "is_active")
+    __slots__ = FIELDS + ("_display",)
+
+    def __init__(self, *values):
+        super().__init__(*values)
+        self._display = None
+
+    @property
+    def full_name(self):
+        return f"{self.surname} {self.name}"
+
+    def display(self):
+        """
+        :return: Tuple of display strings in column order
+        """
+        if self._display is None:
+            self._display = tuple(text(value) for value in self)
+        return self._display
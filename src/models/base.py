@@ -0,0 +1,56 @@
+class Model:
+    """
+    Base class of the compact row models.
+
+    Subclasses list their columns in FIELDS (in select order) and declare
+    __slots__, so an instance stores only its values without a per-object
+    __dict__. Models also behave like the database rows they replace:
+    they can be indexed by column position, iterated and unpacked.
+    """
+    __slots__ = ()
+    FIELDS = ()
+
+    def __init__(self, *values):
+        if len(values) != len(self.FIELDS):
+            raise TypeError(f"{type(self).__name__} expects {len(self.FIELDS)} values, got {len(values)}")
+        for field, value in zip(self.FIELDS, values):
+            setattr(self, field, value)
+
+    @classmethod
+    def from_row(cls, row):
+        """
+        Creates a model from a database row with the columns in FIELDS order.
+        """
+        return cls(*row)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(getattr(self, field) for field in self.FIELDS[index])
+        return getattr(self, self.FIELDS[index])
+
+    def __iter__(self):
+        return (getattr(self, field) for field in self.FIELDS)
+
+    def __len__(self):
+        return len(self.FIELDS)
+
+    def __eq__(self, other):
+        if isinstance(other, Model):
+            return type(self) is type(other) and tuple(self) == tuple(other)
+        if isinstance(other, tuple):
+            return tuple(self) == other
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __repr__(self):
+        values = ", ".join(f"{field}={getattr(self, field)!r}" for field in self.FIELDS)
+        return f"{type(self).__name__}({values})"
+
+
+def text(value):
+    """
+    Converts a column value to display text (None becomes an empty string).
+    """
+    return "" if value is None else str(value)
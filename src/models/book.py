@@ -0,0 +1,40 @@
+from src.models.base import Model, text
+
+
+class Book(Model):
+    """
+    Book row: (id, name, publisher, publishment_date, rating, binding).
+
+    The publisher column holds the publisher ID. Display strings are
+    computed on first use and memoized.
+    """
+    FIELDS = ("id", "name", "publisher", "publishment_date", "rating", "binding")
+    __slots__ = FIELDS + ("_display",)
+
+    def __init__(self, *values):
+        super().__init__(*values)
+        self._display = None
+
+    def display(self):
+        """
+        :return: Tuple of display strings in column order
+        """
+        if self._display is None:
+            self._display = format_book(self.id, self.name, self.publisher,
+                                        self.publishment_date, self.rating, self.binding)
+        return self._display
+
+
+def format_book(book_id, name, publisher, publishment_date, rating, binding):
+    """
+    Converts book values to display strings
+    (shared by Book and BookColumns so both show books identically).
+    """
+    return (
+        str(book_id),
+        name or "",
+        text(publisher),
+        publishment_date.strftime("%Y-%m-%d") if publishment_date else "",
+        f"{rating:.2f}" if rating is not None else "",
+        binding or "",
+    )
@@ -0,0 +1,22 @@
+from src.models.base import Model, text
+
+
+class Publisher(Model):
+    """
+    Publisher row: (id, name, address, phone_number, email, website).
+    Display strings are computed on first use and memoized.
+    """
+    FIELDS = ("id", "name", "address", "phone_number", "email", "website")
+    __slots__ = FIELDS + ("_display",)
+
+    def __init__(self, *values):
+        super().__init__(*values)
+        self._display = None
+
+    def display(self):
+        """
+        :return: Tuple of display strings in column order
+        """
+        if self._display is None:
+            self._display = tuple(text(value) for value in self)
+        return self._display
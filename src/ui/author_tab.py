@@ -1,5 +1,11 @@
 from tkinter import ttk, messagebox
+from src.db.cache import reference_cache
 from src.db.repositories.author_repository import AuthorRepository
+from src.models.author import Author
+from src.ui.background import BusyIndicator, executor
+from src.ui.delta_poller import DeltaPoller, load_versioned
+from src.ui.dialogs.merge_authors import MergeAuthors
+from src.ui.tree_sync import TreeSync
 
 class AuthorTab(ttk.Frame):
     """
@@ -7,7 +13,9 @@ class AuthorTab(ttk.Frame):
 
     This tab allows the user to:
     - view all authors
-    - refresh the list manually
+    - refresh the list manually (changes made elsewhere are picked up
+      automatically through change tracking deltas)
+    - merge a duplicate author into another author
 
     Data are loaded exclusively via AuthorRepository
     to follow the Repository (DAO) pattern.
@@ -26,6 +34,11 @@ class AuthorTab(ttk.Frame):
         tool_bar = ttk.Frame(self)
         tool_bar.pack(fill="x", padx=8, pady=8)
         ttk.Button(tool_bar, text="Update", command=self.refresh).pack(side="left", padx=4)
+        ttk.Button(tool_bar, text="Merge authors", command=self.merge_authors_dialog).pack(side="left", padx=4)
+        # Shown while authors are being loaded in the background
+        self.busy = BusyIndicator(tool_bar)
+        self.busy.pack(side="right", padx=4)
+        self._refresh_task = None
 
         # Author table
         columns = ("id", "surname", "name", "email", "is_active")
@@ -34,23 +47,81 @@ class AuthorTab(ttk.Frame):
             self.tree.heading(c, text=hdr)
             self.tree.column(c, width=150)
         self.tree.pack(fill="both", expand=True, padx=8, pady=8)
+        # Applies row changes to the Treeview item by item
+        # (Author.display() converts None values to empty strings for UI safety)
+        self.rows = TreeSync(self.tree, key=lambda r: str(r.id), display=Author.display)
+        # Shown authors by ID, kept current by applying deltas
+        self.authors = {}
+        self.poller = DeltaPoller(self, self.repo.fetch_changes, self.apply_delta,
+                                  busy=lambda: self._refresh_task is not None)
 
-        # Initial data load
+    def load(self):
+        """
+        Initial data load, called by LibraryApp when the tab is first shown.
+        """
         self.refresh()
 
     def refresh(self):
         """
-        Reloads all authors from the database
-        and updates the Treeview content.
+        Reloads all authors from the database in the background
+        and updates the Treeview content when they arrive.
+
+        Cached author lists are dropped first, so an explicit refresh
+        always shows the current database state.
+        """
+        reference_cache.invalidate("author")
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+
+        def loaded(result):
+            version, rows = result
+            self.show_rows(rows)
+            self.poller.start(version)
+
+        def done():
+            # Only forget the task if no newer refresh has replaced it
+            if self._refresh_task is task:
+                self._refresh_task = None
+
+        task = executor.submit(
+            self, load_versioned, self.repo, self.repo.get_all,
+            on_success=loaded,
+            on_error=lambda e: messagebox.showerror("Error while loading authors", str(e)),
+            on_done=done,
+            busy=self.busy,
+        )
+        self._refresh_task = task
+
+    def show_rows(self, rows):
         """
+        Updates the Treeview to show the given author rows.
 
-        # Clear existing rows
-        for i in self.tree.get_children():
-            self.tree.delete(i)
-        try:
-            rows = self.repo.get_all()
-            for r in rows:
-                # Convert None values to empty strings for UI safety
-                self.tree.insert("", "end", values=[str(x) if x is not None else "" for x in r])
-        except Exception as e:
-            messagebox.showerror("Error while loading authors", str(e))
\ No newline at end of file
+        The rows are compared with the shown ones by ID, so only added,
+        changed and removed authors touch the Treeview.
+        """
+        self.authors = {row[0]: row for row in rows}
+        self.rows.sync(rows)
+
+    def apply_delta(self, delta):
+        """
+        Applies authors changed in the database since the last load
+        (see AuthorRepository.fetch_changes()) without reloading the list.
+        """
+        if delta.reset:
+            self.refresh()
+            return
+        # Cached author lists used by the dialogs are outdated as well
+        reference_cache.invalidate("author")
+        for author_id in delta.removed:
+            self.authors.pop(author_id, None)
+        for row in delta.changed:
+            self.authors[row[0]] = row
+        # Same order as AuthorRepository.get_all()
+        rows = sorted(self.authors.values(), key=lambda r: ((r[1] or "").casefold(), (r[2] or "").casefold()))
+        self.rows.sync(rows)
+
+    def merge_authors_dialog(self):
+        """
+        Opens the MergeAuthors dialog to move all books of a duplicate author to another author.
+        """
+        MergeAuthors(self)
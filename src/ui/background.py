@@ -0,0 +1,193 @@
+import logging
+import queue
+import tkinter
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import ttk, messagebox
+
+from src.config import config
+
+# How often (ms) the Tk thread checks for finished background work
+POLL_INTERVAL_MS = 50
+
+
+class TaskCancelled(Exception):
+    """Raised inside background work that noticed its task was cancelled."""
+    pass
+
+
+class BackgroundTask:
+    """
+    Handle for work submitted to the BackgroundExecutor.
+
+    Cancelling a task that has not started yet prevents it from running;
+    for a running task the result is discarded and its callbacks are not
+    called. Long-running work can poll `cancelled` and stop early.
+    """
+    def __init__(self, future=None):
+        self.future = future
+        self._cancelled = False
+
+    @property
+    def cancelled(self):
+        return self._cancelled
+
+    def cancel(self):
+        self._cancelled = True
+        if self.future is not None:
+            self.future.cancel()
+
+    def raise_if_cancelled(self):
+        """
+        :raises TaskCancelled: If the task has been cancelled
+        """
+        if self._cancelled:
+            raise TaskCancelled()
+
+
+class BackgroundExecutor:
+    """
+    Runs database work on a pool of worker threads and delivers the results
+    back on the Tk thread.
+
+    Tk widgets must only be touched from the thread running the mainloop,
+    so workers never call callbacks themselves: finished tasks are put into
+    a queue which the Tk thread drains with after(). Several tasks may run
+    at the same time.
+    """
+    def __init__(self, max_workers=4):
+        """
+        :param max_workers: Number of worker threads
+        """
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="db-worker")
+        self._queue = queue.Queue()
+        self._root = None
+        self._polling = False
+        self._pending = 0
+
+    def submit(self, widget, fn, *args, on_success=None, on_error=None, on_done=None, busy=None, **kwargs):
+        """
+        Runs fn(*args, **kwargs) on a worker thread.
+
+        :param widget: Widget owning the task; callbacks are skipped if it has been destroyed
+        :param fn: Callable to run in the background (must not touch Tk widgets)
+        :param on_success: Called on the Tk thread with the result
+        :param on_error: Called on the Tk thread with the exception
+                         (defaults to an error messagebox)
+        :param on_done: Called on the Tk thread without arguments when the task
+                        has ended in any way, including cancellation
+        :param busy: Optional BusyIndicator shown while the task runs
+        :return: BackgroundTask
+        """
+        task = BackgroundTask()
+        self._attach(widget)
+        if busy is not None:
+            busy.start()
+        self._pending += 1
+        task.future = self._pool.submit(fn, *args, **kwargs)
+        task.future.add_done_callback(
+            lambda future: self._queue.put((self._finish, (task, widget, on_success, on_error, on_done, busy)))
+        )
+        return task
+
+    def call_in_ui(self, fn, *args):
+        """
+        Schedules fn(*args) on the Tk thread. Safe to call from worker threads,
+        e.g. to report progress of a running task.
+        """
+        self._queue.put((fn, args))
+
+    def shutdown(self):
+        """
+        Cancels queued work and stops the worker threads without waiting
+        for running work to finish.
+        """
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _attach(self, widget):
+        if self._root is None:
+            self._root = widget.nametowidget(".")
+        if not self._polling:
+            self._polling = True
+            self._root.after(POLL_INTERVAL_MS, self._poll)
+
+    def _poll(self):
+        while True:
+            try:
+                fn, args = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                fn(*args)
+            except Exception:
+                logging.error("Error in background task callback", exc_info=True)
+        if self._pending > 0 or not self._queue.empty():
+            self._root.after(POLL_INTERVAL_MS, self._poll)
+        else:
+            self._polling = False
+
+    def _finish(self, task, widget, on_success, on_error, on_done, busy):
+        self._pending -= 1
+        if busy is not None:
+            busy.stop()
+        if not _exists(widget):
+            return
+        try:
+            self._deliver(task, on_success, on_error)
+        finally:
+            # on_success may have destroyed the widget (e.g. closing a dialog)
+            if on_done is not None and _exists(widget):
+                on_done()
+
+    def _deliver(self, task, on_success, on_error):
+        if task.cancelled or task.future.cancelled():
+            return
+        error = task.future.exception()
+        if isinstance(error, TaskCancelled):
+            return
+        if error is None:
+            if on_success is not None:
+                on_success(task.future.result())
+        elif on_error is not None:
+            on_error(error)
+        else:
+            logging.error("Background task failed", exc_info=error)
+            messagebox.showerror("Error", str(error))
+
+
+class BusyIndicator(ttk.Frame):
+    """
+    Small indeterminate progress bar shown while a tab has background work running.
+
+    Calls to start() and stop() are counted, so the indicator stays active
+    until all tasks of the tab have finished.
+    """
+    def __init__(self, parent, text="Loading..."):
+        super().__init__(parent)
+        self._count = 0
+        self._label = ttk.Label(self, text=text)
+        self._bar = ttk.Progressbar(self, mode="indeterminate", length=80)
+
+    def start(self):
+        self._count += 1
+        if self._count == 1:
+            self._label.pack(side="left", padx=4)
+            self._bar.pack(side="left")
+            self._bar.start(15)
+
+    def stop(self):
+        self._count = max(0, self._count - 1)
+        if self._count == 0 and _exists(self):
+            self._bar.stop()
+            self._bar.pack_forget()
+            self._label.pack_forget()
+
+
+def _exists(widget):
+    try:
+        return bool(widget.winfo_exists())
+    except tkinter.TclError:
+        return False
+
+
+# Shared executor used by all tabs and dialogs
+executor = BackgroundExecutor(max_workers=config.getint("app", "worker_threads", fallback=4))
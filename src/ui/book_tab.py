@@ -1,7 +1,62 @@
+import tkinter
 from tkinter import ttk, messagebox
-from src.db.repositories.book_repository import BookRepository
+from src.db.repositories.book_repository import BookRepository, SORT_COLUMNS
+from src.db.repositories.publisher_repository import PublisherRepository
+from src.models.book import Book
+from src.ui.background import BusyIndicator, executor
+from src.ui.delta_poller import DeltaPoller, load_versioned
 from src.ui.dialogs.book_editor import BookEditor
 from src.ui.dialogs.transfer_authorship import TransferAuthorship
+from src.ui.tree_sync import TreeSync
+from src.validation.validators import validate_date, validate_rating
+
+# Number of books requested per page
+PAGE_SIZE = 200
+# Maximum number of pages held in the Treeview; older pages are evicted
+MAX_PAGES = 5
+# Part of the scroll range near an edge in which the adjacent page is loaded
+PREFETCH_MARGIN = 0.1
+
+
+def _order(key):
+    """
+    Comparable form of a sort key (value, id) in ascending SQL Server
+    order, where NULL sorts before any value. Names are compared without
+    case, like the default (case-insensitive) collation.
+    """
+    value, row_id = key
+    if isinstance(value, str):
+        value = value.casefold()
+    return value is not None, value, row_id
+
+
+def delta_action(old_key, new_key, first_key, last_key, descending=False):
+    """
+    Decides how a book changed in the database affects the loaded window.
+
+    :param old_key: Sort key of the shown row, or None if the book is not shown
+    :param new_key: Sort key of the changed book
+    :param first_key: Sort key of the first loaded row, or None if nothing
+                      precedes the window
+    :param last_key: Sort key of the last loaded row, or None if nothing
+                     follows the window
+    :param descending: The window is sorted in descending order
+    :return: "update" (update the shown row in place), "refresh" (reload
+             the window) or "ignore" (the book sorts outside the window)
+    """
+    if old_key is not None:
+        return "update" if old_key == new_key else "refresh"
+    key = _order(new_key)
+    # Descending order is ascending order reversed (NULL last, as in SQL Server)
+    if first_key is not None:
+        first = _order(first_key)
+        if (key > first) if descending else (key < first):
+            return "ignore"
+    if last_key is not None:
+        last = _order(last_key)
+        if (key < last) if descending else (key > last):
+            return "ignore"
+    return "refresh"
 
 
 class BookTab(ttk.Frame):
@@ -9,7 +64,10 @@ class BookTab(ttk.Frame):
     UI tab for managing books in the library database.
 
     Features:
-    - Display all books in a Treeview
+    - Display books in a virtualized Treeview: pages are loaded with keyset
+      pagination while scrolling and at most MAX_PAGES pages are kept
+    - Filter books by name, publisher, binding, rating and publishment date
+      and sort them; filtering, sorting and paging are done by SQL Server
     - Add, edit, delete books
     - Transfer authorship between authors
     - Refresh the book list
@@ -37,56 +95,336 @@ class BookTab(ttk.Frame):
         ttk.Button(tool_bar, text="Delete selected", command=self.delete_selected).pack(side="left", padx=4)
         ttk.Button(tool_bar, text="Transfer authorship", command=self.transfer_authorship_dialog).pack(side="left", padx=4)
         ttk.Button(tool_bar, text="Refresh", command=self.refresh).pack(side="left", padx=4)
+        # Shown while books are being loaded in the background
+        self.busy = BusyIndicator(tool_bar)
+        self.busy.pack(side="right", padx=4)
+
+        # Filter bar
+        filter_bar = ttk.Frame(self)
+        filter_bar.pack(fill="x", padx=8)
+        self.name_f = ttk.Entry(filter_bar, width=24)
+        self.match_cb = ttk.Combobox(filter_bar, width=9, state="readonly", values=["prefix", "contains"])
+        self.match_cb.current(0)
+        self.publisher_f = ttk.Combobox(filter_bar, width=24, state="readonly", values=[""])
+        self.binding_f = ttk.Combobox(filter_bar, width=11, state="readonly", values=["", "hardcover", "paperback", "ebook"])
+        self.min_rating_f = ttk.Entry(filter_bar, width=6)
+        self.max_rating_f = ttk.Entry(filter_bar, width=6)
+        self.date_from_f = ttk.Entry(filter_bar, width=11)
+        self.date_to_f = ttk.Entry(filter_bar, width=11)
+        self.sort_cb = ttk.Combobox(filter_bar, width=15, state="readonly", values=list(SORT_COLUMNS))
+        self.sort_cb.set("name")
+        self.descending_v = tkinter.BooleanVar(value=False)
+        for col, (label, widget) in enumerate([("Name", self.name_f), ("Match", self.match_cb),
+                                               ("Publisher", self.publisher_f), ("Binding", self.binding_f)]):
+            ttk.Label(filter_bar, text=label).grid(row=0, column=col * 2, sticky="w", padx=(4, 2))
+            widget.grid(row=0, column=col * 2 + 1, sticky="w", pady=2)
+        for col, (label, widget) in enumerate([("Rating from", self.min_rating_f), ("to", self.max_rating_f),
+                                               ("Date from", self.date_from_f), ("to", self.date_to_f)]):
+            ttk.Label(filter_bar, text=label).grid(row=1, column=col * 2, sticky="w", padx=(4, 2))
+            widget.grid(row=1, column=col * 2 + 1, sticky="w", pady=2)
+        ttk.Label(filter_bar, text="Sort by").grid(row=0, column=8, sticky="w", padx=(12, 2))
+        self.sort_cb.grid(row=0, column=9, sticky="w")
+        ttk.Checkbutton(filter_bar, text="Descending", variable=self.descending_v).grid(row=1, column=8, columnspan=2, sticky="w", padx=(12, 2))
+        ttk.Button(filter_bar, text="Search", command=self.apply_filter).grid(row=0, column=10, padx=4)
+        ttk.Button(filter_bar, text="Clear", command=self.clear_filter).grid(row=1, column=10, padx=4)
+
+        # Active search: filter criteria and sort order used for all page loads
+        self.criteria = {}
+        self.sort = "name"
+        self.descending = False
+
+        # Loaded pages of book rows in display order, and whether more rows exist around them
+        self.pages = []
+        self._has_more_before = False
+        self._has_more_after = False
+        self._page_task = None
 
         # Treeview table for displaying books
+        table = ttk.Frame(self)
+        table.pack(fill="both", expand=True, padx=8, pady=8)
         columns = ("id", "name", "publisher", "publishment_date", "rating", "binding")
-        self.tree = ttk.Treeview(self, columns=columns, show="headings")
+        self.scrollbar = ttk.Scrollbar(table, orient="vertical")
+        # Several books can be selected (Shift/Ctrl+click) and deleted together
+        self.tree = ttk.Treeview(table, columns=columns, show="headings", selectmode="extended",
+                                 yscrollcommand=self._on_scroll)
+        self.scrollbar.config(command=self.tree.yview)
         # Setup headings and column widths
         for c, hdr in zip(columns, ["ID","Name","Publisher","Publishment date","Rating","Binding"]):
             self.tree.heading(c, text=hdr)
             self.tree.column(c, width=120 if c != "name" else 220)
-        self.tree.pack(fill="both", expand=True, padx=8, pady=8)
+        self.scrollbar.pack(side="right", fill="y")
+        self.tree.pack(side="left", fill="both", expand=True)
+        # Applies row changes to the Treeview item by item
+        # (Book rows format and memoize their display strings themselves)
+        self.rows = TreeSync(self.tree, key=lambda row: str(row.id), display=Book.display)
+        # Picks up books changed elsewhere through change tracking deltas
+        self.poller = DeltaPoller(self, lambda since: self.repo.fetch_changes(since, self.criteria),
+                                  self.apply_delta, busy=lambda: self._page_task is not None)
+
+    def load(self):
+        """
+        Initial data load, called by LibraryApp when the tab is first shown.
+        Publishers and the first page of books are loaded in the background.
+        """
+        self.load_publishers()
+        self.refresh()
+
+    def load_publishers(self):
+        """
+        Loads publishers for the publisher filter in the background.
+        """
+        executor.submit(
+            self, PublisherRepository().fetch_all,
+            on_success=lambda rows: self.publisher_f.config(values=[""] + [f"{p[0]} - {p[1]}" for p in rows]),
+            on_error=lambda e: messagebox.showerror("Error while loading publishers", str(e)),
+            busy=self.busy,
+        )
 
-        # Load initial data
+    def apply_filter(self):
+        """
+        Validates the filter bar and loads the first page of matching books.
+        """
+        try:
+            criteria = {
+                "name": self.name_f.get().strip() or None,
+                "name_match": self.match_cb.get(),
+                "binding": self.binding_f.get() or None,
+                "min_rating": validate_rating(self.min_rating_f.get().strip()),
+                "max_rating": validate_rating(self.max_rating_f.get().strip()),
+            }
+            publisher = self.publisher_f.get()
+            if publisher:
+                criteria["publisher_id"] = int(publisher.split(" - ")[0])
+        except ValueError as e:
+            messagebox.showerror("Invalid filter", str(e))
+            return
+        try:
+            criteria["date_from"] = validate_date(self.date_from_f.get().strip())
+            criteria["date_to"] = validate_date(self.date_to_f.get().strip())
+        except ValueError as e:
+            messagebox.showerror("Invalid Date", str(e))
+            return
+
+        self.criteria = criteria
+        self.sort = self.sort_cb.get()
+        self.descending = self.descending_v.get()
+        self.pages = []
         self.refresh()
 
+    def clear_filter(self):
+        """
+        Resets the filter bar and shows all books sorted by name.
+        """
+        for entry in (self.name_f, self.min_rating_f, self.max_rating_f, self.date_from_f, self.date_to_f):
+            entry.delete(0, "end")
+        self.match_cb.current(0)
+        self.publisher_f.set("")
+        self.binding_f.set("")
+        self.sort_cb.set("name")
+        self.descending_v.set(False)
+        self.apply_filter()
+
     def refresh(self):
         """
-        Reloads all books from the database and updates the Treeview.
+        Reloads the books currently held in the Treeview in the background.
 
-        Converts None or special types (like datetime) to readable strings for display.
+        The loaded window is fetched again from its first row and compared
+        with the shown rows by ID; only inserted, changed and deleted books
+        are applied to the Treeview. Without loaded rows the first page
+        is loaded.
         """
+        if not self.pages:
+            self._load(self._show_first_page, track=True)
+            return
+        limit = sum(len(page) for page in self.pages)
+        if self._has_more_before:
+            self._load(lambda rows: self._show_window(rows, limit),
+                       after=self._key(self.pages[0][0]), inclusive=True, limit=limit, track=True)
+        else:
+            self._load(lambda rows: self._show_window(rows, limit), limit=limit, track=True)
+
+    def _load(self, on_success, limit=PAGE_SIZE, track=False, **page_args):
+        """
+        Fetches one page of the active search with BookRepository.search() on a worker thread.
+
+        :param track: Also take a new change tracking watermark for delta polling
+                      (for loads that replace everything shown)
+        """
+        if self._page_task is not None:
+            self._page_task.cancel()
+
+        fn, args = self.repo.search, (self.criteria, self.sort, self.descending)
+        if track:
+            fn, args = load_versioned, (self.repo, self.repo.search) + args
+            show = on_success
+
+            def on_success(result):
+                version, rows = result
+                show(rows)
+                self.poller.start(version)
+
+        def done():
+            # Only forget the task if no newer load has replaced it
+            if self._page_task is task:
+                self._page_task = None
 
+        task = executor.submit(
+            self, fn, *args, limit=limit, **page_args,
+            on_success=on_success,
+            on_error=lambda e: messagebox.showerror("Error while loading books", str(e)),
+            on_done=done,
+            busy=self.busy,
+        )
+        self._page_task = task
+
+    def _show_first_page(self, rows):
         # Clear existing rows
-        for i in self.tree.get_children():
-            self.tree.delete(i)
-
-        # Load rows from repository
-        for row in self.repo.get_all():
-            display_row = [
-                str(row[0]),  # ID
-                row[1] or "",  # ID
-                str(row[2]) if row[2] is not None else "",  # Publisher ID
-                row[3].strftime("%Y-%m-%d") if row[3] else "",  # Publishment date
-                f"{row[4]:.2f}" if row[4] is not None else "",  # Rating
-                row[5] or ""  # Binding
-            ]
-            self.tree.insert("", "end", values=display_row)
+        self.rows.clear()
+        self.pages = []
+        self._has_more_before = False
+        self._append_page(rows)
+
+    def _show_window(self, rows, limit):
+        """
+        Applies a reloaded window of rows to the Treeview as a diff.
+        """
+        self._has_more_after = len(rows) == limit
+        self.rows.sync(rows)
+        self.pages = [rows[i:i + PAGE_SIZE] for i in range(0, len(rows), PAGE_SIZE)]
+
+    def _append_page(self, rows):
+        """
+        Adds a page below the loaded rows and evicts the topmost page
+        when more than MAX_PAGES are held.
+        """
+        self._has_more_after = len(rows) == PAGE_SIZE
+        if not rows:
+            return
+        self.rows.insert(rows)
+        self.pages.append(rows)
+        if len(self.pages) > MAX_PAGES:
+            evicted = self.pages.pop(0)
+            self._keep_view(lambda: self.rows.delete(evicted), -len(evicted))
+            self._has_more_before = True
+
+    def _prepend_page(self, rows):
+        """
+        Adds a page above the loaded rows and evicts the bottom page
+        when more than MAX_PAGES are held.
+        """
+        self._has_more_before = len(rows) == PAGE_SIZE
+        if not rows:
+            return
+
+        self._keep_view(lambda: self.rows.insert(rows, index=0), len(rows))
+        self.pages.insert(0, rows)
+        if len(self.pages) > MAX_PAGES:
+            evicted = self.pages.pop()
+            self.rows.delete(evicted)
+            self._has_more_after = True
+
+    def _keep_view(self, change, shift):
+        """
+        Applies a change that adds or removes `shift` rows above the visible
+        area and scrolls so that the same rows stay in view.
+        """
+        old_total = len(self.tree.get_children())
+        top = round(self.tree.yview()[0] * old_total)
+        change()
+        new_total = len(self.tree.get_children())
+        if new_total:
+            self.tree.yview_moveto(max(0, top + shift) / new_total)
+
+    def _on_scroll(self, first, last):
+        """
+        Scroll callback of the Treeview: updates the scrollbar and loads
+        the adjacent page when the view gets close to an edge.
+        """
+        self.scrollbar.set(first, last)
+        if self._page_task is not None or not self.pages:
+            return
+        if float(last) >= 1 - PREFETCH_MARGIN and self._has_more_after:
+            self._load(self._append_page, after=self._key(self.pages[-1][-1]))
+        elif float(first) <= PREFETCH_MARGIN and self._has_more_before:
+            self._load(self._prepend_page, before=self._key(self.pages[0][0]))
+
+    def _key(self, row):
+        """
+        Keyset pagination key of a row for the active sort order.
+        """
+        return self.repo.sort_key(row, self.sort)
+
+    def apply_delta(self, delta):
+        """
+        Applies books changed in the database since the last load
+        (see BookRepository.fetch_changes()).
+
+        Deleted books and books no longer matching the filter are removed
+        and changed books keeping their place are updated in place. Books
+        sorting into the loaded window and shown books whose sort position
+        changed make the window reload; books sorting before or after the
+        window are ignored until the user pages to them (see delta_action()).
+        """
+        if delta.reset:
+            self.refresh()
+            return
+        removed = [str(book_id) for book_id in delta.removed if str(book_id) in self.rows.shown]
+        if removed:
+            self._remove_rows(removed)
+
+        positions = {str(row[0]): (p, i) for p, page in enumerate(self.pages) for i, row in enumerate(page)}
+        # Open-ended sides of the window take every key
+        first_key = self._key(self.pages[0][0]) if self.pages and self._has_more_before else None
+        last_key = self._key(self.pages[-1][-1]) if self.pages and self._has_more_after else None
+        changed = []
+        for row in delta.changed:
+            position = positions.get(str(row[0]))
+            old_key = None if position is None else self._key(self.pages[position[0]][position[1]])
+            action = delta_action(old_key, self._key(row), first_key, last_key, self.descending)
+            if action == "ignore":
+                continue
+            if action == "refresh":
+                self.refresh()
+                return
+            self.pages[position[0]][position[1]] = row
+            changed.append(row)
+        self.rows.update(changed)
 
     def delete_selected(self):
         """
-        Deletes the currently selected book from the database.
+        Deletes all selected books from the database in one transaction
+        (BookRepository.delete_many()).
 
-        Prompts the user if no selection is made.
+        Prompts the user if no selection is made and asks for confirmation.
+        Deleted rows are removed from the Treeview without reloading it.
         """
         sel = self.tree.selection()
         if not sel:
             messagebox.showinfo("Choice", "Choose a book")
             return
+        if not messagebox.askyesno("Delete", f"Delete {len(sel)} selected book(s)?"):
+            return
 
-        book_id = int(self.tree.item(sel[0])["values"][0])
-        self.repo.delete(book_id)
-        self.refresh()
+        # Item ids are the book IDs (see TreeSync key)
+        book_ids = [int(iid) for iid in sel]
+        executor.submit(
+            self, self.repo.delete_many, book_ids,
+            on_success=lambda _: self._remove_rows(sel),
+            on_error=lambda e: messagebox.showerror("Error while deleting books", str(e)),
+            busy=self.busy,
+        )
+
+    def _remove_rows(self, iids):
+        """
+        Removes deleted books from the Treeview and the loaded pages.
+        """
+        removed = set(iids)
+        self.rows.delete_ids(iids)
+        pages = [[row for row in page if str(row[0]) not in removed] for page in self.pages]
+        self.pages = [page for page in pages if page]
+        if not self.pages:
+            # Everything loaded was deleted; load whatever follows
+            self.refresh()
 
     def add_book_dialog(self):
         """
@@ -0,0 +1,97 @@
+import logging
+import tkinter
+
+from src.config import config
+from src.db.change_tracking import ChangeTrackingUnavailable
+from src.ui.background import executor
+
+# How often (ms) visible tabs ask the database for changed rows
+POLL_INTERVAL_MS = int(config.getfloat("app", "delta_poll_interval", fallback=10) * 1000)
+
+
+def load_versioned(repo, fn, *args, **kwargs):
+    """
+    Runs a full load together with the change tracking version taken
+    before it (worker thread).
+
+    :param repo: Repository providing current_version()
+    :param fn: Load function, e.g. repo.get_all
+    :return: Tuple (version or None if change tracking is not enabled, result of fn)
+    """
+    try:
+        version = repo.current_version()
+    except ChangeTrackingUnavailable:
+        version = None
+    return version, fn(*args, **kwargs)
+
+
+class DeltaPoller:
+    """
+    Periodically fetches the rows changed since the last known change
+    tracking version and hands them to a tab.
+
+    A poll is skipped while the widget is not visible or the tab is busy
+    loading; it is a single cheap query returning nothing when no data has
+    changed. Polling stops if change tracking is not enabled in the database.
+    """
+    def __init__(self, widget, fetch, apply, busy=None, interval=POLL_INTERVAL_MS):
+        """
+        :param widget: Tab owning the poller
+        :param fetch: Callable(since) returning a Delta (runs on a worker thread)
+        :param apply: Called on the Tk thread with each non-empty Delta
+        :param busy: Optional callable returning True while polls should be skipped
+        :param interval: Milliseconds between polls
+        """
+        self.widget = widget
+        self.fetch = fetch
+        self.apply = apply
+        self.busy = busy
+        self.interval = interval
+        self.version = None
+        self._task = None
+        self._scheduled = False
+
+    def start(self, version):
+        """
+        Sets the watermark after a full load and starts polling.
+
+        :param version: Version returned by load_versioned(); None disables polling
+        """
+        self.version = version
+        if version is not None and not self._scheduled:
+            self._scheduled = True
+            self.widget.after(self.interval, self._poll)
+
+    def _poll(self):
+        try:
+            alive = bool(self.widget.winfo_exists())
+        except tkinter.TclError:
+            alive = False
+        if not alive or self.version is None:
+            self._scheduled = False
+            return
+        self.widget.after(self.interval, self._poll)
+        if self._task is not None or not self.widget.winfo_viewable() or (self.busy and self.busy()):
+            return
+        self._task = executor.submit(
+            self.widget, self.fetch, self.version,
+            on_success=self._received,
+            on_error=self._failed,
+            on_done=self._done,
+        )
+
+    def _received(self, delta):
+        self.version = delta.version
+        if delta:
+            self.apply(delta)
+
+    def _failed(self, error):
+        if isinstance(error, ChangeTrackingUnavailable):
+            logging.warning("Delta refresh disabled: %s", error)
+            self.version = None
+        else:
+            # Keep the watermark; the next poll asks for the same changes again
+            logging.warning("Delta refresh failed: %s", error)
+
+    def _done(self):
+        self._task = None
@@ -0,0 +1,113 @@
+from tkinter import ttk, filedialog, messagebox
+
+from src.db.cache import reference_cache
+from src.db.connection import get_pool
+from src.db.instrumentation import SLOW_QUERY_MS, metrics
+from src.ui.tree_sync import TreeSync
+
+# Refresh interval (ms) of the statistics while the tab is visible
+AUTO_REFRESH_MS = 2000
+
+class DiagnosticsTab(ttk.Frame):
+    """
+    UI tab showing query instrumentation data.
+
+    Features:
+    - Call counts, rows and p50/p95/p99 latencies of repository methods,
+      SQL statements and connection checkouts (src/db/instrumentation.py)
+    - Connection pool and reference cache statistics
+    - Export of all statistics as JSON
+    - Reset of the collected statistics
+    """
+    def __init__(self, parent):
+        """
+        Initializes the Diagnostics tab and its UI components.
+
+        :param parent: Parent widget (Notebook)
+        """
+        super().__init__(parent)
+
+        # Toolbar frame for buttons
+        tool_bar = ttk.Frame(self)
+        tool_bar.pack(fill="x", padx=8, pady=8)
+        ttk.Button(tool_bar, text="Refresh", command=self.refresh).pack(side="left", padx=4)
+        ttk.Button(tool_bar, text="Reset", command=self.reset).pack(side="left", padx=4)
+        ttk.Button(tool_bar, text="Export JSON...", command=self.export_json).pack(side="left", padx=4)
+        ttk.Label(tool_bar, text=f"Slow query threshold: {SLOW_QUERY_MS:g} ms").pack(side="right", padx=4)
+
+        # Pool and cache counters
+        self.summary = ttk.Label(self, text="")
+        self.summary.pack(anchor="w", padx=8)
+
+        # Treeview table with one row per operation
+        columns = ("kind", "name", "calls", "errors", "rows", "avg_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms")
+        headers = ["Kind", "Operation", "Calls", "Errors", "Rows", "Avg ms", "p50 ms", "p95 ms", "p99 ms", "Max ms"]
+        frame = ttk.Frame(self)
+        frame.pack(fill="both", expand=True, padx=8, pady=8)
+        self.tree = ttk.Treeview(frame, columns=columns, show="headings")
+        scrollbar = ttk.Scrollbar(frame, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        for c, hdr in zip(columns, headers):
+            self.tree.heading(c, text=hdr)
+            self.tree.column(c, width=300 if c == "name" else 70, stretch=(c == "name"),
+                             anchor="w" if c in ("kind", "name") else "e")
+        scrollbar.pack(side="right", fill="y")
+        self.tree.pack(side="left", fill="both", expand=True)
+        # Periodic refreshes only update changed rows, keeping scroll position and selection
+        self.rows = TreeSync(self.tree, key=lambda op: f"{op['kind']}:{op['name']}", display=self._display_row)
+
+        self._after_id = None
+        self.bind("<Map>", lambda e: self._schedule())
+        self.bind("<Unmap>", lambda e: self._cancel_schedule())
+
+    def refresh(self):
+        """
+        Shows the current statistics (slowest total time first).
+        The data is in memory, so no background work is needed.
+        """
+        self.rows.sync(metrics.snapshot())
+        pool = get_pool().stats()
+        cache = reference_cache.stats()
+        self.summary.config(text=(
+            f"Pool: {pool['size']} open, {pool['idle']} idle, hit ratio {pool['hit_ratio']:.0%}, "
+            f"{pool['waits']} wait(s), {pool['timeouts']} timeout(s)    "
+            f"Cache: {cache['hits']} hit(s), {cache['misses']} miss(es), {cache['entries']} entries"
+        ))
+
+    def reset(self):
+        """
+        Clears the collected operation statistics.
+        """
+        metrics.reset()
+        self.refresh()
+
+    def export_json(self):
+        """
+        Saves operation, pool and cache statistics to a JSON file.
+        """
+        path = filedialog.asksaveasfilename(title="Export diagnostics", defaultextension=".json",
+                                            filetypes=[("JSON", "*.json")])
+        if not path:
+            return
+        try:
+            metrics.export_json(path, extra={"pool": get_pool().stats(), "cache": reference_cache.stats()})
+        except OSError as e:
+            messagebox.showerror("Export error", str(e))
+            return
+        messagebox.showinfo("Export", f"Diagnostics saved to {path}")
+
+    @staticmethod
+    def _display_row(op):
+        return [op["kind"], op["name"], op["calls"], op["errors"], op["rows"],
+                *(f"{op[key]:.1f}" for key in ("avg_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"))]
+
+    def _schedule(self):
+        # Refreshes periodically while the tab is shown
+        self._cancel_schedule()
+        self.refresh()
+        self._after_id = self.after(AUTO_REFRESH_MS, self._schedule)
+
+    def _cancel_schedule(self):
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
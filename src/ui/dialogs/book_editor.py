@@ -5,6 +5,8 @@ from src.db.repositories.author_repository import AuthorRepository
 from src.db.repositories.book_repository import BookRepository
 from src.db.repositories.bookauthor_repository import BookAuthorRepository
 from src.db.repositories.publisher_repository import PublisherRepository
+from src.db.unit_of_work import UnitOfWork
+from src.ui.background import BusyIndicator, executor
 from src.validation.validators import validate_rating, validate_binding, validate_date
 
 
@@ -65,10 +67,18 @@ class BookEditor(tkinter.Toplevel):
 
         # Buttons
         buttons = ttk.Frame(self); buttons.pack(fill="x", padx=10, pady=10)
-        ttk.Button(buttons, text="Save", command=self.save).pack(side="left", padx=5)
+        self.save_btn = ttk.Button(buttons, text="Save", command=self.save)
+        self.save_btn.pack(side="left", padx=5)
         ttk.Button(buttons, text="Close", command=self.destroy).pack(side="right", padx=5)
+        self.busy = BusyIndicator(buttons)
+        self.busy.pack(side="left", padx=5)
 
-        # Load data for comboboxes and lists
+        # Data loaded in the background; the book form is filled once all of it has arrived
+        self.publishers = None
+        self.authors = None
+        self.book_data = None
+
+        # Load data for comboboxes and lists (independent loads run in parallel)
         self.load_publishers()
         self.load_authors()
 
@@ -78,32 +88,69 @@ class BookEditor(tkinter.Toplevel):
 
     def load_publishers(self):
         """
-        Loads publishers from the database and fills the publisher combobox.
+        Loads publishers in the background and fills the publisher combobox.
         """
-        self.publishers = self.publisher_repo.fetch_all()
+        executor.submit(
+            self, self.publisher_repo.fetch_all,
+            on_success=self._show_publishers,
+            on_error=lambda e: messagebox.showerror("Error while loading publishers", str(e)),
+            busy=self.busy,
+        )
+
+    def _show_publishers(self, publishers):
+        self.publishers = publishers
         self.publisher_cb["values"] = [f"{p[0]} - {p[1]}" for p in self.publishers]
+        self._fill_book()
 
     def load_authors(self):
         """
-        Loads active authors from the database and fills the author listbox.
+        Loads active authors in the background and fills the author listbox.
         """
-        try:
-            self.authors = self.author_repo.get_all(active_only=True)
-            for a in self.authors:
-                self.author_lb.insert("end", f"{a[0]} - {a[1]} {a[2]}")
-        except Exception as e:
-            messagebox.showerror("Error while loading authors", str(e))
+        executor.submit(
+            self, self.author_repo.get_all, active_only=True,
+            on_success=self._show_authors,
+            on_error=lambda e: messagebox.showerror("Error while loading authors", str(e)),
+            busy=self.busy,
+        )
+
+    def _show_authors(self, authors):
+        self.authors = authors
+        for a in self.authors:
+            self.author_lb.insert("end", f"{a[0]} - {a[1]} {a[2]}")
+        self._fill_book()
 
     def load_book(self):
         """
-        Loads book data for edit mode and pre-fills the form,
-        including currently assigned active authors.
+        Loads book data and its currently assigned active authors
+        in the background for edit mode.
         """
-        book = self.book_repo.fetch_by_id(self.book_id)
+        def fetch():
+            return self.book_repo.fetch_by_id(self.book_id), self.book_author_repo.fetch_active_authors(self.book_id)
+
+        executor.submit(
+            self, fetch,
+            on_success=self._show_book,
+            on_error=lambda e: messagebox.showerror("Error while loading book", str(e)),
+            busy=self.busy,
+        )
+
+    def _show_book(self, data):
+        book, _ = data
         if not book:
             messagebox.showerror("Error", "Book not found")
             self.destroy()
             return
+        self.book_data = data
+        self._fill_book()
+
+    def _fill_book(self):
+        """
+        Pre-fills the form in edit mode, including currently assigned
+        active authors, once the book, publishers and authors are loaded.
+        """
+        if self.book_data is None or self.publishers is None or self.authors is None:
+            return
+        book, active_author_ids = self.book_data
 
         # Fill book fields
         self.name_e.insert(0, book[1])
@@ -117,7 +164,6 @@ class BookEditor(tkinter.Toplevel):
                 self.publisher_cb.current(idx)
 
         # Select active authors
-        active_author_ids = self.book_author_repo.fetch_active_authors(self.book_id)
         for i, a in enumerate(self.authors):
             if a[0] in active_author_ids:
                 self.author_lb.select_set(i)
@@ -134,25 +180,43 @@ class BookEditor(tkinter.Toplevel):
             pub_val = self.publisher_cb.get()
             if not pub_val: raise ValueError("Choose a publisher")
             publisher_id = int(pub_val.split(" - ")[0])
-            date_str = self.date.get().strip() or None
             rating = validate_rating(self.rating.get().strip())
             binding = self.binding_cb.get(); validate_binding(binding)
             author_ids = [int(self.author_lb.get(i).split(" - ")[0]) for i in self.author_lb.curselection()]
-            date_str = validate_date(self.date.get().strip())
-
-            if self.date.get().strip() and date_str is None:
-                return
-            if self.mode=="create":
-                book_id = self.book_repo.insert(name, publisher_id, date_str, rating, binding)
-                self.book_author_repo.assign_authors(book_id, author_ids)
-            else:
-                self.book_repo.update(self.book_id, name, publisher_id, date_str, rating, binding)
-                self.book_author_repo.assign_authors(self.book_id, author_ids, overwrite=True)
-
-            messagebox.showinfo("Done","Book saved")
-            self.master.refresh()
-            self.destroy()
         except Exception as e:
             messagebox.showerror("Error", str(e))
+            return
+        # Invalid dates are reported under their own title
+        try:
+            date_str = validate_date(self.date.get().strip())
+        except ValueError as e:
+            messagebox.showerror("Invalid Date", str(e))
+            return
+
+        def write():
+            # Book and its authors are saved in one transaction
+            with UnitOfWork() as uow:
+                book_repo = BookRepository(uow)
+                book_author_repo = BookAuthorRepository(uow)
+                if self.mode=="create":
+                    book_id = book_repo.insert(name, publisher_id, date_str, rating, binding)
+                    book_author_repo.assign_authors(book_id, author_ids)
+                else:
+                    book_repo.update(self.book_id, name, publisher_id, date_str, rating, binding)
+                    book_author_repo.assign_authors(self.book_id, author_ids, overwrite=True)
+
+        self.save_btn.config(state="disabled")
+        executor.submit(
+            self, write,
+            on_success=lambda _: self._saved(),
+            on_error=lambda e: messagebox.showerror("Error", str(e)),
+            on_done=lambda: self.save_btn.config(state="normal"),
+            busy=self.busy,
+        )
+
+    def _saved(self):
+        messagebox.showinfo("Done","Book saved")
+        self.master.refresh()
+        self.destroy()
 
 
@@ -0,0 +1,115 @@
+import tkinter
+from tkinter import ttk, messagebox
+
+from src.db.repositories.author_repository import AuthorRepository
+from src.db.repositories.bookauthor_repository import BookAuthorRepository
+from src.db.unit_of_work import UnitOfWork
+from src.ui.background import BusyIndicator, executor
+
+class MergeAuthors(tkinter.Toplevel):
+    """
+    Dialog window used to merge a duplicate author into another author.
+
+    The merge is implemented by:
+    - transferring all books of the duplicate author to the kept author
+      (BookAuthorRepository.transfer_all(), one set-based statement)
+    - optionally deactivating the duplicate author
+
+    Both steps run in one transaction.
+    """
+    def __init__(self, author_tab):
+        """
+        Initializes the merge dialog.
+
+        :param author_tab: Parent AuthorTab instance (used to refresh data)
+        """
+        super().__init__(author_tab)
+        self.title("Merge Authors")
+        self.geometry("440x220")
+        self.author_tab = author_tab
+
+        # Initialize repositories
+        self.author_repo = AuthorRepository()
+
+        # Main frame
+        frame = ttk.Frame(self)
+        frame.pack(fill="both", expand=True, padx=10, pady=10)
+
+        # Duplicate author (books are taken from this author)
+        ttk.Label(frame, text="Duplicate author").grid(row=0, column=0, sticky="w")
+        self.from_cb = ttk.Combobox(frame, width=35, state="readonly")
+        self.from_cb.grid(row=0, column=1)
+
+        # Author that is kept and receives the books
+        ttk.Label(frame, text="Merge into").grid(row=1, column=0, sticky="w")
+        self.to_cb = ttk.Combobox(frame, width=35, state="readonly")
+        self.to_cb.grid(row=1, column=1)
+
+        self.deactivate_v = tkinter.BooleanVar(value=True)
+        ttk.Checkbutton(frame, text="Deactivate the duplicate author", variable=self.deactivate_v).grid(
+            row=2, column=0, columnspan=2, sticky="w", pady=6)
+
+        # Action buttons
+        ttk.Button(frame, text="Merge", command=self.merge).grid(row=3, column=0, columnspan=2, pady=6)
+        self.busy = BusyIndicator(frame)
+        self.busy.grid(row=4, column=0, columnspan=2)
+
+        # Initial data loading in the background
+        self.load_authors()
+
+    def load_authors(self):
+        """
+        Loads all authors in the background and fills both comboboxes.
+        """
+        executor.submit(
+            self, self.author_repo.get_all,
+            on_success=self._show_authors,
+            on_error=lambda e: messagebox.showerror("Error while loading authors", str(e)),
+            busy=self.busy,
+        )
+
+    def _show_authors(self, authors):
+        values = [f"{a[0]} - {a[1]} {a[2]}" + ("" if a[4] else " (inactive)") for a in authors]
+        self.from_cb["values"] = values
+        self.to_cb["values"] = values
+
+    def merge(self):
+        """
+        Performs the merge in the background after a confirmation.
+        """
+        try:
+            from_author_id = int(self.from_cb.get().split(" - ")[0])
+            to_author_id = int(self.to_cb.get().split(" - ")[0])
+        except ValueError:
+            messagebox.showerror("Error", "Choose both authors")
+            return
+        if from_author_id == to_author_id:
+            messagebox.showerror("Error", "Choose two different authors")
+            return
+        if not messagebox.askyesno("Merge", f"Move all books of {self.from_cb.get()}\nto {self.to_cb.get()}?"):
+            return
+        deactivate = self.deactivate_v.get()
+
+        def write():
+            # Transfer and deactivation run on one connection and are committed together
+            with UnitOfWork() as uow:
+                result = BookAuthorRepository(uow).transfer_all(from_author_id, to_author_id)
+                if deactivate:
+                    AuthorRepository(uow).deactivate(from_author_id)
+                return result
+
+        executor.submit(
+            self, write,
+            on_success=self._merged,
+            on_error=lambda e: messagebox.showerror("Merge error", str(e)),
+            busy=self.busy,
+        )
+
+    def _merged(self, result):
+        messagebox.showinfo(
+            "Done",
+            f"Transferred {result['transferred']} book(s); "
+            f"the author was already assigned to {result['already_author']} of them."
+        )
+        self.author_tab.refresh()
+        self.destroy()
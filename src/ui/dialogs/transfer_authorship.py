@@ -4,6 +4,8 @@ from tkinter import ttk, messagebox
 from src.db.repositories.author_repository import AuthorRepository
 from src.db.repositories.book_repository import BookRepository
 from src.db.repositories.bookauthor_repository import BookAuthorRepository
+from src.db.unit_of_work import UnitOfWork
+from src.ui.background import BusyIndicator, executor
 
 class TransferAuthorship(tkinter.Toplevel):
     """
@@ -55,25 +57,48 @@ class TransferAuthorship(tkinter.Toplevel):
         # Action buttons
         ttk.Button(frame, text="Load book authors", command=self.load_authors_for_book).grid(row=3, column=0, columnspan=2, pady=6)
         ttk.Button(frame, text="Transfer", command=self.transfer).grid(row=4, column=0, columnspan=2, pady=6)
+        self.busy = BusyIndicator(frame)
+        self.busy.grid(row=5, column=0, columnspan=2)
 
-        # Initial data loading
+        # Initial data loading (both lists are loaded in parallel in the background)
+        self.books = []
+        self.all_authors = []
         self.load_books()
         self.load_all_authors()
 
     def load_books(self):
         """
-        Loads all books from the database and fills the book combobox.
+        Loads all books in the background and fills the book combobox.
+
+        The books are loaded into a column-oriented BookColumns container
+        (BookRepository.fetch_columns()) instead of one Book per row, since
+        the picker lists the whole table.
         """
-        books = self.book_repo.get_all()
+        executor.submit(
+            self, self.book_repo.fetch_columns,
+            on_success=self._show_books,
+            on_error=lambda e: messagebox.showerror("Error while loading books", str(e)),
+            busy=self.busy,
+        )
+
+    def _show_books(self, books):
         self.books = books
-        self.book_cb["values"] = [f"{b[0]} - {b[1]}" for b in books]
+        self.book_cb["values"] = [f"{book_id} - {books.name(i)}" for i, book_id in enumerate(books.ids)]
 
     def load_all_authors(self):
         """
-        Loads all active authors from the database
+        Loads all active authors in the background
         and fills the target author combobox.
         """
-        self.all_authors = self.author_repo.get_all(active_only=True)
+        executor.submit(
+            self, self.author_repo.get_all, active_only=True,
+            on_success=self._show_all_authors,
+            on_error=lambda e: messagebox.showerror("Error while loading authors", str(e)),
+            busy=self.busy,
+        )
+
+    def _show_all_authors(self, authors):
+        self.all_authors = authors
         self.to_cb["values"] = [f"{a[0]} - {a[1]} {a[2]}" for a in self.all_authors]
 
     def load_authors_for_book(self):
@@ -87,13 +112,20 @@ class TransferAuthorship(tkinter.Toplevel):
             return
 
         book_id = int(val.split(" - ")[0])
-        active_author_ids = self.book_author_repo.fetch_active_authors(book_id)
+        executor.submit(
+            self, self.book_author_repo.fetch_active_authors, book_id,
+            on_success=self._show_authors_for_book,
+            on_error=lambda e: messagebox.showerror("Error while loading authors", str(e)),
+            busy=self.busy,
+        )
+
+    def _show_authors_for_book(self, active_author_ids):
         authors_in_book = [a for a in self.all_authors if a[0] in active_author_ids]
         self.from_cb["values"] = [f"{a[0]} - {a[1]} {a[2]}" for a in authors_in_book]
 
     def transfer(self):
         """
-        Performs the authorship transfer.
+        Performs the authorship transfer in the background.
 
         The original author is deactivated for the book,
         and the new author is assigned or reactivated.
@@ -106,14 +138,23 @@ class TransferAuthorship(tkinter.Toplevel):
             messagebox.showerror("Error", "Fill all fields")
             return
 
-        try:
-            # Deactivate original author
-            self.book_author_repo.deactivate_authors_for_author(book_id, from_author_id)
-            # Assign or activate new author
-            self.book_author_repo.assign_authors(book_id, [to_author_id])
-
-            messagebox.showinfo("Done", "The authorship was transferred")
-            self.book_tab.refresh()
-            self.destroy()
-        except Exception as e:
-            messagebox.showerror("Transfer error", str(e))
+        def write():
+            # Both steps run on one connection and are committed together
+            with UnitOfWork() as uow:
+                book_author_repo = BookAuthorRepository(uow)
+                # Deactivate original author
+                book_author_repo.deactivate_authors_for_author(book_id, from_author_id)
+                # Assign or activate new author
+                book_author_repo.assign_authors(book_id, [to_author_id])
+
+        executor.submit(
+            self, write,
+            on_success=lambda _: self._transferred(),
+            on_error=lambda e: messagebox.showerror("Transfer error", str(e)),
+            busy=self.busy,
+        )
+
+    def _transferred(self):
+        messagebox.showinfo("Done", "The authorship was transferred")
+        self.book_tab.refresh()
+        self.destroy()
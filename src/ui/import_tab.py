@@ -1,9 +1,14 @@
+import tkinter
 from tkinter import ttk, filedialog, messagebox
-import csv, json, xml.etree.ElementTree as ET
 
 from src.db.repositories.author_repository import AuthorRepository
 from src.db.repositories.genre_repository import GenreRepository
 from src.db.repositories.publisher_repository import PublisherRepository
+from src.importers.author_importer import import_authors_json
+from src.importers.genre_importer import import_genres_xml
+from src.importers.pipeline import ImportCheckpoint
+from src.importers.publisher_importer import import_publishers_csv
+from src.ui.background import BusyIndicator, executor
 
 class ImportTab(ttk.Frame):
     """
@@ -39,89 +44,131 @@ class ImportTab(ttk.Frame):
         ttk.Button(frame, text="Import publishers (CSV)", command=self.import_publishers_csv).pack(side="left", padx=6)
         ttk.Button(frame, text="Import authors (JSON)", command=self.import_authors_json).pack(side="left", padx=6)
         ttk.Button(frame, text="Import genres (XML)", command=self.import_genres_xml).pack(side="left", padx=6)
+        # Imports run in the background and can be cancelled after the current batch
+        self.cancel_btn = ttk.Button(frame, text="Cancel import", command=self.cancel_import, state="disabled")
+        self.cancel_btn.pack(side="left", padx=6)
+        # Upsert mode: stage the file, then insert new and update changed rows in one MERGE
+        self.upsert_v = tkinter.BooleanVar(value=False)
+        ttk.Checkbutton(frame, text="Update existing rows", variable=self.upsert_v).pack(side="left", padx=6)
+        self.busy = BusyIndicator(frame, text="Importing...")
+        self.busy.pack(side="right", padx=6)
+        self._task = None
+
+        # Progress of the running import
+        self.status = ttk.Label(self, text="")
+        self.status.pack(anchor="w", padx=8, pady=8)
 
     def import_publishers_csv(self):
         """
         Imports publishers from a CSV file safely.
 
         - Opens a file dialog for CSV selection.
-        - Validates that required fields (name) are present.
-        - Skips invalid rows without breaking the import.
+        - Streams rows through validation into the database in batches,
+          so memory use does not grow with the file size.
+        - Skips invalid rows (missing name) without breaking the import.
+        - Offers to resume after the last committed row of a failed import.
         - Shows warnings for skipped rows and info when import completes.
         """
         path = filedialog.askopenfilename(title="Publisher CSV", filetypes=[("CSV", "*.csv")])
         if not path:
             return
 
-        skipped_rows = []
-        inserted_count = 0
-        try:
-            with open(path, newline="", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                publishers = []
-                for i, row in enumerate(reader, start=1):
-                    # Strip whitespace from all fields
-                    row = {k: (v.strip() if v else None) for k, v in row.items()}
-
-                    # Check required field 'name'
-                    if not row.get("name"):
-                        skipped_rows.append(i)
-                        continue  # skip this row entirely
-
-                    publishers.append(row)
-
-                # Insert valid rows
-                if publishers:
-                    self.publisher_repo.bulk_insert(publishers)
-                    inserted_count = len(publishers)
-
-            # Show results
-            msg = f"CSV import completed.\nInserted {inserted_count} row(s)."
-            if skipped_rows:
-                msg += f"\nSkipped rows: {', '.join(map(str, skipped_rows))} (missing 'name')"
-            messagebox.showinfo("Done", msg)
-
-        except Exception as e:
-            messagebox.showerror("CSV import error", str(e))
+        self._start_import("CSV", import_publishers_csv, path, self.publisher_repo)
 
     def import_authors_json(self):
         """
-        Imports authors from a JSON file.
+        Imports authors from a JSON array or JSON Lines file.
 
         - Opens a file dialog for JSON selection
-        - Loads JSON data
-        - Calls AuthorRepository.bulk_insert() to insert records
-        - Shows a messagebox on success or error
+        - Parses the file incrementally, one author at a time
+        - Inserts authors in committed batches via AuthorRepository.bulk_insert()
+        - Shows progress while importing and a messagebox on success or error
         """
-        path = filedialog.askopenfilename(title="Author JSON", filetypes=[("JSON","*.json")])
+        path = filedialog.askopenfilename(title="Author JSON", filetypes=[("JSON", "*.json *.jsonl *.ndjson")])
         if not path: return
-        try:
-            with open(path, encoding="utf-8") as f:
-                data = json.load(f)
-                self.author_repo.bulk_insert(data)
-            messagebox.showinfo("Done","JSON import completed")
-        except Exception as e:
-            messagebox.showerror("JSON import error", str(e))
+        self._start_import("JSON", import_authors_json, path, self.author_repo)
 
     def import_genres_xml(self):
         """
         Imports genres from an XML file.
 
         - Opens a file dialog for XML selection
-        - Parses XML using ElementTree
-        - Extracts <genre> elements and their 'name' attributes or text
-        - Calls GenreRepository.bulk_insert() to insert records
-        - Shows a messagebox on success or error
+        - Streams <genre> elements with iterparse (name attribute or text)
+        - Inserts genres in committed batches via GenreRepository.bulk_insert()
+          while the document is still being parsed
+        - Shows progress while importing and a messagebox on success or error
         """
         path = filedialog.askopenfilename(title="Genre XML", filetypes=[("XML","*.xml")])
         if not path: return
-        try:
-            tree = ET.parse(path)
-            root = tree.getroot()
-            # Create list of genre dictionaries for insertion
-            genres = [{"name": g.get("name") or (g.text or "").strip()} for g in root.findall(".//genre")]
-            self.genre_repo.bulk_insert(genres)
-            messagebox.showinfo("Done","XML import completed")
-        except Exception as e:
-            messagebox.showerror("XML import error", str(e))
+        self._start_import("XML", import_genres_xml, path, self.genre_repo)
 
+    def cancel_import(self):
+        """
+        Cancels the running import after its current batch.
+        The import can be resumed later from the last committed record.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self.status.config(text="Cancelling after the current batch...")
+
+    def _start_import(self, kind, import_fn, path, repo):
+        """
+        Runs an importer on a worker thread so the window stays responsive.
+
+        :param kind: Format name used in messages (CSV, JSON, XML)
+        :param import_fn: Importer function (path, repo, resume=, progress=, upsert=)
+        :param path: Selected file
+        :param repo: Repository passed to the importer
+        """
+        if self._task is not None:
+            messagebox.showinfo("Import", "Another import is still running")
+            return
+        upsert = self.upsert_v.get()
+        # An upsert runs in one transaction, so there is nothing to resume
+        resume = True if upsert else self._ask_resume(path)
+        self.cancel_btn.config(state="normal")
+        self._task = executor.submit(
+            self, import_fn, path, repo, resume=resume, progress=self._report_progress, upsert=upsert,
+            on_success=lambda result: messagebox.showinfo("Done", f"{kind} import completed.\n{result.summary()}"),
+            on_error=lambda e: messagebox.showerror(f"{kind} import error", str(e)),
+            on_done=self._import_finished,
+            busy=self.busy,
+        )
+
+    def _import_finished(self):
+        cancelled = self._task.cancelled
+        self._task = None
+        self.cancel_btn.config(state="disabled")
+        self.status.config(text="Import cancelled; it can be resumed later." if cancelled else "")
+
+    def _ask_resume(self, path):
+        """
+        Asks whether to resume a previously failed import of the file.
+
+        :return: True to continue after the last committed record
+        """
+        last_offset = ImportCheckpoint.for_source(path).load()
+        if not last_offset:
+            return True
+        return messagebox.askyesno(
+            "Resume import",
+            f"A previous import of this file stopped after record {last_offset}.\nResume from there?"
+        )
+
+    def _report_progress(self, result):
+        """
+        Progress callback of the importers; runs on the worker thread
+        after each committed batch (or staged chunk in upsert mode).
+
+        :raises TaskCancelled: If the user cancelled the import
+        """
+        if self._task is not None:
+            self._task.raise_if_cancelled()
+        executor.call_in_ui(self._show_progress, result.processed, result.inserted)
+
+    def _show_progress(self, processed, inserted):
+        """
+        Updates the status label (Tk thread).
+        """
+        if self._task is not None:
+            self.status.config(text=f"Read {processed} record(s), inserted {inserted}...")
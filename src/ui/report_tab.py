@@ -1,5 +1,7 @@
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 from src.db.repositories.report_repository import ReportRepository
+from src.exporters.report_export import export_publisher_report
+from src.ui.background import BusyIndicator, executor
 
 class ReportTab(ttk.Frame):
     """
@@ -9,6 +11,8 @@ class ReportTab(ttk.Frame):
     - Generates a summary report per publisher
       showing number of books, average rating, and number of active authors
     - Displays results in a Treeview table
+    - Exports the report to a CSV or JSON Lines file (optionally gzipped)
+      without loading it into the table
     """
 
     def __init__(self, parent):
@@ -25,6 +29,17 @@ class ReportTab(ttk.Frame):
         tool_bar = ttk.Frame(self)
         tool_bar.pack(fill="x", padx=8, pady=8)
         ttk.Button(tool_bar, text="Generate a report", command=self.generate).pack(side="left", padx=4)
+        self.export_btn = ttk.Button(tool_bar, text="Export...", command=self.export)
+        self.export_btn.pack(side="left", padx=4)
+        self.cancel_export_btn = ttk.Button(tool_bar, text="Cancel export", command=self.cancel_export, state="disabled")
+        self.cancel_export_btn.pack(side="left", padx=4)
+        self.export_status = ttk.Label(tool_bar, text="")
+        self.export_status.pack(side="left", padx=4)
+        # Shown while the report is being generated in the background
+        self.busy = BusyIndicator(tool_bar, text="Generating...")
+        self.busy.pack(side="right", padx=4)
+        self._task = None
+        self._export_task = None
 
         # Treeview table to display report
         columns = ("publisher", "books_count", "avg_rating", "active_authors")
@@ -38,25 +53,89 @@ class ReportTab(ttk.Frame):
 
     def generate(self):
         """
-        Generates the publisher report and fills the Treeview table.
+        Generates the publisher report in the background.
 
         Steps:
-        - Clears any existing rows in the table
-        - Calls ReportRepository.get_publisher_report() to fetch data
-        - Inserts each row into the Treeview
-        - Converts None values to empty strings for display
+        - Cancels a report still being generated
+        - Calls ReportRepository.get_publisher_report() on a worker thread
+        - Fills the Treeview via show_rows() once the data has arrived
         - Shows an error messagebox if any exception occurs
         """
+        if self._task is not None:
+            self._task.cancel()
+        self._task = executor.submit(
+            self, self.repo.get_publisher_report,
+            on_success=self.show_rows,
+            # Display error if fetching report fails
+            on_error=lambda e: messagebox.showerror("Report error", str(e)),
+            busy=self.busy,
+        )
+
+    def show_rows(self, rows):
+        """
+        Replaces the Treeview content with the report rows,
+        converting None values to empty strings for display.
+        """
 
         # Clear existing table rows
         for i in self.tree.get_children():
             self.tree.delete(i)
-        try:
-            # Fetch report data from repository
-            rows = self.repo.get_publisher_report()
-            # Insert each row into Treeview
-            for r in rows:
-                self.tree.insert("", "end", values=[str(x) if x is not None else "" for x in r])
-        except Exception as e:
-            # Display error if fetching report fails
-            messagebox.showerror("Report error", str(e))
\ No newline at end of file
+        # Insert each row into Treeview
+        for r in rows:
+            self.tree.insert("", "end", values=[str(x) if x is not None else "" for x in r])
+
+    def export(self):
+        """
+        Exports the publisher report to a file in the background.
+
+        Rows are streamed from the database straight into the file
+        (CSV or JSON Lines, gzipped for a .gz name), so the export does
+        not go through the Treeview and its memory use stays constant.
+        """
+        if self._export_task is not None:
+            messagebox.showinfo("Export", "Another export is still running")
+            return
+        path = filedialog.asksaveasfilename(
+            title="Export report",
+            defaultextension=".csv",
+            filetypes=[("CSV", "*.csv"), ("JSON Lines", "*.jsonl"),
+                       ("Compressed CSV", "*.csv.gz"), ("Compressed JSON Lines", "*.jsonl.gz")],
+        )
+        if not path:
+            return
+        self.export_btn.config(state="disabled")
+        self.cancel_export_btn.config(state="normal")
+        self._export_task = executor.submit(
+            self, export_publisher_report, path, progress=self._report_export_progress,
+            on_success=lambda result: messagebox.showinfo("Export", result.summary()),
+            on_error=lambda e: messagebox.showerror("Export error", str(e)),
+            on_done=self._export_finished,
+            busy=self.busy,
+        )
+
+    def cancel_export(self):
+        """
+        Cancels the running export; the partially written file is removed.
+        """
+        if self._export_task is not None:
+            self._export_task.cancel()
+
+    def _export_finished(self):
+        self._export_task = None
+        self.export_btn.config(state="normal")
+        self.cancel_export_btn.config(state="disabled")
+        self.export_status.config(text="")
+
+    def _report_export_progress(self, result):
+        """
+        Progress callback of the export; runs on the worker thread.
+
+        :raises TaskCancelled: If the user cancelled the export
+        """
+        if self._export_task is not None:
+            self._export_task.raise_if_cancelled()
+        executor.call_in_ui(self._show_export_progress, result.rows)
+
+    def _show_export_progress(self, rows):
+        if self._export_task is not None:
+            self.export_status.config(text=f"Exported {rows} row(s)...")
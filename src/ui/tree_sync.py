@@ -0,0 +1,106 @@
+class TreeSync:
+    """
+    Keeps a Treeview in sync with a list of rows by applying only differences.
+
+    Items are identified by a key derived from each row (used as the
+    Treeview iid). The display values of every shown item are remembered,
+    so a refresh can tell changed rows from unchanged ones without reading
+    the widget back and only touches the items that differ.
+    """
+    def __init__(self, tree, key, display):
+        """
+        :param tree: ttk.Treeview to manage
+        :param key: Callable(row) returning the item id (string)
+        :param display: Callable(row) returning the list of display values
+        """
+        self.tree = tree
+        self.key = key
+        self.display = display
+        # iid -> display values currently shown
+        self.shown = {}
+
+    def insert(self, rows, index="end"):
+        """
+        Inserts rows at a position (index of the first new item or "end").
+        """
+        for offset, row in enumerate(rows):
+            iid = self.key(row)
+            values = tuple(self.display(row))
+            self.tree.insert("", index if index == "end" else index + offset, iid=iid, values=values)
+            self.shown[iid] = values
+
+    def update(self, rows):
+        """
+        Updates the values of already shown rows in place; rows that are
+        not shown are ignored.
+
+        :return: Number of changed items
+        """
+        updated = 0
+        for row in rows:
+            iid = self.key(row)
+            values = tuple(self.display(row))
+            if iid in self.shown and self.shown[iid] != values:
+                self.tree.item(iid, values=values)
+                self.shown[iid] = values
+                updated += 1
+        return updated
+
+    def delete(self, rows):
+        """
+        Removes the items of the given rows.
+        """
+        iids = [self.key(row) for row in rows]
+        self.delete_ids(iids)
+
+    def delete_ids(self, iids):
+        """
+        Removes items by their ids; unknown ids are ignored.
+        """
+        iids = [iid for iid in iids if iid in self.shown]
+        if iids:
+            self.tree.delete(*iids)
+            for iid in iids:
+                del self.shown[iid]
+
+    def clear(self):
+        self.tree.delete(*self.tree.get_children())
+        self.shown = {}
+
+    def sync(self, rows):
+        """
+        Makes the Treeview show exactly `rows` in the given order.
+
+        Only missing items are inserted, vanished items deleted, changed
+        items updated and displaced items moved.
+
+        :param rows: New rows in display order
+        :return: Tuple (inserted, updated, deleted) with the number of changed items
+        """
+        new = {}
+        for row in rows:
+            new[self.key(row)] = row
+
+        gone = [iid for iid in self.shown if iid not in new]
+        self.delete_ids(gone)
+
+        inserted = updated = 0
+        children = list(self.tree.get_children())
+        for i, (iid, row) in enumerate(new.items()):
+            values = tuple(self.display(row))
+            if iid not in self.shown:
+                self.tree.insert("", i, iid=iid, values=values)
+                self.shown[iid] = values
+                children.insert(i, iid)
+                inserted += 1
+                continue
+            if self.shown[iid] != values:
+                self.tree.item(iid, values=values)
+                self.shown[iid] = values
+                updated += 1
+            if children[i] != iid:
+                # Row moved (e.g. renamed book); the list is only rebuilt for moved items
+                self.tree.move(iid, "", i)
+                children.remove(iid)
+                children.insert(i, iid)
+        return inserted, updated, len(gone)
@@ -0,0 +1,258 @@
+"""
+Batch validation of records before they are loaded into the database.
+
+A Schema checks a whole batch of records one column at a time: the values
+of a field are collected into a list once and every rule runs over that
+list, instead of calling a validation function per value. Errors are
+collected as RowError objects; nothing is raised and no UI is involved,
+so the same schemas serve the importers, the ingest service and the CLI.
+"""
+import datetime
+import re
+
+from src.validation.validators import ALLOWED_BINDINGS
+
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+# Values the repositories convert with int()
+_BOOLEANS = frozenset({True, False, "1", "0"})
+
+
+class RowError:
+    """
+    One validation error.
+
+    Attributes:
+        row: Offset of the record in its source (line or record number)
+        field (str): Field name, or None for errors of the whole record
+        message (str): Error message
+    """
+    __slots__ = ("row", "field", "message")
+
+    def __init__(self, row, field, message):
+        self.row = row
+        self.field = field
+        self.message = message
+
+    def __repr__(self):
+        return f"RowError(row={self.row!r}, field={self.field!r}, message={self.message!r})"
+
+
+class BatchResult:
+    """
+    Outcome of validating a batch.
+
+    Attributes:
+        valid (list): (offset, record) pairs without errors, in input order
+        errors (list): RowError objects ordered by row
+    """
+    def __init__(self, valid, errors):
+        self.valid = valid
+        self.errors = errors
+
+    def by_row(self):
+        """
+        :return: Dictionary row offset -> list of RowError, in row order
+        """
+        rows = {}
+        for error in self.errors:
+            rows.setdefault(error.row, []).append(error)
+        return rows
+
+    def reasons(self):
+        """
+        :return: List of (row offset, message) pairs, one per invalid row,
+                 with all messages of the row joined
+        """
+        return [(row, "; ".join(e.message for e in errors)) for row, errors in self.by_row().items()]
+
+
+class Field:
+    """
+    Rules for one field of a record.
+
+    Empty values (None or "") only fail the `required` rule, or are
+    replaced by the field's default; all other rules check present values. After the first failing rule a value is
+    not checked further, so every field reports at most one error per row.
+    """
+    def __init__(self, name, required=False, text=False, max_length=None, choices=None,
+                 integer=False, number=False, minimum=None, maximum=None,
+                 date=False, boolean=False, default=None):
+        """
+        :param name: Key of the field in the record dictionaries
+        :param required: Value must not be empty
+        :param text: Value must be a string
+        :param max_length: Maximum string length (target column size)
+        :param choices: Allowed values
+        :param integer: Value must be an integer (or a string of one)
+        :param number: Value must be a number (or a string of one)
+        :param minimum: Inclusive lower bound of a number
+        :param maximum: Inclusive upper bound of a number
+        :param date: Value must be a date or a YYYY-MM-DD string
+        :param boolean: Value must be a boolean (or 0/1)
+        :param default: Value written into records whose value is empty
+                        (the value the repository would use anyway)
+        """
+        self.name = name
+        self.required = required
+        self.default = default
+        self.rules = []
+        if text:
+            self.rules.append((_is_text, f"'{name}' must be text"))
+        if max_length is not None:
+            self.rules.append((lambda v: len(str(v)) <= max_length, f"'{name}' longer than {max_length} characters"))
+        if choices is not None:
+            allowed = frozenset(choices)
+            self.rules.append((lambda v: v in allowed, f"'{name}' must be one of: {', '.join(choices)}"))
+        if integer:
+            self.rules.append((_is_integer, f"'{name}' must be a whole number"))
+        if number:
+            self.rules.append((_is_number, f"'{name}' must be a number"))
+        if minimum is not None or maximum is not None:
+            low = float("-inf") if minimum is None else minimum
+            high = float("inf") if maximum is None else maximum
+            self.rules.append((lambda v: low <= float(v) <= high, f"'{name}' must be between {minimum} and {maximum}"))
+        if date:
+            self.rules.append((_is_date, f"'{name}' must be a date in format YYYY-MM-DD"))
+        if boolean:
+            self.rules.append((_is_boolean, f"'{name}' must be true/false or 0/1"))
+
+    def check(self, values):
+        """
+        Checks a column of values.
+
+        :param values: List of the field's values, one per record
+        :return: List of (index, message) pairs of failing values
+        """
+        failed = []
+        if self.required:
+            failed = [(i, f"missing '{self.name}'") for i, v in enumerate(values) if v is None or v == ""]
+        # Indexes of present values still to be checked
+        present = [(i, v) for i, v in enumerate(values) if v is not None and v != ""]
+        for rule, message in self.rules:
+            if not present:
+                break
+            passed = []
+            for item in present:
+                if rule(item[1]):
+                    passed.append(item)
+                else:
+                    failed.append((item[0], message))
+            present = passed
+        return failed
+
+
+class Schema:
+    """
+    Set of field rules for one kind of record (book, author, publisher).
+    """
+    def __init__(self, name, fields):
+        """
+        :param name: Entity name used in messages
+        :param fields: List of Field
+        """
+        self.name = name
+        self.fields = list(fields)
+
+    def validate(self, rows):
+        """
+        Validates a batch of records column by column. Empty values of
+        fields with a default are replaced by it in the records.
+
+        :param rows: List of (offset, record dictionary) pairs
+        :return: BatchResult
+        """
+        errors = [RowError(offset, None, "not a record") for offset, record in rows if not isinstance(record, dict)]
+        records = [record if isinstance(record, dict) else {} for _, record in rows]
+        bad = {error.row for error in errors}
+        for field in self.fields:
+            name = field.name
+            if field.default is not None:
+                for record in records:
+                    value = record.get(name)
+                    if value is None or value == "":
+                        record[name] = field.default
+            for index, message in field.check([record.get(name) for record in records]):
+                offset = rows[index][0]
+                if offset not in bad:
+                    errors.append(RowError(offset, name, message))
+        if not errors:
+            return BatchResult(list(rows), [])
+
+        invalid = {error.row for error in errors}
+        order = {offset: i for i, (offset, _) in enumerate(rows)}
+        errors.sort(key=lambda error: order[error.row])
+        return BatchResult([pair for pair in rows if pair[0] not in invalid], errors)
+
+
+def _is_text(value):
+    return isinstance(value, str)
+
+
+def _is_integer(value):
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, int):
+        return True
+    try:
+        int(value)
+        return True
+    except (TypeError, ValueError):
+        return False
+
+
+def _is_number(value):
+    if isinstance(value, bool):
+        return False
+    try:
+        float(value)
+        return True
+    except (TypeError, ValueError):
+        return False
+
+
+def _is_date(value):
+    if isinstance(value, datetime.date):
+        return True
+    if not isinstance(value, str) or not _DATE_RE.fullmatch(value):
+        return False
+    try:
+        datetime.date.fromisoformat(value)
+        return True
+    except ValueError:
+        return False
+
+
+def _is_boolean(value):
+    try:
+        return value in _BOOLEANS
+    except TypeError:
+        return False
+
+
+BOOK_SCHEMA = Schema("book", [
+    Field("name", required=True, text=True, max_length=50),
+    Field("publisher", required=True, integer=True),
+    Field("publishment_date", date=True),
+    Field("rating", number=True, minimum=0, maximum=5),
+    Field("binding", required=True, choices=ALLOWED_BINDINGS),
+])
+
+AUTHOR_SCHEMA = Schema("author", [
+    Field("surname", required=True, text=True, max_length=50),
+    Field("name", required=True, text=True, max_length=50),
+    Field("email", text=True, max_length=200),
+    # Missing or empty means active, as in AuthorRepository
+    Field("is_active", boolean=True, default=True),
+])
+
+GENRE_SCHEMA = Schema("genre", [
+    Field("name", required=True, text=True, max_length=50),
+])
+
+PUBLISHER_SCHEMA = Schema("publisher", [
+    Field("name", required=True, text=True, max_length=50),
+    Field("address", text=True, max_length=200),
+    Field("phone_number", text=True, max_length=30),
+    Field("email", text=True, max_length=200),
+    Field("website", text=True, max_length=200),
+])
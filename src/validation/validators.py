@@ -1,14 +1,16 @@
 from datetime import datetime
-from tkinter import messagebox
+
+# Values allowed by the check constraint on book.binding
+ALLOWED_BINDINGS = ("hardcover", "paperback", "ebook")
 
 def validate_date(date_str):
     """
     Validates that the input string is a valid date in YYYY-MM-DD format.
     Returns the same string if valid, or None if empty.
-    Shows a messagebox if invalid.
 
     :param date_str: str, the date input to validate
     :return: str or None
+    :raises ValueError: if the date is not valid
     """
     if not date_str:
         return None  # allow empty input
@@ -16,8 +18,7 @@ def validate_date(date_str):
         dt = datetime.strptime(date_str, "%Y-%m-%d")
         return dt.strftime("%Y-%m-%d")  # normalize format
     except ValueError:
-        messagebox.showerror("Invalid Date", "Please enter a valid date in format YYYY-MM-DD.")
-        return None
+        raise ValueError("Please enter a valid date in format YYYY-MM-DD.") from None
 
 def validate_binding(binding):
     """
@@ -31,8 +32,7 @@ def validate_binding(binding):
     :param binding: str, the binding type to validate
     :raises ValueError: if the binding is not in the allowed set
     """
-    allowed = {"hardcover", "paperback", "ebook"}
-    if binding not in allowed:
+    if binding not in ALLOWED_BINDINGS:
         raise ValueError("Invalid binding")
 
 def validate_rating(value):
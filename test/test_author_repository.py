@@ -0,0 +1,63 @@
+"""
+Tests of the author rows AuthorRepository sends to the database.
+
+The repository is bound to a fake unit of work, so no database server is
+needed. Run from the project root:
+
+    python -m unittest discover -s test
+"""
+import unittest
+
+from src.db.repositories.author_repository import AuthorRepository
+
+
+class FakeCursor:
+    def __init__(self, con):
+        self.con = con
+        self.fast_executemany = False
+
+    def executemany(self, sql, rows):
+        self.con.rows.extend(rows)
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self):
+        self.rows = []
+
+    def cursor(self):
+        return FakeCursor(self)
+
+
+class FakeUnitOfWork:
+    def __init__(self):
+        self.connection = FakeConnection()
+
+    def on_commit(self, callback):
+        pass
+
+
+class AuthorBulkInsertTest(unittest.TestCase):
+    def test_is_active(self):
+        uow = FakeUnitOfWork()
+        authors = [
+            {"surname": "Doe", "name": "Jane", "email": "jane@example.com", "is_active": None},
+            {"surname": "Roe", "name": "Rick", "email": "rick@example.com"},
+            {"surname": "Poe", "name": "Edgar", "email": None, "is_active": False},
+            {"surname": "Moe", "name": "Anna", "email": "anna@example.com", "is_active": "0"},
+            {"surname": "Lee", "name": "Lena", "email": "lena@example.com", "is_active": ""},
+        ]
+        self.assertEqual(AuthorRepository(uow).bulk_insert(authors), len(authors))
+        self.assertEqual(uow.connection.rows, [
+            ("Doe", "Jane", "jane@example.com", 1),
+            ("Roe", "Rick", "rick@example.com", 1),
+            ("Poe", "Edgar", None, 0),
+            ("Moe", "Anna", "anna@example.com", 0),
+            ("Lee", "Lena", "lena@example.com", 1),
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+"""
+Tests of the batch validation schemas (src/validation/batch.py).
+
+Run from the project root:
+
+    python -m unittest discover -s test
+"""
+import unittest
+
+from src.validation.batch import AUTHOR_SCHEMA
+
+
+class AuthorSchemaTest(unittest.TestCase):
+    def test_empty_is_active_means_active(self):
+        rows = [
+            (1, {"surname": "Doe", "name": "Jane", "is_active": None}),
+            (2, {"surname": "Roe", "name": "Rick", "is_active": ""}),
+            (3, {"surname": "Poe", "name": "Edgar"}),
+            (4, {"surname": "Moe", "name": "Anna", "is_active": False}),
+        ]
+        result = AUTHOR_SCHEMA.validate(rows)
+        self.assertEqual(result.errors, [])
+        self.assertEqual([record["is_active"] for _, record in result.valid], [True, True, True, False])
+
+    def test_invalid_is_active(self):
+        result = AUTHOR_SCHEMA.validate([(1, {"surname": "Doe", "name": "Jane", "is_active": "maybe"})])
+        self.assertEqual(result.valid, [])
+        self.assertEqual(result.reasons(), [(1, "'is_active' must be true/false or 0/1")])
+
+    def test_email_is_optional(self):
+        # The baseline import accepted authors without (or with odd) emails
+        rows = [(1, {"surname": "Doe", "name": "Jane"}), (2, {"surname": "Roe", "name": "Rick", "email": "n/a"})]
+        self.assertEqual(len(AUTHOR_SCHEMA.validate(rows).valid), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
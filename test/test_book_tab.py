@@ -0,0 +1,67 @@
+"""
+Tests of how BookTab reacts to changed books (delta_action() in src/ui/book_tab.py).
+
+Run from the project root:
+
+    python -m unittest discover -s test
+"""
+import unittest
+
+from src.ui.book_tab import delta_action
+
+# Window of books sorted by name, from ("Dune", 4) to ("Emma", 9)
+FIRST = ("Dune", 4)
+LAST = ("Emma", 9)
+
+
+class DeltaActionTest(unittest.TestCase):
+    def test_shown_row(self):
+        cases = [
+            # old key, new key, expected action
+            (("Dune", 4), ("Dune", 4), "update"),
+            (("Dune", 4), ("Dune II", 4), "refresh"),
+            # A shown row moving out of the window still has to disappear
+            (("Dune", 4), ("Zorba", 4), "refresh"),
+        ]
+        for old_key, new_key, expected in cases:
+            with self.subTest(old_key=old_key, new_key=new_key):
+                self.assertEqual(delta_action(old_key, new_key, FIRST, LAST), expected)
+
+    def test_row_not_shown(self):
+        cases = [
+            # new key, first key, last key, expected action
+            (("Anna", 1), FIRST, LAST, "ignore"),
+            (("Zorba", 2), FIRST, LAST, "ignore"),
+            (("Dune", 3), FIRST, LAST, "ignore"),
+            (("Dune", 5), FIRST, LAST, "refresh"),
+            (("Ema", 1), FIRST, LAST, "refresh"),
+            (("Emma", 10), FIRST, LAST, "ignore"),
+            # Case does not matter, as in the default collation
+            (("anna", 1), FIRST, LAST, "ignore"),
+            (("dyna", 1), FIRST, LAST, "refresh"),
+            # Open sides of the window (first or last page loaded) take every key
+            (("Anna", 1), None, LAST, "refresh"),
+            (("Zorba", 2), FIRST, None, "refresh"),
+            (("Anna", 1), None, None, "refresh"),
+        ]
+        for new_key, first_key, last_key, expected in cases:
+            with self.subTest(new_key=new_key, first_key=first_key, last_key=last_key):
+                self.assertEqual(delta_action(None, new_key, first_key, last_key), expected)
+
+    def test_descending(self):
+        first, last = ("Emma", 9), ("Dune", 4)
+        self.assertEqual(delta_action(None, ("Zorba", 1), first, last, descending=True), "ignore")
+        self.assertEqual(delta_action(None, ("Anna", 1), first, last, descending=True), "ignore")
+        self.assertEqual(delta_action(None, ("Ema", 1), first, last, descending=True), "refresh")
+
+    def test_null_sort_values(self):
+        # Ascending: NULL ratings come first, descending: last
+        self.assertEqual(delta_action(None, (None, 7), (2.5, 1), (4.0, 2)), "ignore")
+        self.assertEqual(delta_action(None, (None, 7), (None, 3), (4.0, 2)), "refresh")
+        self.assertEqual(delta_action(None, (None, 7), (4.0, 2), (2.5, 1), descending=True), "ignore")
+        self.assertEqual(delta_action(None, (None, 7), (4.0, 2), None, descending=True), "refresh")
+        self.assertEqual(delta_action(None, (3.0, 7), (None, 9), (None, 2), descending=True), "ignore")
+
+
+if __name__ == "__main__":
+    unittest.main()
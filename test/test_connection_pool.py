@@ -0,0 +1,176 @@
+"""
+Tests of the database connection pool (ConnectionPool in src/db/connection.py).
+
+Connections come from a fake connect callable, so no database server is
+needed. Run from the project root:
+
+    python -m unittest discover -s test
+"""
+import threading
+import time
+import unittest
+
+import pyodbc
+
+from src.db.connection import ConnectionPool, DatabaseConnectionError
+
+
+class FakeCursor:
+    def __init__(self, con):
+        self.con = con
+
+    def execute(self, sql):
+        if self.con.dead:
+            raise pyodbc.OperationalError("08S01", "Communication link failure")
+
+    def fetchone(self):
+        return (1,)
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self):
+        self.dead = False
+        self.closed = False
+        self.rollbacks = 0
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def rollback(self):
+        if self.dead:
+            raise pyodbc.OperationalError("08S01", "Communication link failure")
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConnect:
+    def __init__(self):
+        self.opened = []
+        self.fail = False
+
+    def __call__(self):
+        if self.fail:
+            raise DatabaseConnectionError("Failed to connect to the database.")
+        con = FakeConnection()
+        self.opened.append(con)
+        return con
+
+
+class ConnectionPoolTest(unittest.TestCase):
+    def pool(self, **kwargs):
+        self.connect = FakeConnect()
+        pool = ConnectionPool(connect=self.connect, **kwargs)
+        self.addCleanup(pool.close)
+        return pool
+
+    def test_reuses_released_connections(self):
+        pool = self.pool(max_size=2)
+        con = pool.acquire()
+        pool.release(con)
+        self.assertIs(pool.acquire(), con)
+        stats = pool.stats()
+        self.assertEqual((stats["misses"], stats["hits"], stats["size"]), (1, 1, 1))
+
+    def test_release_rolls_back(self):
+        pool = self.pool()
+        con = pool.acquire()
+        pool.release(con)
+        self.assertEqual(con.rollbacks, 1)
+
+    def test_exhausted_pool_times_out(self):
+        pool = self.pool(max_size=2, timeout=0.05)
+        pool.acquire()
+        pool.acquire()
+        start = time.monotonic()
+        with self.assertRaises(DatabaseConnectionError):
+            pool.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
+        stats = pool.stats()
+        self.assertEqual((stats["waits"], stats["timeouts"], stats["size"]), (1, 1, 2))
+
+    def test_waiting_checkout_gets_released_connection(self):
+        pool = self.pool(max_size=1, timeout=5)
+        con = pool.acquire()
+        timer = threading.Timer(0.05, pool.release, (con,))
+        timer.start()
+        self.addCleanup(timer.join)
+        self.assertIs(pool.acquire(), con)
+        self.assertEqual(pool.stats()["waits"], 1)
+
+    def test_failed_connect_frees_its_slot(self):
+        pool = self.pool(max_size=1, timeout=0.05)
+        self.connect.fail = True
+        with self.assertRaises(DatabaseConnectionError):
+            pool.acquire()
+        self.connect.fail = False
+        pool.release(pool.acquire())
+        self.assertEqual(pool.stats()["size"], 1)
+
+    def test_broken_connection_is_discarded_on_release(self):
+        pool = self.pool(max_size=1)
+        con = pool.acquire()
+        con.dead = True
+        pool.release(con)
+        self.assertTrue(con.closed)
+        self.assertIsNot(pool.acquire(), con)
+        self.assertEqual(pool.stats()["discarded"], 1)
+
+    def test_connection_block_marks_operational_errors_broken(self):
+        pool = self.pool(max_size=1)
+        with self.assertRaises(pyodbc.OperationalError):
+            with pool.connection() as con:
+                raise pyodbc.OperationalError("08S01", "Communication link failure")
+        self.assertTrue(con.closed)
+        self.assertEqual(pool.stats()["size"], 0)
+
+        # Other errors (e.g. a failed statement) keep the connection, rolled back
+        with self.assertRaises(pyodbc.ProgrammingError):
+            with pool.connection() as con:
+                raise pyodbc.ProgrammingError("42S02", "Invalid object name")
+        self.assertFalse(con.closed)
+        self.assertEqual(con.rollbacks, 1)
+        self.assertEqual(pool.stats()["idle"], 1)
+
+    def test_idle_connection_is_pinged_and_replaced(self):
+        pool = self.pool(ping_interval=0)
+        con = pool.acquire()
+        pool.release(con)
+        con.dead = True
+        with self.assertLogs(level="WARNING"):
+            replacement = pool.acquire()
+        self.assertIsNot(replacement, con)
+        self.assertTrue(con.closed)
+
+    def test_idle_connections_above_min_size_are_evicted(self):
+        pool = self.pool(min_size=1, max_size=3, idle_timeout=0)
+        cons = [pool.acquire() for _ in range(3)]
+        for con in cons:
+            pool.release(con)
+        pool.release(pool.acquire())
+        stats = pool.stats()
+        self.assertEqual((stats["evicted"], stats["size"]), (2, 1))
+        self.assertEqual(sum(con.closed for con in cons), 2)
+
+    def test_closed_pool_refuses_checkouts(self):
+        pool = self.pool()
+        con = pool.acquire()
+        pool.close()
+        with self.assertRaises(DatabaseConnectionError):
+            pool.acquire()
+        # Connections borrowed before close() are closed when they come back
+        pool.release(con)
+        self.assertTrue(con.closed)
+
+    def test_invalid_sizes(self):
+        for kwargs in ({"max_size": 0}, {"min_size": -1}, {"min_size": 3, "max_size": 2}):
+            with self.subTest(**kwargs), self.assertRaises(ValueError):
+                ConnectionPool(connect=FakeConnect(), **kwargs)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+Tests of the streaming import pipeline (run_import() and ImportCheckpoint
+in src/importers/pipeline.py).
+
+Batches are "inserted" into a list, so no database is needed. Run from
+the project root:
+
+    python -m unittest discover -s test
+"""
+import os
+import tempfile
+import unittest
+
+from src.importers.pipeline import ImportCheckpoint, run_import
+from src.validation.batch import Field, Schema
+
+SCHEMA = Schema("item", [Field("name", required=True)])
+
+
+def records(count, invalid=()):
+    """
+    (offset, record) pairs 1..count; offsets in `invalid` miss their name.
+    """
+    return [(i, {"name": "" if i in invalid else f"item {i}"}) for i in range(1, count + 1)]
+
+
+class FailingInserter:
+    """
+    Collects inserted batches and fails on a given batch (1-based).
+    """
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.batches = []
+
+    def __call__(self, batch):
+        if len(self.batches) + 1 == self.fail_on:
+            self.fail_on = None
+            raise RuntimeError("Connection lost")
+        self.batches.append([record["name"] for record in batch])
+
+
+class RunImportTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.checkpoint = ImportCheckpoint.for_source(os.path.join(directory.name, "items.csv"))
+
+    def test_batches_and_skips(self):
+        insert = FailingInserter()
+        result = run_import(records(7, invalid={3}), SCHEMA, insert, batch_size=2)
+        self.assertEqual(insert.batches, [["item 1", "item 2"], ["item 4", "item 5"], ["item 6", "item 7"]])
+        self.assertEqual((result.processed, result.inserted, result.skipped), (7, 6, 1))
+        self.assertEqual(result.skipped_rows, [(3, "missing 'name'")])
+
+    def test_resume_after_failed_batch(self):
+        source = records(10, invalid={4})
+        insert = FailingInserter(fail_on=3)
+        with self.assertRaises(RuntimeError):
+            run_import(source, SCHEMA, insert, batch_size=3, checkpoint=self.checkpoint)
+        # Batches 1-2 (offsets 1-3 and 5-7) were committed before the failure
+        self.assertEqual(self.checkpoint.load(), 7)
+
+        result = run_import(source, SCHEMA, insert, batch_size=3, checkpoint=self.checkpoint)
+        self.assertEqual(result.resumed_from, 7)
+        self.assertEqual((result.processed, result.inserted, result.last_offset), (3, 3, 10))
+        self.assertEqual(insert.batches, [["item 1", "item 2", "item 3"], ["item 5", "item 6", "item 7"],
+                                          ["item 8", "item 9", "item 10"]])
+        # A complete run removes the checkpoint
+        self.assertFalse(os.path.exists(self.checkpoint.path))
+        self.assertEqual(self.checkpoint.load(), 0)
+
+    def test_failure_in_first_batch_starts_over(self):
+        insert = FailingInserter(fail_on=1)
+        with self.assertRaises(RuntimeError):
+            run_import(records(4), SCHEMA, insert, batch_size=2, checkpoint=self.checkpoint)
+        self.assertEqual(self.checkpoint.load(), 0)
+        result = run_import(records(4), SCHEMA, insert, batch_size=2, checkpoint=self.checkpoint)
+        self.assertEqual((result.resumed_from, result.inserted), (0, 4))
+
+    def test_unreadable_checkpoint_is_ignored(self):
+        with open(self.checkpoint.path, "w", encoding="utf-8") as f:
+            f.write("{not json")
+        with self.assertLogs(level="WARNING"):
+            self.assertEqual(self.checkpoint.load(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+Tests of the incremental JSON array parser (src/importers/json_stream.py).
+
+Run from the project root:
+
+    python -m unittest discover -s test
+"""
+import io
+import json
+import unittest
+
+from src.importers.json_stream import READ_SIZE, iter_json_array
+
+DOCUMENTS = [
+    "[1.5]",
+    "[1e5]",
+    "[-12.25e-3, 7, 0.5]",
+    "[1.5, 2.75, 3E+2]",
+    '["text", "with \\"escaped\\" quotes", "\\u00e9"]',
+    '[{"surname": "Doe", "name": "Jane", "rating": 4.25}, {"nested": {"list": [1, 2.5, "x"]}}]',
+    "[true, false, null, 10]",
+    " [ 1 , 2.0 ,\n 3 ] ",
+    "[]",
+]
+
+
+class SplitReader(io.StringIO):
+    """
+    Text file whose first read() stops at a given offset, so the parse
+    buffer ends exactly there.
+    """
+    def __init__(self, text, split):
+        super().__init__(text)
+        self.split = split
+        self.first = True
+
+    def read(self, size=-1):
+        if self.first:
+            self.first = False
+            return super().read(self.split)
+        return super().read(size)
+
+
+class CountingReader(io.StringIO):
+    """
+    Text file counting the characters read from it.
+    """
+    def __init__(self, text):
+        super().__init__(text)
+        self.chars_read = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.chars_read += len(data)
+        return data
+
+
+class IterJsonArrayTest(unittest.TestCase):
+    def test_read_sizes(self):
+        for doc in DOCUMENTS:
+            for read_size in range(1, len(doc) + 2):
+                with self.subTest(doc=doc, read_size=read_size):
+                    self.assertEqual(list(iter_json_array(io.StringIO(doc), read_size)), json.loads(doc))
+
+    def test_split_at_every_offset(self):
+        for doc in DOCUMENTS:
+            for split in range(1, len(doc)):
+                with self.subTest(doc=doc, split=split):
+                    self.assertEqual(list(iter_json_array(SplitReader(doc, split), 4096)), json.loads(doc))
+
+    def test_number_at_default_buffer_boundary(self):
+        for number in ("1.5", "1e5", "123.456e-7"):
+            # Padding puts the buffer end right after the first character of the number
+            doc = "[" + " " * (READ_SIZE - 2) + number + "]"
+            with self.subTest(number=number):
+                self.assertEqual(list(iter_json_array(io.StringIO(doc))), json.loads(doc))
+
+    def test_malformed(self):
+        for doc in ("[1 2]", "[1,", "{}", "[1.5.2]"):
+            with self.subTest(doc=doc), self.assertRaises(ValueError):
+                list(iter_json_array(io.StringIO(doc), 2))
+
+    def test_malformed_fails_without_reading_ahead(self):
+        # The error right after the first element is reported from the first buffer
+        for doc in ("[1 2, ", '["a" "b", ', "[1.5x, ", "[true false, ", '[{"a": 1} {"b": 2}, '):
+            reader = CountingReader(doc + "3, " * 100000 + "4]")
+            with self.subTest(doc=doc), self.assertRaises(ValueError):
+                list(iter_json_array(reader, 64))
+            self.assertLessEqual(reader.chars_read, 64)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+Tests of the keyset pagination condition (_keyset_clause() in
+src/db/repositories/book_repository.py).
+
+The generated SQL condition is evaluated in Python with SQL NULL
+semantics against a table sorted the way SQL Server sorts it, for every
+key of the table. Run from the project root:
+
+    python -m unittest discover -s test
+"""
+import itertools
+import re
+import unittest
+
+from src.db.repositories.book_repository import _keyset_clause
+
+# (rating, id) rows with NULLs and ties
+ROWS = [(None, 3), (None, 8), (1.5, 2), (2.0, 1), (2.0, 5), (2.0, 9), (4.5, 4), (None, 12), (3.0, 7)]
+
+
+class SqlValue:
+    """
+    Value compared like in SQL: any comparison with NULL is not true.
+    """
+    def __init__(self, value):
+        self.value = value
+        self.null = value is None
+        self.notnull = value is not None
+
+    def _compare(self, other, op):
+        if self.value is None or other.value is None:
+            return False
+        return op(self.value, other.value)
+
+    def __eq__(self, other):
+        return self._compare(other, lambda a, b: a == b)
+
+    def __lt__(self, other):
+        return self._compare(other, lambda a, b: a < b)
+
+    def __le__(self, other):
+        return self._compare(other, lambda a, b: a <= b)
+
+    def __gt__(self, other):
+        return self._compare(other, lambda a, b: a > b)
+
+    def __ge__(self, other):
+        return self._compare(other, lambda a, b: a >= b)
+
+
+def matches(condition, params, column, row):
+    """
+    Evaluates a generated SQL condition for one (value, id) row.
+    """
+    expr = condition.replace(" is not null", ".notnull").replace(" is null", ".null").replace(" = ", " == ")
+    names = iter(range(len(params)))
+    expr = re.sub(r"\?", lambda _: f"p{next(names)}", expr)
+    env = {column: SqlValue(row[0]), "id": SqlValue(row[1])}
+    env.update({f"p{i}": SqlValue(p) for i, p in enumerate(params)})
+    return bool(eval(expr, {}, env))
+
+
+def sql_order(rows, descending):
+    """
+    Rows in SQL Server order of (column, id): NULL first ascending, last descending.
+    """
+    return sorted(rows, key=lambda row: (row[0] is not None, row[0] or 0, row[1]), reverse=descending)
+
+
+class KeysetClauseTest(unittest.TestCase):
+    def test_rows_following_every_key(self):
+        for descending, inclusive in itertools.product((False, True), repeat=2):
+            ordered = sql_order(ROWS, descending)
+            for position, key in enumerate(ordered):
+                with self.subTest(descending=descending, inclusive=inclusive, key=key):
+                    condition, params = _keyset_clause("rating", key, descending, inclusive)
+                    selected = [row for row in ordered if matches(condition, params, "rating", row)]
+                    self.assertEqual(selected, ordered[position if inclusive else position + 1:])
+
+    def test_id_column(self):
+        cases = [
+            # descending, inclusive, expected condition
+            (False, False, "id > ?"),
+            (False, True, "id >= ?"),
+            (True, False, "id < ?"),
+            (True, True, "id <= ?"),
+        ]
+        for descending, inclusive, expected in cases:
+            with self.subTest(descending=descending, inclusive=inclusive):
+                self.assertEqual(_keyset_clause("id", (5, 5), descending, inclusive), (expected, [5]))
+
+    def test_generated_sql(self):
+        cases = [
+            # key, descending, inclusive, expected condition and parameters
+            (("Dune", 4), False, False, ("(name > ? or (name = ? and id > ?))", ["Dune", "Dune", 4])),
+            (("Dune", 4), True, True, ("(name < ? or (name = ? and id <= ?) or name is null)", ["Dune", "Dune", 4])),
+            ((None, 4), False, False, ("((name is null and id > ?) or name is not null)", [4])),
+            ((None, 4), True, False, ("(name is null and id < ?)", [4])),
+        ]
+        for key, descending, inclusive, expected in cases:
+            with self.subTest(key=key, descending=descending, inclusive=inclusive):
+                self.assertEqual(_keyset_clause("name", key, descending, inclusive), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+"""
+Tests of the reference data cache (QueryCache, @cached and @invalidates
+in src/db/cache.py).
+
+Run from the project root:
+
+    python -m unittest discover -s test
+"""
+import unittest
+
+from src.db.cache import QueryCache, cached, invalidates, reference_cache
+from src.db.connection import ConnectionPool
+from src.db.unit_of_work import UnitOfWork
+
+
+class FakeConnection:
+    def __init__(self):
+        self.commits = 0
+        self.rollbacks = 0
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        pass
+
+
+class CountingRepository:
+    """
+    Repository stand-in counting how often its read reaches the "database".
+    """
+    def __init__(self, uow=None):
+        self.uow = uow
+        self.reads = 0
+
+    @cached("test_namespace")
+    def get_all(self):
+        self.reads += 1
+        return ["row"]
+
+    @invalidates("test_namespace")
+    def insert(self):
+        pass
+
+
+class QueryCacheTest(unittest.TestCase):
+    def test_get_and_set(self):
+        cache = QueryCache()
+        self.assertEqual(cache.get("k"), (False, None))
+        cache.set("k", 1, "ns", cache.generation("ns"))
+        self.assertEqual(cache.get("k"), (True, 1))
+        self.assertEqual(cache.stats(), {"hits": 1, "misses": 1, "invalidations": 0, "entries": 1})
+
+    def test_ttl_expiry(self):
+        cache = QueryCache(ttl=0)
+        cache.set("k", 1, "ns", cache.generation("ns"))
+        self.assertEqual(cache.get("k"), (False, None))
+        self.assertEqual(cache.stats()["entries"], 0)
+
+    def test_lru_eviction(self):
+        cache = QueryCache(max_entries=2)
+        cache.set("a", 1, "ns", 0)
+        cache.set("b", 2, "ns", 0)
+        cache.get("a")
+        cache.set("c", 3, "ns", 0)
+        # "b" was the least recently used entry
+        self.assertEqual([cache.get(k)[0] for k in ("a", "b", "c")], [True, False, True])
+
+    def test_invalidate_drops_only_its_namespace(self):
+        cache = QueryCache()
+        cache.set("a", 1, "authors", 0)
+        cache.set("p", 2, "publishers", 0)
+        cache.invalidate("authors")
+        self.assertEqual(cache.get("a"), (False, None))
+        self.assertEqual(cache.get("p"), (True, 2))
+
+    def test_stale_read_is_not_stored(self):
+        cache = QueryCache()
+        generation = cache.generation("ns")
+        # A write invalidates while the read is still running
+        cache.invalidate("ns")
+        cache.set("k", "stale", "ns", generation)
+        self.assertEqual(cache.get("k"), (False, None))
+
+
+class CachedDecoratorTest(unittest.TestCase):
+    def setUp(self):
+        reference_cache.clear()
+        self.addCleanup(reference_cache.clear)
+
+    def test_read_through(self):
+        repo = CountingRepository()
+        self.assertEqual(repo.get_all(), ["row"])
+        self.assertEqual(repo.get_all(), ["row"])
+        self.assertEqual(repo.reads, 1)
+
+    def test_write_invalidates(self):
+        repo = CountingRepository()
+        repo.get_all()
+        repo.insert()
+        repo.get_all()
+        self.assertEqual(repo.reads, 2)
+
+    def test_unit_of_work_defers_invalidation_to_commit(self):
+        repo = CountingRepository()
+        repo.get_all()
+        pool = ConnectionPool(connect=FakeConnection)
+        self.addCleanup(pool.close)
+
+        with UnitOfWork(pool) as uow:
+            bound = CountingRepository(uow)
+            bound.insert()
+            # Not committed yet: other readers keep the cached result
+            repo.get_all()
+            self.assertEqual(repo.reads, 1)
+            # The unit of work itself bypasses the cache
+            bound.get_all()
+            bound.get_all()
+            self.assertEqual(bound.reads, 2)
+        repo.get_all()
+        self.assertEqual(repo.reads, 2)
+
+    def test_rolled_back_unit_of_work_does_not_invalidate(self):
+        repo = CountingRepository()
+        repo.get_all()
+        pool = ConnectionPool(connect=FakeConnection)
+        self.addCleanup(pool.close)
+
+        with self.assertRaises(RuntimeError):
+            with UnitOfWork(pool) as uow:
+                CountingRepository(uow).insert()
+                raise RuntimeError("edit failed")
+        repo.get_all()
+        self.assertEqual(repo.reads, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
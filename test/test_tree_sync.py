@@ -0,0 +1,115 @@
+"""
+Tests of the Treeview diffing helper (TreeSync in src/ui/tree_sync.py).
+
+A fake Treeview records the item operations, so no display is needed.
+Run from the project root:
+
+    python -m unittest discover -s test
+"""
+import unittest
+
+from src.ui.tree_sync import TreeSync
+
+
+class FakeTree:
+    """
+    Minimal ttk.Treeview stand-in for top-level items.
+    """
+    def __init__(self):
+        self.children = []
+        self.values = {}
+        self.operations = []
+
+    def insert(self, parent, index, iid, values):
+        position = len(self.children) if index == "end" else index
+        self.children.insert(position, iid)
+        self.values[iid] = values
+        self.operations.append(("insert", iid))
+
+    def item(self, iid, values):
+        self.values[iid] = values
+        self.operations.append(("item", iid))
+
+    def delete(self, *iids):
+        for iid in iids:
+            self.children.remove(iid)
+            del self.values[iid]
+            self.operations.append(("delete", iid))
+
+    def move(self, iid, parent, index):
+        self.children.remove(iid)
+        self.children.insert(index, iid)
+        self.operations.append(("move", iid))
+
+    def get_children(self):
+        return tuple(self.children)
+
+
+def make_sync(rows=()):
+    tree = FakeTree()
+    sync = TreeSync(tree, key=lambda row: str(row[0]), display=lambda row: row[1:])
+    sync.insert(rows)
+    tree.operations = []
+    return tree, sync
+
+
+class TreeSyncTest(unittest.TestCase):
+    def test_insert_at_end_and_index(self):
+        tree, sync = make_sync([(1, "a"), (2, "b")])
+        sync.insert([(3, "c")])
+        sync.insert([(4, "d"), (5, "e")], index=0)
+        self.assertEqual(tree.children, ["4", "5", "1", "2", "3"])
+        self.assertEqual(sync.shown["4"], ("d",))
+
+    def test_sync_unchanged_rows_touch_nothing(self):
+        tree, sync = make_sync([(1, "a"), (2, "b")])
+        self.assertEqual(sync.sync([(1, "a"), (2, "b")]), (0, 0, 0))
+        self.assertEqual(tree.operations, [])
+
+    def test_sync_cases(self):
+        cases = [
+            # shown rows, new rows, expected (inserted, updated, deleted)
+            ([(1, "a"), (2, "b")], [(1, "a"), (3, "c"), (2, "b")], (1, 0, 0)),
+            ([(1, "a"), (2, "b"), (3, "c")], [(1, "a"), (3, "c")], (0, 0, 1)),
+            ([(1, "a"), (2, "b")], [(1, "a"), (2, "B")], (0, 1, 0)),
+            # Moves: a renamed row changes its place
+            ([(1, "a"), (2, "b"), (3, "c")], [(2, "b"), (3, "c"), (1, "z")], (0, 1, 0)),
+            ([(1, "a"), (2, "b"), (3, "c")], [(3, "c"), (2, "b"), (1, "a")], (0, 0, 0)),
+            # Everything at once
+            ([(1, "a"), (2, "b"), (3, "c"), (4, "d")], [(4, "d"), (5, "e"), (2, "B"), (6, "f")], (2, 1, 2)),
+            ([(1, "a")], [], (0, 0, 1)),
+            ([], [(1, "a"), (2, "b")], (2, 0, 0)),
+        ]
+        for shown, rows, expected in cases:
+            with self.subTest(shown=shown, rows=rows):
+                tree, sync = make_sync(shown)
+                self.assertEqual(sync.sync(rows), expected)
+                self.assertEqual(tree.children, [str(row[0]) for row in rows])
+                self.assertEqual(tree.values, {str(row[0]): row[1:] for row in rows})
+                self.assertEqual(sync.shown, tree.values)
+
+    def test_sync_deletes_before_inserting_and_moves_only_displaced_rows(self):
+        tree, sync = make_sync([(1, "a"), (2, "b"), (3, "c")])
+        sync.sync([(4, "d"), (2, "b"), (3, "c")])
+        self.assertEqual(tree.operations, [("delete", "1"), ("insert", "4")])
+
+        tree, sync = make_sync([(1, "a"), (2, "b"), (3, "c"), (4, "d")])
+        sync.sync([(1, "a"), (3, "c"), (4, "d"), (2, "b")])
+        self.assertNotIn(("move", "1"), tree.operations)
+        self.assertEqual(tree.children, ["1", "3", "4", "2"])
+
+    def test_update_ignores_rows_not_shown(self):
+        tree, sync = make_sync([(1, "a")])
+        self.assertEqual(sync.update([(1, "b"), (2, "c"), (1, "b")]), 1)
+        self.assertEqual(tree.operations, [("item", "1")])
+
+    def test_delete_ignores_unknown_ids(self):
+        tree, sync = make_sync([(1, "a"), (2, "b")])
+        sync.delete_ids(["2", "7"])
+        sync.delete([(1, "a")])
+        self.assertEqual(tree.children, [])
+        self.assertEqual(sync.shown, {})
+
+
+if __name__ == "__main__":
+    unittest.main()